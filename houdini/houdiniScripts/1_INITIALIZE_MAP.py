@@ -1,14 +1,26 @@
 import hou
+import sys
 
 node = hou.pwd()
 geo = node.geometry()
 
-# Temel attribute'ları ekle (varsa hata vermez)
-geo.addAttrib(hou.attribType.Point, "tile_type", "wall")
+# grid_engine modülünü $HIP/scripts altından yükle
+scripts_dir = hou.expandString("$HIP/scripts")
+if scripts_dir not in sys.path:
+    sys.path.append(scripts_dir)
+import grid_engine
+import grid_bridge
+import stage_profiler
 
+# Controller seed'i (profil kayıtları stage + seed başına)
+controller = hou.node("../CONTROLLER")
+seed = grid_bridge.read_controller_params(controller)["seed"]
 
-# Bütün noktaları 'wall' olarak ayarla
-# Not: addAttrib zaten varsayılan değer atadığı için bu döngüye gerek kalmayabilir.
-# Ama açıkça göstermek için burada bırakıyorum.
-for point in geo.points():
-    point.setAttribValue("tile_type", "wall")
\ No newline at end of file
+with stage_profiler.stage("1_INITIALIZE_MAP", seed=seed, geo=geo):
+    # Temel attribute'ları ekle (varsa hata vermez)
+    geo.addAttrib(hou.attribType.Point, "tile_type", "wall")
+
+    # Bütün noktaları 'wall' olarak ayarla (tek bulk yazma)
+    grid = grid_bridge.grid_from_geometry(geo)
+    grid_engine.initialize_map(grid)
+    grid_bridge.write_tiles(grid, geo)
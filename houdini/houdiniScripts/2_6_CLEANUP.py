@@ -1,28 +1,25 @@
-# 2_6_CLEANUP.py (Sadece Temizlik Yapan Versiyon)
+# 2_6_CLEANUP.py (Pass-through)
 import hou
+import sys
 
 main_node = hou.pwd()
+geo = main_node.geometry()
 
-# --- 1. TEMİZLENECEK NOD'U BUL ---
-# Bir önceki script'in yarattığı 'workspace' nod'unu ismiyle buluyoruz.
-parent_network = main_node.parent()
-workspace_to_delete = parent_network.node("temp_pathfinding_workspace")
-
-# --- 2. GÜVENLİK KONTROLÜ VE SİLME ---
-# Eğer nod bulunursa, onu yok et.
-
-
+# grid_bridge / stage_profiler modüllerini $HIP/scripts altından yükle
+scripts_dir = hou.expandString("$HIP/scripts")
+if scripts_dir not in sys.path:
+    sys.path.append(scripts_dir)
+import grid_bridge
+import stage_profiler
 
-# --- 3. GEOMETRİYE DOKUNMA ---
-# Bu script'in geometriyi değiştirmemesi önemli.
-def delete_nodes_later():
-    ws = hou.node("/obj/geo1/workspace_temp")
-    if ws:
-        ws.destroy()
+# 3_5_GUARANTEE_PATH artık geçici 'temp_pathfinding_workspace' nod'u yaratmıyor,
+# bu yüzden silinecek nod ve gecikmeli silme callback'i de yok.
 
-hou.ui.addEventLoopCallback(delete_nodes_later)
+# Controller seed'i (profil kayıtları stage + seed başına)
+controller = hou.node("../CONTROLLER")
+seed = grid_bridge.read_controller_params(controller)["seed"]
 
 # Sadece girişindeki geometriyi kopyalayıp çıkışına verir.
-geo = main_node.geometry()
-geo.clear()
-geo.merge(main_node.inputs()[0].geometry())
\ No newline at end of file
+with stage_profiler.stage("2_6_CLEANUP", seed=seed, geo=geo):
+    geo.clear()
+    geo.merge(main_node.inputs()[0].geometry())
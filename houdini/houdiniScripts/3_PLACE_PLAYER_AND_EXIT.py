@@ -1,72 +1,25 @@
 import hou
-import random
-from collections import deque, defaultdict
+import sys
 
 node = hou.pwd()
 geo = node.geometry()
 
+# grid_engine modülünü $HIP/scripts altından yükle
+scripts_dir = hou.expandString("$HIP/scripts")
+if scripts_dir not in sys.path:
+    sys.path.append(scripts_dir)
+import grid_engine
+import grid_bridge
+import stage_profiler
+
 # --- Controller parametreleri ---
 controller = hou.node("../CONTROLLER")
-seed = controller.parm("seed").eval()
-min_dist_param = controller.parm("min_player_exit_dist").eval()
-random.seed(seed + 1)
-
-# --- Empty tile noktalarını ve mapping ---
-traversable_pts = [pt for pt in geo.points() if pt.stringAttribValue("tile_type") in ("empty","player","stairs")]
-pt_num_to_idx = {pt.number(): idx for idx, pt in enumerate(traversable_pts)}
-idx_to_pt = {idx: pt for idx, pt in enumerate(traversable_pts)}
-num_pts = len(traversable_pts)
-
-# --- Neighbor map (wall’ları atla) ---
-neighbors_map = []
-for pt in traversable_pts:
-    neighbors_idx = []
-    for nidx in pt.intListAttribValue("neighbours"):
-        if nidx in pt_num_to_idx:
-            neighbors_idx.append(pt_num_to_idx[nidx])
-    neighbors_map.append(neighbors_idx)
-
-# --- Distance map oluştur (BFS) ---
-dist_map = [[float('inf')]*num_pts for _ in range(num_pts)]
-
-for i in range(num_pts):
-    queue = deque([i])
-    dist_map[i][i] = 0
-    while queue:
-        current = queue.popleft()
-        for n in neighbors_map[current]:
-            if dist_map[i][n] == float('inf'):
-                dist_map[i][n] = dist_map[i][current] + 1
-                queue.append(n)
-
-# --- Maksimum mesafeyi bul ---
-max_dist = 0
-best_pair = (0,0)
-for i in range(num_pts):
-    for j in range(i+1, num_pts):
-        if dist_map[i][j] > max_dist and dist_map[i][j] < float('inf'):
-            max_dist = dist_map[i][j]
-            best_pair = (i,j)
-
-# --- min_player_exit_dist parametresine göre uygun pair seç ---
-target_dist = min(min_dist_param, max_dist)
-candidates = []
-
-for i in range(num_pts):
-    for j in range(i+1, num_pts):
-        if abs(dist_map[i][j] - target_dist) <= 1:  # tolerans 1 birim
-            candidates.append( (i,j) )
-
-if candidates:
-    player_idx, exit_idx = random.choice(candidates)
-else:
-    player_idx, exit_idx = best_pair
-
-player_pt = idx_to_pt[player_idx]
-exit_pt = idx_to_pt[exit_idx]
+params = grid_bridge.read_controller_params(controller)
 
-# --- tile_type güncelle ---
-player_pt.setAttribValue("tile_type","player")
-exit_pt.setAttribValue("tile_type","stairs")
+with stage_profiler.stage("3_PLACE_PLAYER_AND_EXIT", seed=params['seed'], geo=geo):
+    # --- Player / Exit yerleştir (seed + 1) ---
+    grid = grid_bridge.grid_from_geometry(geo)
+    player_cell, exit_cell, distance = grid_engine.place_player_and_exit(grid, params)
+    grid_bridge.write_tiles(grid, geo)
 
-print(f"Player ve Exit noktaları yerleştirildi: mesafe={dist_map[player_idx][exit_idx]}")
+    print(f"Player ve Exit noktaları yerleştirildi: mesafe={distance}")
@@ -1,52 +1,42 @@
-# 4_VISUALIZE_MAP.py (KeyError Düzeltmesi)
+# 4_VISUALIZE_MAP.py (Bulk attribute yazma)
 import hou
+import sys
+
+import numpy as np
 
 node = hou.pwd()
 geo = node.geometry()
 
-# --- Gerekli Attribute'ları PRIMITIVE seviyesinde oluştur ---
-if not geo.findPrimAttrib("Cd"):
-    geo.addAttrib(hou.attribType.Prim, "Cd", (0.0, 0.0, 0.0))
-if not geo.findPrimAttrib("tile_char"):
-    geo.addAttrib(hou.attribType.Prim, "tile_char", "")
-
-# --- TILE SÖZLÜĞÜ ---
-tile_properties = {
-    "wall":         {"color": (0.2, 0.2, 0.2), "char": "#"},
-    "player":       {"color": (0.0, 0.8, 1.0), "char": "P"},
-    "enemy":        {"color": (1.0, 0.2, 0.2), "char": "E"},
-    "enemy_shooter":{"color": (1.0, 0.5, 0.0), "char": "F"},
-    "stairs":       {"color": (0.8, 0.5, 1.0), "char": "S"},
-    "coin":         {"color": (1.0, 0.8, 0.0), "char": "C"},
-    "health":       {"color": (0.0, 1.0, 0.0), "char": "H"},
-    "breakable":    {"color": (0.5, 0.3, 0.1), "char": "B"},
-    "1":            {"color": (0.4, 0.4, 0.0), "char": "1"},
-    "empty":        {"color": (0.1, 0.1, 0.1), "char": "."}, 
-}
-default_tile = "empty"
-path_highlight_color = (0.4, 0.4, 0.0)
-
-# --- 'path' grubunu bir kez bulup değişkene ata ---
-path_group = geo.findPointGroup("path")
-
-# --- Primitive'lere Renk ve Karakter Ata ---
-for prim in geo.prims():
-    if prim.numVertices() > 0:
-        owner_point = prim.points()[0]
-        
-        tile_type = owner_point.stringAttribValue("tile_type")
-        properties = tile_properties.get(tile_type, tile_properties[default_tile])
-        
-        prim.setAttribValue("Cd", properties["color"])
-        prim.setAttribValue("tile_char", properties["char"])
-
-        is_on_path = False
-        if path_group and path_group.contains(owner_point):
-            is_on_path = True
-        
-        if is_on_path:
-            prim.setAttribValue("Cd", path_highlight_color)
-            prim.setAttribValue("tile_char", "1")
-
-# (İsteğe bağlı) Temizlik
-# ...
\ No newline at end of file
+scripts_dir = hou.expandString("$HIP/scripts")
+if scripts_dir not in sys.path:
+    sys.path.append(scripts_dir)
+import grid_bridge
+import stage_profiler
+
+# Controller seed'i (profil kayıtları stage + seed başına)
+controller = hou.node("../CONTROLLER")
+seed = grid_bridge.read_controller_params(controller)["seed"]
+
+with stage_profiler.stage("4_VISUALIZE_MAP", seed=seed, geo=geo):
+    # --- Gerekli Attribute'ları PRIMITIVE seviyesinde oluştur ---
+    if not geo.findPrimAttrib("Cd"):
+        geo.addAttrib(hou.attribType.Prim, "Cd", (0.0, 0.0, 0.0))
+    if not geo.findPrimAttrib("tile_char"):
+        geo.addAttrib(hou.attribType.Prim, "tile_char", "")
+
+    # --- TILE SÖZLÜĞÜ ---
+    # grid_engine.TILE_CHARS / TILE_COLORS (bilinmeyen tile -> empty, 'path' grubu -> "1")
+    # Point başına char / renk tek LUT lookup'ı ile
+    point_chars, point_colors = grid_bridge.point_visuals(geo)
+
+    # --- Primitive'lere Renk ve Karakter Ata ---
+    # Her prim ilk vertex'inin point'inden (owner point) değer alır; vertex'siz prim'ler varsayılan kalır
+    owners = grid_bridge.prim_owner_points(geo)
+    has_owner = owners >= 0
+    prim_chars = np.full(owners.shape[0], "", dtype="<U1")
+    prim_colors = np.zeros((owners.shape[0], 3), dtype=np.float32)
+    prim_chars[has_owner] = point_chars[owners[has_owner]]
+    prim_colors[has_owner] = point_colors[owners[has_owner]]
+
+    geo.setPrimFloatAttribValues("Cd", prim_colors.reshape(-1).tolist())
+    geo.setPrimStringAttribValues("tile_char", prim_chars.tolist())
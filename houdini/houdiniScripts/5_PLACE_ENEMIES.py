@@ -1,48 +1,30 @@
 # 5_PLACE_ENEMIES.py
 import hou
-import random
+import sys
 
 node = hou.pwd()
 geo = node.geometry()
 
-# --- 1. KONTROL PANELİNİ BUL VE PARAMETRELERİ OKU ---
-try:
-    controller = hou.node("../CONTROLLER")
-    seed = controller.parm("seed").evalAsInt()
-    enemy_density = controller.parm("enemy_density").evalAsFloat()
-    
-    # Farklı bir rastgelelik için seed'i yine biraz değiştir.
-    random.seed(seed + 2) 
+# grid_engine modülünü $HIP/scripts altından yükle
+scripts_dir = hou.expandString("$HIP/scripts")
+if scripts_dir not in sys.path:
+    sys.path.append(scripts_dir)
+import grid_engine
+import grid_bridge
+import stage_profiler
 
-except AttributeError:
+# --- 1. KONTROL PANELİNİ BUL VE PARAMETRELERİ OKU ---
+controller = hou.node("../CONTROLLER")
+if not controller:
     print("UYARI: CONTROLLER veya gerekli parametreler bulunamadı. Düşman yerleştirilmeyecek.")
-    enemy_density = 0.0 # Varsayılan olarak hiç düşman koyma
-
-# --- 2. DÜŞMAN YERLEŞTİRME MANTIĞI ---
-
-# Önce, düşman yerleştirmek için uygun boş noktaları bul.
-# Oyuncunun hemen dibinde başlamamaları için, 'player' ve 'stairs' olmayanları alalım.
-suitable_empty_points = []
-for pt in geo.points():
-    if pt.stringAttribValue("tile_type") == "empty":
-        suitable_empty_points.append(pt)
-
-# Eğer yerleştirilecek uygun yer varsa ve yoğunluk sıfırdan büyükse devam et.
-if suitable_empty_points and enemy_density > 0:
-    
-    # Yoğunluğa göre yerleştirilecek düşman SAYISINI hesapla.
-    # Örneğin, tüm boş alanların en fazla %15'i düşmanla dolsun.
-    max_possible_enemies = int(len(suitable_empty_points) * 0.15) 
-    num_to_place = int(max_possible_enemies * enemy_density)
+params = grid_bridge.read_controller_params(controller)
 
-    # Hesaplanan sayıda düşmanı rastgele seç ve yerleştir.
-    if num_to_place > 0 and len(suitable_empty_points) >= num_to_place:
-        points_to_populate = random.sample(suitable_empty_points, num_to_place)
-        
-        for pt in points_to_populate:
-            # Şimdilik basit bir mantıkla, %20 ihtimalle atıcı, %80 ihtimalle normal düşman koyalım.
-            # Bu mantığı daha sonra "uzun koridor bulma" gibi daha akıllı bir hale getirebiliriz.
-            if random.random() < 0.2:
-                pt.setAttribValue("tile_type", "enemy_shooter") # F
-            else:
-                pt.setAttribValue("tile_type", "enemy") # E
\ No newline at end of file
+with stage_profiler.stage("5_PLACE_ENEMIES", seed=params['seed'], geo=geo):
+    # --- 2. DÜŞMAN YERLEŞTİRME (seed + 2) ---
+    # Boş noktaların en fazla %15'i, %20 atıcı (F) / %80 normal düşman (E)
+    # tile_type sütunu tek seferde okunur, boş hücreler tek geçişte ayrılır
+    grid = grid_bridge.grid_from_geometry(geo)
+    categories = grid_engine.categorize(grid)
+    placed = grid_engine.place_enemies(grid, params, categories)
+    if placed:
+        grid_bridge.write_tiles(grid, geo)
@@ -1,32 +1,28 @@
-import runpy
-runpy.run_path(script_path, init_globals={"hou": hou, "node": node})
 import hou
+import sys
+
+# grid_engine modülünü $HIP/scripts altından yükle
+scripts_dir = hou.expandString("$HIP/scripts")
+if scripts_dir not in sys.path:
+    sys.path.append(scripts_dir)
+import grid_engine
+import grid_bridge
+
 
 def find_rooms(geo):
+    """
+    Boş (empty) noktaları prim komşuluğuna göre odalara ayır ve 'class' attribute'una yaz.
+    Etiketleme tile array üzerinde, doğrusal zamanda (grid_engine.label_rooms).
+    Dönüş: her oda için {"class", "area", "bbox", "centroid"} sözlükleri.
+    """
     print("find_rooms fonksiyonu çağrıldı.")
-    visited = set()
-    class_id = 0
     if not geo.findPointAttrib("class"):
         geo.addAttrib(hou.attribType.Point, "class", -1)
-    for pt in geo.points():
-        if pt.stringAttribValue("tile_type") == "empty" and pt.number() not in visited:
-            room_points = []
-            queue = [pt]
-            visited.add(pt.number())
-            while queue:
-                current_pt = queue.pop(0)
-                room_points.append(current_pt)
-                for prim in current_pt.prims():
-                    for neighbor in prim.points():
-                        if neighbor.number() not in visited and neighbor.stringAttribValue("tile_type") == "empty":
-                            visited.add(neighbor.number())
-                            queue.append(neighbor)
-            for room_pt in room_points:
-                room_pt.setAttribValue("class", class_id)
-            class_id += 1
-    return class_id
 
-import hou
+    grid = grid_bridge.grid_from_geometry(geo)
+    room_stats = grid_engine.label_rooms(grid)
+    grid_bridge.write_rooms(grid, geo)
+    return room_stats
 
 def find_path_between_rooms(geo, start_room, end_room):
     # --- Artık workspace yaratmıyoruz ---
@@ -0,0 +1,155 @@
+"""
+Batch Level Generator
+Houdini'siz, process pool ile toplu level üretimi (grid_engine)
+
+Seed aralığı sabit boyutlu shard'lara bölünür (shard k = base_seed + k * shard_size ...).
+Her shard bir worker'da üretilip kendi dosyasına yazılır, en sonda manifest birleştirilir.
+Shard sınırları worker sayısına bağlı olmadığı için çıktı da worker sayısından bağımsızdır.
+
+Kullanım:
+    python batch_generate.py --base-seed 283 --count 10000 --workers 8 --out levels_out
+    python batch_generate.py --count 500 --params params.json --shard-size 128
+    python batch_generate.py --count 200 --backend scripts --out levels_out   # houdiniScripts, headless_hou ile
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import grid_engine
+
+
+MANIFEST_NAME = "manifest.json"
+BACKENDS = ("engine", "scripts")
+SHARD_PATTERN = "shard_{:05d}.npz"
+
+
+def shard_specs(base_seed, count, shard_size):
+    """(shard_id, first_seed, level_count) listesi"""
+    specs = []
+    for shard_id, offset in enumerate(range(0, count, shard_size)):
+        specs.append((shard_id, base_seed + offset, min(shard_size, count - offset)))
+    return specs
+
+
+def level_generator(backend):
+    """engine -> grid_engine.generate_level, scripts -> stage script'leri headless_hou üzerinde"""
+    if backend == "scripts":
+        import headless_hou
+        return headless_hou.generate_level
+    return grid_engine.generate_level
+
+
+def generate_shard(out_dir, shard_id, first_seed, level_count, params, backend="engine"):
+    """
+    Bir shard'ı üret ve .npz olarak yaz (atomik).
+    grids: (n, height, width) uint8 ASCII karakter kodları (GRID_ASCII ile aynı)
+    """
+    generate_level = level_generator(backend)
+    seeds = []
+    grids = []
+    failed = []
+    for seed in range(first_seed, first_seed + level_count):
+        level_params = dict(params, seed=seed)
+        try:
+            grid = generate_level(level_params)
+        except Exception as e:
+            failed.append({"seed": seed, "error": str(e)})
+            continue
+        chars = grid_engine.export_chars(grid)
+        grids.append(np.char.encode(chars, "ascii").view(np.uint8).reshape(chars.shape))
+        seeds.append(seed)
+
+    height, width = int(params["sizeY"]), int(params["sizeX"])
+    grid_stack = np.stack(grids) if grids else np.zeros((0, height, width), dtype=np.uint8)
+
+    filename = SHARD_PATTERN.format(shard_id)
+    tmp_path = os.path.join(out_dir, filename + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez_compressed(f, seeds=np.array(seeds, dtype=np.int64), grids=grid_stack)
+    os.replace(tmp_path, os.path.join(out_dir, filename))
+
+    return {
+        "shard_id": shard_id,
+        "file": filename,
+        "first_seed": first_seed,
+        "count": level_count,
+        "generated": len(seeds),
+        "failed": failed,
+    }
+
+
+def _generate_shard_task(task):
+    return generate_shard(*task)
+
+
+def write_manifest(out_dir, base_seed, count, shard_size, params, shard_results, backend="engine"):
+    """Shard sonuçlarını shard_id sırasıyla tek manifest'te birleştir"""
+    shard_results = sorted(shard_results, key=lambda r: r["shard_id"])
+    manifest = {
+        "generator": "grid_engine" if backend == "engine" else "houdiniScripts (headless_hou)",
+        "base_seed": base_seed,
+        "count": count,
+        "shard_size": shard_size,
+        "params": params,
+        "generated": sum(r["generated"] for r in shard_results),
+        "failed": sum(len(r["failed"]) for r in shard_results),
+        "shards": shard_results,
+    }
+    tmp_path = os.path.join(out_dir, MANIFEST_NAME + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, os.path.join(out_dir, MANIFEST_NAME))
+    return manifest
+
+
+def batch_generate(out_dir, base_seed, count, params=None, workers=None, shard_size=256, backend="engine"):
+    """Seed aralığını shard'lara böl, process pool ile üret, manifest yaz"""
+    params = grid_engine.resolve_params(params)
+    params.pop("seed", None)
+    os.makedirs(out_dir, exist_ok=True)
+
+    specs = shard_specs(base_seed, count, shard_size)
+    tasks = [(out_dir, shard_id, first_seed, level_count, params, backend) for shard_id, first_seed, level_count in specs]
+
+    print(f"🚀 Batch generation ({backend}): {count} levels, {len(specs)} shards, workers={workers or os.cpu_count()}")
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(_generate_shard_task, tasks):
+            results.append(result)
+            print(f"   📦 {result['file']}: {result['generated']}/{result['count']} levels")
+
+    manifest = write_manifest(out_dir, base_seed, count, shard_size, params, results, backend)
+    elapsed = time.perf_counter() - start
+    print(f"✅ {manifest['generated']} levels generated, {manifest['failed']} failed "
+          f"({manifest['generated'] / max(elapsed, 1e-9):.0f} levels/s)")
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless batch level generation (grid_engine)")
+    parser.add_argument("--out", required=True, help="Çıktı klasörü (shard'lar + manifest.json)")
+    parser.add_argument("--base-seed", type=int, default=grid_engine.DEFAULT_PARAMS["seed"])
+    parser.add_argument("--count", type=int, required=True, help="Üretilecek level sayısı")
+    parser.add_argument("--workers", type=int, default=None, help="Worker process sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--shard-size", type=int, default=256, help="Shard başına level sayısı")
+    parser.add_argument("--params", default=None, help="CONTROLLER parametreleri (JSON dosyası)")
+    parser.add_argument("--backend", choices=BACKENDS, default="engine",
+                        help="engine: grid_engine, scripts: houdiniScripts stage'leri (headless_hou)")
+    args = parser.parse_args(argv)
+
+    params = None
+    if args.params:
+        with open(args.params, "r", encoding="utf-8") as f:
+            params = json.load(f)
+
+    batch_generate(args.out, args.base_seed, args.count, params, args.workers, args.shard_size, args.backend)
+
+
+if __name__ == "__main__":
+    main()
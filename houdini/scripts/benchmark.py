@@ -0,0 +1,185 @@
+"""
+Benchmark
+Generation + export benchmark suite'i (Houdini'siz, grid_engine + level_format)
+
+Her harita boyutunda (15² ... 512²) N seed ile bütün stage'ler çalıştırılır, ardından
+my_exporter'ın grid -> GRID_ASCII -> INI yolu ("EXPORT_SERIALIZE") ölçülür.
+Ölçümler stage_profiler kayıtlarından gelir:
+    - zaman geçişi: tracemalloc kapalı, bütün seed'ler (median / p95 ms)
+    - memory geçişi: tracemalloc açık, ilk --memory-seeds seed (peak KB)
+Sonuçlar JSON olarak kaydedilip sonraki koşularda baseline olarak kullanılabilir;
+median / p95 süre ya da peak memory toleransı aşan stage'ler regresyon olarak raporlanır (exit code 1).
+
+Kullanım:
+    python benchmark.py --seeds 20 --save-baseline benchmark_baseline.json
+    python benchmark.py --seeds 20 --baseline benchmark_baseline.json --tolerance 0.25
+    python benchmark.py --sizes 15 25 64 --seeds 50
+    python benchmark.py --backend scripts --sizes 15 25 64   # houdiniScripts, headless_hou ile
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+
+import numpy as np
+
+import batch_generate
+import grid_engine
+import level_format
+import stage_profiler
+
+
+DEFAULT_SIZES = (15, 25, 64, 128, 256, 512)
+EXPORT_STAGE = "EXPORT_SERIALIZE"
+EXPORT_PARAMS = {"level_version": "v1.0.0", "format_version": level_format.CURRENT_FORMAT_VERSION}
+
+# Bu sürelerin altındaki farklar ölçüm gürültüsü sayılır
+MIN_REGRESSION_MS = 0.5
+MIN_REGRESSION_KB = 64.0
+
+
+def run_level(params, backend="engine"):
+    """Tek level: bütün stage'ler + export serileştirme (stage_profiler kayıtlarıyla)"""
+    grid = batch_generate.level_generator(backend)(params)
+    with stage_profiler.stage(EXPORT_STAGE, params["seed"], points=int(grid.order.size)):
+        chars = grid_engine.export_chars(grid)
+        rows, _ = grid_engine.serialize_grid(chars)
+        level_format.level_content(1, params, rows, chars.shape[1], chars.shape[0], EXPORT_PARAMS, export_date="")
+
+
+def collect(params, seeds, memory, backend="engine"):
+    """seeds için level üret; {stage: [kayıtlar]}"""
+    fd, log_path = tempfile.mkstemp(prefix="bomberman_bench_", suffix=".jsonl")
+    os.close(fd)
+    try:
+        stage_profiler.configure(log_path=log_path, memory=memory)
+        for seed in seeds:
+            run_level(dict(params, seed=seed), backend)
+        records = stage_profiler.read_records(log_path)
+    finally:
+        stage_profiler.configure(log_path=None)
+        os.remove(log_path)
+
+    by_stage = {}
+    for record in records:
+        by_stage.setdefault(record["stage"], []).append(record)
+    return by_stage
+
+
+def benchmark_size(size, seeds, memory_seeds, params=None, backend="engine"):
+    """Tek harita boyutu: {stage: {runs, median_ms, p95_ms, peak_kb}}"""
+    params = dict(grid_engine.resolve_params(params), sizeX=size, sizeY=size)
+    # Ölçülmeyen ısınma turu (import / ilk çağrı maliyetleri)
+    run_level(dict(params, seed=seeds[0]), backend)
+    timing = collect(params, seeds, False, backend)
+    memory = collect(params, seeds[:memory_seeds], True, backend) if memory_seeds > 0 else {}
+
+    results = {}
+    for name, records in timing.items():
+        times_ms = np.array([r["wall_time_s"] for r in records]) * 1000.0
+        peaks = [r.get("peak_memory_kb", 0.0) for r in memory.get(name, [])]
+        results[name] = {
+            "runs": len(records),
+            "median_ms": round(float(np.median(times_ms)), 4),
+            "p95_ms": round(float(np.percentile(times_ms, 95)), 4),
+            "peak_kb": round(float(np.median(peaks)), 1) if peaks else None,
+        }
+    return results
+
+
+def run_suite(sizes=DEFAULT_SIZES, seeds=20, base_seed=grid_engine.DEFAULT_PARAMS["seed"], memory_seeds=3,
+              params=None, backend="engine"):
+    """Bütün boyutlar; sonuç sözlüğü (baseline formatı)"""
+    seed_list = list(range(base_seed, base_seed + seeds))
+    suite = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "backend": backend,
+        "seeds": seeds,
+        "base_seed": base_seed,
+        "sizes": {},
+    }
+    for size in sizes:
+        print(f"⏱️  {size}x{size}: {seeds} seeds ...")
+        suite["sizes"][str(size)] = benchmark_size(size, seed_list, memory_seeds, params, backend)
+    return suite
+
+
+def find_regressions(current, baseline, tolerance=0.2):
+    """Baseline'a göre tolerance oranından fazla yavaşlayan / büyüyen stage'ler"""
+    regressions = []
+    for size, stages in current["sizes"].items():
+        for name, entry in stages.items():
+            base = baseline.get("sizes", {}).get(size, {}).get(name)
+            if not base:
+                continue
+            for metric, floor in (("median_ms", MIN_REGRESSION_MS), ("p95_ms", MIN_REGRESSION_MS),
+                                  ("peak_kb", MIN_REGRESSION_KB)):
+                old, new = base.get(metric), entry.get(metric)
+                if old is None or new is None:
+                    continue
+                if new > old * (1.0 + tolerance) and new - old > floor:
+                    regressions.append({"size": int(size), "stage": name, "metric": metric,
+                                        "baseline": old, "current": new,
+                                        "change": round(new / old - 1.0, 3) if old else None})
+    return regressions
+
+
+def print_report(suite):
+    print(f"\n{'SIZE':>6}  {'STAGE':<26}{'RUNS':>6}{'MEDIAN (ms)':>14}{'P95 (ms)':>12}{'PEAK MEM (KB)':>16}")
+    for size, stages in suite["sizes"].items():
+        for name in sorted(stages):
+            entry = stages[name]
+            peak = f"{entry['peak_kb']:.1f}" if entry["peak_kb"] is not None else "-"
+            print(f"{size:>6}  {name:<26}{entry['runs']:>6}{entry['median_ms']:>14.3f}"
+                  f"{entry['p95_ms']:>12.3f}{peak:>16}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generation and export benchmark suite across map sizes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Harita kenar uzunlukları")
+    parser.add_argument("--seeds", type=int, default=20, help="Boyut başına seed sayısı")
+    parser.add_argument("--base-seed", type=int, default=grid_engine.DEFAULT_PARAMS["seed"])
+    parser.add_argument("--memory-seeds", type=int, default=3, help="tracemalloc ile ölçülecek seed sayısı (0 -> kapalı)")
+    parser.add_argument("--params", default=None, help="CONTROLLER parametreleri (JSON dosyası)")
+    parser.add_argument("--backend", choices=batch_generate.BACKENDS, default="engine",
+                        help="engine: grid_engine, scripts: houdiniScripts stage'leri (headless_hou)")
+    parser.add_argument("--baseline", default=None, help="Karşılaştırılacak baseline JSON'u")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="İzin verilen oransal artış (0.2 = %%20)")
+    parser.add_argument("--save-baseline", default=None, help="Sonuçları baseline olarak kaydet")
+    args = parser.parse_args(argv)
+
+    params = None
+    if args.params:
+        with open(args.params, "r", encoding="utf-8") as f:
+            params = json.load(f)
+
+    suite = run_suite(args.sizes, args.seeds, args.base_seed, args.memory_seeds, params, args.backend)
+    print_report(suite)
+
+    if args.save_baseline:
+        tmp_path = args.save_baseline + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(suite, f, indent=2)
+        os.replace(tmp_path, args.save_baseline)
+        print(f"\n💾 Baseline saved: {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(suite, baseline, args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regressions (tolerance {args.tolerance:.0%}):")
+            for r in regressions:
+                print(f"   {r['size']:>4}  {r['stage']:<26}{r['metric']:<10} "
+                      f"{r['baseline']} -> {r['current']}")
+            return 1
+        print(f"\n✅ No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
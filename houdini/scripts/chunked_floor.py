@@ -0,0 +1,422 @@
+"""
+Chunked Floor
+Çok büyük tower katları (ör. 2048x2048) için chunk chunk üretim (Houdini'siz, grid_engine)
+
+Tek geometry / tek cook yerine kat sabit boyutlu chunk'lara bölünür:
+    1. Plan (hücre başına veri yok):
+       - her chunk'a alanıyla orantılı oda dikdörtgenleri (room_count 25x25 referansına göre),
+         chunk içi odalar en yakın önceki odaya L koridorla bağlanır (oda 0 = chunk anchor'ı);
+         chunk düzeni chunk seed'inden istendiğinde yeniden üretilir
+       - chunk anchor'ları rastgele spanning tree ile komşu chunk'lara L koridorla bağlanır,
+         böylece bütün kat tek bağlı koridor ağıdır
+       - player ilk chunk'ın anchor'ında, stairs tree'de en uzak chunk'ın anchor'ında;
+         aradaki tree koridorları garanti yol ('1')
+    2. Render (chunk başına): chunk + overlap halkası penceresine sadece o pencereyi kesen
+       odalar / koridorlar basılır. Oda noise'u hücrenin global koordinatından hash'lendiği için
+       komşu chunk'lar overlap bölgesinde aynı tile'ları üretir (dikişsiz). 5_PLACE_ENEMIES ve
+       6_CREATE_INTERACTABLES pencere üzerinde grid_engine ile çalışır, yerleştirme sadece
+       chunk çekirdeğine yapılır; kenar duvar tespiti overlap halkasını görür.
+    3. Her chunk çekirdeği bittiği anda diske yazılır (chunk_<z>_<x>.npy), en sonda manifest.
+
+Bellek chunk penceresi + iki chunk satırlık düzen cache'i + chunk sayısı kadar anchor ile sınırlıdır.
+
+Kullanım:
+    python chunked_floor.py --size 2048 --chunk-size 128 --seed 283 --out floor_out
+    python chunked_floor.py --size 512 --out floor_out --ascii floor_out/GRID_ASCII.txt
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+import grid_engine
+import stage_profiler
+
+
+DEFAULT_CHUNK_SIZE = 128
+# Kenar duvar tespiti 8 komşuya bakar; 1 hücrelik halka dikiş için yeterli
+DEFAULT_OVERLAP = 1
+# room_count bu alana göre verilmiş (CONTROLLER varsayılanı 25x25)
+REFERENCE_AREA = 25 * 25
+
+MANIFEST_NAME = "manifest.json"
+CHUNK_PATTERN = "chunk_{:04d}_{:04d}.npy"
+
+
+def cell_noise(seed, room_key, xs, zs):
+    """Hücrenin global (x, z)'sinden [0, 1) uniform değer (splitmix64), chunk'tan bağımsız"""
+    with np.errstate(over="ignore"):
+        h = (np.uint64(seed & 0xFFFFFFFFFFFFFFFF) * np.uint64(0x9E3779B97F4A7C15)
+             ^ np.uint64(room_key) * np.uint64(0xC2B2AE3D27D4EB4F))
+        h = h ^ (np.asarray(xs, dtype=np.uint64) * np.uint64(0x165667B19E3779F9))
+        h = h ^ (np.asarray(zs, dtype=np.uint64) * np.uint64(0x27D4EB2F165667C5))
+        h = h + np.uint64(0x9E3779B97F4A7C15)
+        h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        h = h ^ (h >> np.uint64(31))
+    return (h >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def l_corridor(start, end, horizontal_first):
+    """(x, z) -> (x, z) L koridoru: iki dikdörtgen (x0, z0, x1, z1), uçlar dahil"""
+    (ax, az), (bx, bz) = start, end
+    if horizontal_first:
+        corner = (bx, az)
+    else:
+        corner = (ax, bz)
+    return [
+        (min(ax, corner[0]), min(az, corner[1]), max(ax, corner[0]), max(az, corner[1])),
+        (min(corner[0], bx), min(corner[1], bz), max(corner[0], bx), max(corner[1], bz)),
+    ]
+
+
+class FloorPlan:
+    """
+    Kat planı. Hücre başına veri tutulmaz: chunk düzenleri (odalar + chunk içi koridorlar)
+    chunk seed'inden istendiği anda yeniden üretilir (küçük LRU), kat çapında sadece
+    chunk anchor'ları ve spanning tree koridorları tutulur.
+    """
+
+    def __init__(self, params, width, height, chunk_size=DEFAULT_CHUNK_SIZE, overlap=DEFAULT_OVERLAP):
+        self.params = grid_engine.resolve_params(params)
+        self.seed = int(self.params["seed"])
+        self.width = int(width)
+        self.height = int(height)
+        self.chunk_size = int(chunk_size)
+        self.overlap = int(overlap)
+        self.chunks_x = math.ceil(self.width / self.chunk_size)
+        self.chunks_z = math.ceil(self.height / self.chunk_size)
+
+        # Oda / chunk içi koridor en fazla bir komşu chunk'a taşar (3x3 komşuluk yeterli)
+        max_room_size = int(self.params["max_room_size"])
+        if max_room_size + self.overlap > self.chunk_size:
+            raise ValueError(f"max_room_size + overlap ({max_room_size} + {self.overlap}) "
+                             f"must not exceed chunk size ({self.chunk_size})")
+        if max_room_size > min(self.width, self.height):
+            raise ValueError("Floor is smaller than max_room_size")
+
+        # Satır satır render'da bir önceki / sonraki chunk satırı cache'te kalır
+        self._layouts = OrderedDict()
+        self._cache_size = 2 * self.chunks_x + 4
+        self.anchors = [self._room_center(self._draw_room(random.Random(self.chunk_seed(chunk)), chunk))
+                        for chunk in range(self.chunk_count)]
+        self._plan_tree()
+
+    # --- Chunk geometrisi ---
+    @property
+    def chunk_count(self):
+        return self.chunks_x * self.chunks_z
+
+    def chunk_bounds(self, chunk):
+        """Chunk çekirdeği (x0, z0, x1, z1), bitişler hariç"""
+        cz, cx = divmod(chunk, self.chunks_x)
+        x0, z0 = cx * self.chunk_size, cz * self.chunk_size
+        return x0, z0, min(x0 + self.chunk_size, self.width), min(z0 + self.chunk_size, self.height)
+
+    def window_bounds(self, chunk):
+        """Chunk + overlap halkası (kat sınırında kırpılmış), bitişler hariç"""
+        x0, z0, x1, z1 = self.chunk_bounds(chunk)
+        o = self.overlap
+        return max(x0 - o, 0), max(z0 - o, 0), min(x1 + o, self.width), min(z1 + o, self.height)
+
+    def chunk_seed(self, chunk):
+        return self.seed * 1000003 + chunk
+
+    def neighbours(self, chunk):
+        """Chunk ve 8 komşusu (kat içinde kalanlar)"""
+        cz, cx = divmod(chunk, self.chunks_x)
+        return [z * self.chunks_x + x
+                for z in range(max(cz - 1, 0), min(cz + 2, self.chunks_z))
+                for x in range(max(cx - 1, 0), min(cx + 2, self.chunks_x))]
+
+    # --- Chunk düzeni ---
+    def _draw_room(self, rng, chunk):
+        """Çekirdekte başlayan oda (kat sınırında içeri kaydırılır): (x0, z0, x1, z1), uçlar dahil"""
+        x0, z0, x1, z1 = self.chunk_bounds(chunk)
+        min_size, max_size = int(self.params["min_room_size"]), int(self.params["max_room_size"])
+        room_w = rng.randint(min_size, max_size)
+        room_h = rng.randint(min_size, max_size)
+        room_x = min(rng.randint(x0, max(x0, min(x1 - 1, self.width - room_w))), self.width - room_w)
+        room_z = min(rng.randint(z0, max(z0, min(z1 - 1, self.height - room_h))), self.height - room_h)
+        return room_x, room_z, room_x + room_w - 1, room_z + room_h - 1
+
+    @staticmethod
+    def _room_center(room):
+        return (room[0] + room[2]) // 2, (room[1] + room[3]) // 2
+
+    def chunk_layout(self, chunk):
+        """
+        Chunk'ın odaları ve chunk içi koridorları: (rooms (n, 5), corridors (m, 5)) int64.
+        Oda satırı (x0, z0, x1, z1, noise anahtarı), koridor satırı (x0, z0, x1, z1, 0).
+        Odalar en yakın önceki odaya L koridorla bağlanır (chunk içi ağaç, oda 0 = anchor).
+        """
+        if chunk in self._layouts:
+            self._layouts.move_to_end(chunk)
+            return self._layouts[chunk]
+
+        rng = random.Random(self.chunk_seed(chunk))
+        x0, z0, x1, z1 = self.chunk_bounds(chunk)
+        room_count = max(1, round(int(self.params["room_count"]) * (x1 - x0) * (z1 - z0) / REFERENCE_AREA))
+
+        rooms, corridors = [], []
+        centers = np.zeros((room_count, 2), dtype=np.int64)
+        for i in range(room_count):
+            room = self._draw_room(rng, chunk)
+            rooms.append(room + ((chunk << 20) + i,))
+            centers[i] = self._room_center(room)
+            if i:
+                # En yakın önceki oda (eşitlikte küçük indeks)
+                target = int(np.argmin(((centers[:i] - centers[i]) ** 2).sum(axis=1)))
+                for rect in l_corridor(tuple(centers[target].tolist()), tuple(centers[i].tolist()), rng.random() < 0.5):
+                    corridors.append(rect + (0,))
+
+        layout = (np.array(rooms, dtype=np.int64).reshape(-1, 5), np.array(corridors, dtype=np.int64).reshape(-1, 5))
+        self._layouts[chunk] = layout
+        if len(self._layouts) > self._cache_size:
+            self._layouts.popitem(last=False)
+        return layout
+
+    def window_items(self, chunk):
+        """Chunk penceresini kesebilecek odalar ve koridorlar (koridor son sütunu: garanti yol mu)"""
+        layouts = [self.chunk_layout(n) for n in self.neighbours(chunk)]
+        rooms = np.concatenate([rooms for rooms, _ in layouts])
+        corridors = np.concatenate([corridors for _, corridors in layouts] + [self.tree_corridors])
+        return rooms, corridors
+
+    # --- Kat çapında: spanning tree ---
+    def _plan_tree(self):
+        """Chunk anchor'ları arasında rastgele spanning tree (Kruskal), player / stairs ve garanti yol"""
+        rng = random.Random(self.seed)
+        edges = []
+        for chunk in range(self.chunk_count):
+            cz, cx = divmod(chunk, self.chunks_x)
+            if cx + 1 < self.chunks_x:
+                edges.append((chunk, chunk + 1))
+            if cz + 1 < self.chunks_z:
+                edges.append((chunk, chunk + self.chunks_x))
+        rng.shuffle(edges)
+
+        parent = list(range(self.chunk_count))
+
+        def find(a):
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            return a
+
+        tree = {chunk: [] for chunk in range(self.chunk_count)}
+        edge_rects = {}
+        for a, b in edges:
+            ra, rb = find(a), find(b)
+            if ra == rb:
+                continue
+            parent[rb] = ra
+            tree[a].append(b)
+            tree[b].append(a)
+            edge_rects[(a, b)] = l_corridor(self.anchors[a], self.anchors[b], rng.random() < 0.5)
+
+        # Player: chunk 0, stairs: tree'de en uzak chunk (eşitlikte küçük indeks)
+        came_from = {0: None}
+        order = [0]
+        for chunk in order:
+            for neighbor in sorted(tree[chunk]):
+                if neighbor not in came_from:
+                    came_from[neighbor] = chunk
+                    order.append(neighbor)
+        depth = {0: 0}
+        for chunk in order[1:]:
+            depth[chunk] = depth[came_from[chunk]] + 1
+        exit_chunk = min(order, key=lambda c: (-depth[c], c))
+
+        path_edges = set()
+        chunk = exit_chunk
+        while came_from[chunk] is not None:
+            path_edges.add((min(chunk, came_from[chunk]), max(chunk, came_from[chunk])))
+            chunk = came_from[chunk]
+
+        self.tree_corridors = np.array(
+            [rect + (int(key in path_edges),) for key, rects in edge_rects.items() for rect in rects],
+            dtype=np.int64,
+        ).reshape(-1, 5)
+        self.player = self.anchors[0]
+        self.exit = self.anchors[exit_chunk]
+        self.exit_chunk = exit_chunk
+        self.path_chunks = len(path_edges) + 1
+
+
+def clip_rects(rects, wx0, wz0, wx1, wz1):
+    """(n, 5) dikdörtgenleri pencereye kırp, pencereyi kesmeyenleri at (son sütun korunur)"""
+    clipped = rects.copy()
+    clipped[:, 0] = np.maximum(rects[:, 0], wx0)
+    clipped[:, 1] = np.maximum(rects[:, 1], wz0)
+    clipped[:, 2] = np.minimum(rects[:, 2], wx1 - 1)
+    clipped[:, 3] = np.minimum(rects[:, 3], wz1 - 1)
+    return clipped[(clipped[:, 0] <= clipped[:, 2]) & (clipped[:, 1] <= clipped[:, 3])]
+
+
+def render_chunk(plan, chunk):
+    """
+    Chunk penceresini üret: odalar + koridorlar + player / stairs, ardından
+    düşman / loot / kırılabilir duvar (sadece çekirdekte). Dönüş: pencere LevelGrid'i.
+    """
+    wx0, wz0, wx1, wz1 = plan.window_bounds(chunk)
+    x0, z0, x1, z1 = plan.chunk_bounds(chunk)
+    width, height = wx1 - wx0, wz1 - wz0
+
+    # Çekirdek hücreleri 'geo.points()' gibi: yerleştirme sadece bunlara yapılır
+    core_z, core_x = np.mgrid[z0 - wz0:z1 - wz0, x0 - wx0:x1 - wx0]
+    grid = grid_engine.LevelGrid(width, height, (wx0, wz0), (core_z * width + core_x).reshape(-1))
+    noise_scale = float(plan.params["noise_scale"])
+
+    rooms, corridors = plan.window_items(chunk)
+
+    # --- Odalar (2_CARVE_ROOMS noise formülü, hash'lenmiş uniform ile) ---
+    for rx0, rz0, rx1, rz1, key in clip_rects(rooms, wx0, wz0, wx1, wz1).tolist():
+        zs, xs = np.mgrid[rz0:rz1 + 1, rx0:rx1 + 1]
+        carved = np.sin((xs + zs) * noise_scale + cell_noise(plan.seed, key, xs, zs) * 2.0) > 0
+        grid.tiles[rz0 - wz0:rz1 - wz0 + 1, rx0 - wx0:rx1 - wx0 + 1][carved] = grid_engine.EMPTY
+
+    # --- Koridorlar (garanti yol hücreleri 'path') ---
+    for rx0, rz0, rx1, rz1, on_path in clip_rects(corridors, wx0, wz0, wx1, wz1).tolist():
+        window = (slice(rz0 - wz0, rz1 - wz0 + 1), slice(rx0 - wx0, rx1 - wx0 + 1))
+        grid.tiles[window] = grid_engine.EMPTY
+        if on_path:
+            grid.path[window] = True
+
+    # --- Player / stairs (yol işaretinin üstünde görünür kalır) ---
+    for (x, z), tile_id in ((plan.player, grid_engine.PLAYER), (plan.exit, grid_engine.STAIRS)):
+        if wx0 <= x < wx1 and wz0 <= z < wz1:
+            grid.tiles[z - wz0, x - wx0] = tile_id
+            grid.path[z - wz0, x - wx0] = False
+
+    # --- 5 / 6: chunk seed'iyle, sadece çekirdek hücrelerine ---
+    chunk_params = dict(plan.params, seed=plan.chunk_seed(chunk))
+    categories = grid_engine.categorize(grid)
+    grid_engine.place_enemies(grid, chunk_params, categories)
+    grid_engine.create_interactables(grid, chunk_params)
+    return grid
+
+
+def chunk_codes(plan, chunk, grid):
+    """Pencere grid'inin çekirdeği: (h, w) uint8 ASCII kodları"""
+    wx0, wz0, _, _ = plan.window_bounds(chunk)
+    x0, z0, x1, z1 = plan.chunk_bounds(chunk)
+    chars, _ = grid_engine.visualize(grid)
+    return grid_engine.char_codes(chars[z0 - wz0:z1 - wz0, x0 - wx0:x1 - wx0])
+
+
+def generate_floor(out_dir, params=None, width=2048, height=2048, chunk_size=DEFAULT_CHUNK_SIZE,
+                   overlap=DEFAULT_OVERLAP):
+    """Katı chunk chunk üret, her chunk'ı bitince yaz, manifest'i en sonda yaz"""
+    os.makedirs(out_dir, exist_ok=True)
+    start = time.perf_counter()
+    plan = FloorPlan(params, width, height, chunk_size, overlap)
+    print(f"🏗️  Chunked floor {width}x{height}: {plan.chunks_x}x{plan.chunks_z} chunks of {chunk_size}, "
+          f"player {plan.player} -> stairs {plan.exit}")
+
+    chunks = []
+    path_length = 0
+    rooms = 0
+    for chunk in range(plan.chunk_count):
+        x0, z0, x1, z1 = plan.chunk_bounds(chunk)
+        with stage_profiler.stage("CHUNKED_FLOOR_CHUNK", plan.seed, chunk=chunk, points=(x1 - x0) * (z1 - z0)):
+            grid = render_chunk(plan, chunk)
+            codes = chunk_codes(plan, chunk, grid)
+            path_length += int(np.count_nonzero(codes == ord(grid_engine.PATH_CHAR)))
+
+            filename = CHUNK_PATTERN.format(z0 // chunk_size, x0 // chunk_size)
+            tmp_path = os.path.join(out_dir, filename + ".tmp")
+            with open(tmp_path, "wb") as f:
+                np.save(f, codes, allow_pickle=False)
+            os.replace(tmp_path, os.path.join(out_dir, filename))
+        rooms += plan.chunk_layout(chunk)[0].shape[0]
+        chunks.append({"file": filename, "x": x0, "z": z0, "width": x1 - x0, "height": z1 - z0})
+
+    manifest = {
+        "generator": "chunked_floor",
+        "width": plan.width,
+        "height": plan.height,
+        "chunk_size": plan.chunk_size,
+        "overlap": plan.overlap,
+        "params": plan.params,
+        "player": list(plan.player),
+        "exit": list(plan.exit),
+        "path_length": path_length + 2,
+        "path_chunks": plan.path_chunks,
+        "rooms": rooms,
+        "chunks": chunks,
+    }
+    tmp_path = os.path.join(out_dir, MANIFEST_NAME + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, os.path.join(out_dir, MANIFEST_NAME))
+
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    print(f"✅ {plan.chunk_count} chunks in {elapsed:.2f}s ({width * height / elapsed / 1e6:.2f} Mcells/s), "
+          f"path {manifest['path_length']} cells across {plan.path_chunks} chunks")
+    return manifest
+
+
+def read_manifest(out_dir):
+    with open(os.path.join(out_dir, MANIFEST_NAME), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def iter_row_strips(out_dir):
+    """Katı chunk satırı (strip) strip (z0, (h, width) uint8) olarak oku; bellek width * chunk_size"""
+    manifest = read_manifest(out_dir)
+    strips = {}
+    for entry in manifest["chunks"]:
+        strips.setdefault(entry["z"], []).append(entry)
+    for z0 in sorted(strips):
+        entries = sorted(strips[z0], key=lambda e: e["x"])
+        yield z0, np.concatenate([np.load(os.path.join(out_dir, e["file"])) for e in entries], axis=1)
+
+
+def assemble_floor(out_dir):
+    """Bütün katı tek (height, width) array'inde birleştir (küçük katlar / kontrol için)"""
+    return np.concatenate([strip for _, strip in iter_row_strips(out_dir)], axis=0)
+
+
+def write_ascii(out_dir, path):
+    """GRID_ASCII satırlarını strip strip yaz (kat bellekte birleştirilmez)"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        for _, strip in iter_row_strips(out_dir):
+            f.write(np.concatenate([strip, np.full((strip.shape[0], 1), ord("\n"), dtype=np.uint8)], axis=1).tobytes())
+    os.replace(tmp_path, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Chunked generation for very large tower floors")
+    parser.add_argument("--out", required=True, help="Çıktı klasörü (chunk dosyaları + manifest.json)")
+    parser.add_argument("--size", type=int, default=2048, help="Kat kenar uzunluğu (--width / --height yoksa)")
+    parser.add_argument("--width", type=int, default=None)
+    parser.add_argument("--height", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--overlap", type=int, default=DEFAULT_OVERLAP, help="Chunk penceresi halka genişliği")
+    parser.add_argument("--seed", type=int, default=grid_engine.DEFAULT_PARAMS["seed"])
+    parser.add_argument("--params", default=None, help="CONTROLLER parametreleri (JSON dosyası)")
+    parser.add_argument("--ascii", default=None, help="GRID_ASCII satırlarının da yazılacağı dosya")
+    args = parser.parse_args(argv)
+
+    params = {}
+    if args.params:
+        with open(args.params, "r", encoding="utf-8") as f:
+            params = json.load(f)
+    params["seed"] = args.seed
+
+    generate_floor(args.out, params, args.width or args.size, args.height or args.size, args.chunk_size, args.overlap)
+    if args.ascii:
+        write_ascii(args.out, args.ascii)
+        print(f"📄 GRID_ASCII: {args.ascii}")
+
+
+if __name__ == "__main__":
+    main()
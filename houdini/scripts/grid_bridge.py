@@ -0,0 +1,189 @@
+"""
+Grid Bridge
+Houdini geometry <-> grid_engine.LevelGrid köprüsü
+SOP script'leri geometry'yi tek seferde (bulk) okuyup yazar, mantık grid_engine'de çalışır.
+"""
+
+import numpy as np
+
+import grid_engine
+
+
+def read_controller_params(controller):
+    """CONTROLLER node'undan parametreleri al (eksik olanlar için varsayılan değerler)"""
+    params = {}
+    for name, default in grid_engine.DEFAULT_PARAMS.items():
+        parm = controller.parm(name) if controller else None
+        params[name] = parm.eval() if parm is not None else default
+    return params
+
+
+def grid_from_geometry(geo):
+    """
+    Point pozisyonlarından LevelGrid oluştur, tile_type / class / path verilerini kopyala.
+    (x, z) -> point numarası indeksi burada, cook başına bir kez kurulur.
+    """
+    positions = np.asarray(geo.pointFloatAttribValues("P"), dtype=np.float64).reshape(-1, 3)
+    if positions.size == 0:
+        raise Exception("Geometry has no points!")
+
+    xs = np.rint(positions[:, 0]).astype(np.int64)
+    zs = np.rint(positions[:, 2]).astype(np.int64)
+    min_x, min_z = int(xs.min()), int(zs.min())
+    width = int(xs.max()) - min_x + 1
+    height = int(zs.max()) - min_z + 1
+
+    # Point numarası -> flat hücre indeksi (eksik hücreler index'te -1 kalır)
+    order = (zs - min_z) * width + (xs - min_x)
+    if np.unique(order).size != order.size:
+        raise Exception("Geometry has overlapping points on the grid!")
+
+    # Gerçek float P değerleri de tutulur (2_CARVE_ROOMS noise'u grid1'in z + 0.4975 kaymasını kullanır)
+    offset = (float(positions[0, 0]) - xs[0], float(positions[0, 2]) - zs[0])
+    grid = grid_engine.LevelGrid(width, height, (min_x, min_z), order, offset, positions[:, [0, 2]])
+
+    if geo.findPointAttrib("tile_type"):
+        names = np.asarray(geo.pointStringAttribValues("tile_type"))
+        unique_names, inverse = np.unique(names, return_inverse=True)
+        lut = np.array(
+            [grid_engine.TILE_IDS.get(name, grid_engine.EMPTY) for name in unique_names],
+            dtype=np.uint8,
+        )
+        grid.tiles.reshape(-1)[order] = lut[inverse]
+
+    if geo.findPointAttrib("class"):
+        grid.room.reshape(-1)[order] = geo.pointIntAttribValues("class")
+
+    path_group = geo.findPointGroup("path")
+    if path_group:
+        path_points = [pt.number() for pt in path_group.points()]
+        grid.path.reshape(-1)[order[path_points]] = True
+
+    return grid
+
+
+def write_tiles(grid, geo):
+    """tile_type point attribute'unu tek seferde yaz"""
+    names = np.asarray(grid_engine.TILE_TYPES)[grid.tiles.reshape(-1)[grid.order]]
+    geo.setPointStringAttribValues("tile_type", names.tolist())
+
+
+def write_rooms(grid, geo):
+    """class point attribute'unu tek seferde yaz"""
+    geo.setPointIntAttribValues("class", grid.room.reshape(-1)[grid.order].tolist())
+
+
+def write_neighbours(grid, geo):
+    """neighbours array attribute'unu yaz (array attribute için bulk setter yok)"""
+    table = grid_engine.neighbour_table(grid).tolist()
+    for pt, neighbor_ids in zip(geo.points(), table):
+        pt.setAttribValue("neighbours", neighbor_ids)
+
+
+def write_path_group(grid, geo):
+    """path point grubunu grid.path'ten yeniden oluştur"""
+    path_group = geo.findPointGroup("path") or geo.createPointGroup("path")
+    path_group.clear()
+    path_points = np.flatnonzero(grid.path.reshape(-1)[grid.order])
+    if path_points.size:
+        path_group.add([geo.point(int(pt_num)) for pt_num in path_points])
+
+
+def grid_prim_corners(geo, positions):
+    """
+    Grid SOP topolojisinde her prim'in 4 köşe point numarası: (num_prims, 4).
+    Point'ler satır satır numaralıdır, prim (r, c) köşeleri
+    r*C+c, r*C+c+1, (r+1)*C+c, (r+1)*C+c+1. Topoloji uymazsa None döner.
+    """
+    num_points = positions.shape[0]
+    num_prims = geo.intrinsicValue("primitivecount")
+    if num_points < 4 or num_prims == 0:
+        return None
+
+    # Satır ekseni: point 0 -> 1 hangi eksende ilerliyorsa
+    row_axis = 0 if abs(positions[1, 0] - positions[0, 0]) > abs(positions[1, 2] - positions[0, 2]) else 2
+    col_axis = 2 if row_axis == 0 else 0
+    cols = int(np.count_nonzero(np.isclose(positions[:, col_axis], positions[0, col_axis])))
+    rows = num_points // cols if cols else 0
+    if cols < 2 or rows < 2 or rows * cols != num_points or num_prims != (rows - 1) * (cols - 1):
+        return None
+
+    r, c = np.divmod(np.arange(num_prims, dtype=np.int64), cols - 1)
+    base = r * cols + c
+    corners = np.stack([base, base + 1, base + cols, base + cols + 1], axis=1)
+
+    # İlk ve son prim ile topolojiyi doğrula
+    for prim_num in (0, num_prims - 1):
+        actual = sorted(pt.number() for pt in geo.prim(prim_num).points())
+        if actual != sorted(corners[prim_num].tolist()):
+            return None
+    return corners
+
+
+def prim_owner_points(geo):
+    """
+    Her prim'in ilk vertex'inin point numarası (prim.points()[0]), vertex'i olmayan prim'ler -1.
+    Grid topolojisinde ilk prim'in köşe sırasından bütün prim'ler için hesaplanır.
+    """
+    positions = np.asarray(geo.pointFloatAttribValues("P"), dtype=np.float64).reshape(-1, 3)
+    corners = grid_prim_corners(geo, positions)
+    if corners is not None:
+        # İlk vertex hangi köşe? (ilk ve son prim ile doğrula)
+        first = geo.prim(0).points()[0].number()
+        corner = int(np.flatnonzero(corners[0] == first)[0])
+        last_prim = corners.shape[0] - 1
+        if geo.prim(last_prim).points()[0].number() == corners[last_prim, corner]:
+            return corners[:, corner]
+
+    # Grid olmayan geometri: prim başına tek sorgu
+    return np.array(
+        [prim.points()[0].number() if prim.numVertices() > 0 else -1 for prim in geo.prims()],
+        dtype=np.int64,
+    )
+
+
+def point_visuals(geo):
+    """
+    tile_type ve path grubundan point başına (char, renk) array'leri.
+    Tanınmayan tile_type 'empty' gibi, eski "1" tile_type'ı ve path grubu yol rengiyle.
+    """
+    num_points = geo.intrinsicValue("pointcount")
+    if geo.findPointAttrib("tile_type"):
+        names = np.asarray(geo.pointStringAttribValues("tile_type"))
+    else:
+        names = np.full(num_points, "empty")
+
+    unique_names, inverse = np.unique(names, return_inverse=True)
+    char_lut = np.array([
+        grid_engine.PATH_CHAR if name == grid_engine.PATH_CHAR
+        else grid_engine.TILE_CHARS.get(name, grid_engine.TILE_CHARS["empty"])
+        for name in unique_names
+    ], dtype="<U1")
+    color_lut = np.array([
+        grid_engine.PATH_COLOR if name == grid_engine.PATH_CHAR
+        else grid_engine.TILE_COLORS.get(name, grid_engine.TILE_COLORS["empty"])
+        for name in unique_names
+    ], dtype=np.float32).reshape(-1, 3)
+    chars = char_lut[inverse]
+    colors = color_lut[inverse]
+
+    path_group = geo.findPointGroup("path")
+    if path_group:
+        path_points = np.array([pt.number() for pt in path_group.points()], dtype=np.int64)
+        # Player / stairs yolun uçlarıdır, kendi char'ları korunur (grid_engine.visualize ile aynı)
+        keep_names = [grid_engine.TILE_TYPES[tile_id] for tile_id in grid_engine.PATH_KEEP_TILES]
+        path_points = path_points[~np.isin(names[path_points], keep_names)]
+        chars[path_points] = grid_engine.PATH_CHAR
+        colors[path_points] = grid_engine.PATH_COLOR
+    return chars, colors
+
+
+def prim_centers(geo):
+    """Bütün prim merkezleri (num_prims, 3); grid topolojisinde per-prim Python objesi yok"""
+    positions = np.asarray(geo.pointFloatAttribValues("P"), dtype=np.float64).reshape(-1, 3)
+    corners = grid_prim_corners(geo, positions)
+    if corners is not None:
+        return positions[corners].mean(axis=1)
+
+    # Grid olmayan geometri: eski yöntem (bounding box merkezi)
+    return np.array([tuple(prim.boundingBox().center()) for prim in geo.prims()], dtype=np.float64)
@@ -0,0 +1,1117 @@
+"""
+Headless Grid Engine
+Bomberman Tower level generation pipeline (1 → 6) on NumPy tile arrays
+houdiniScripts altındaki SOP script'lerinin mantığını Houdini olmadan çalıştırır.
+
+Aynı CONTROLLER parametreleri (seed, room_count, density'ler) ile SOP
+pipeline'ı ile aynı sonucu üretir:
+  - Her stage, SOP script'i ile aynı seed offset'ini kullanır (seed, seed+1, seed+2, seed+3)
+  - Rastgele çekimler aynı sırada yapılır (geo.points() sırası → grid.order)
+  - Grid, main_leveldesign.hip'teki grid1 ile aynı point düzenindedir ((sizeX + 1) x (sizeY + 1)
+    point, z + 0.4975); export prim başına owner point'inden okunur (export_chars)
+"""
+
+import math
+import random
+import heapq
+
+import numpy as np
+
+import stage_profiler
+
+
+# --------------------------
+# 0) TILE TANIMLARI
+# --------------------------
+
+# Tile ID'leri exporter'daki CELL_TYPES ID'leri ile aynı
+TILE_TYPES = (
+    "empty",          # 0
+    "wall",           # 1
+    "floor",          # 2
+    "player",         # 3
+    "enemy",          # 4
+    "enemy_shooter",  # 5
+    "coin",           # 6
+    "health",         # 7
+    "breakable",      # 8
+    "stairs",         # 9
+)
+TILE_IDS = {name: tile_id for tile_id, name in enumerate(TILE_TYPES)}
+
+EMPTY = TILE_IDS["empty"]
+WALL = TILE_IDS["wall"]
+FLOOR = TILE_IDS["floor"]
+PLAYER = TILE_IDS["player"]
+ENEMY = TILE_IDS["enemy"]
+ENEMY_SHOOTER = TILE_IDS["enemy_shooter"]
+COIN = TILE_IDS["coin"]
+HEALTH = TILE_IDS["health"]
+BREAKABLE = TILE_IDS["breakable"]
+STAIRS = TILE_IDS["stairs"]
+
+# 4_VISUALIZE_MAP tile sözlüğü (tile_type -> char / color)
+TILE_CHARS = {
+    "wall": "#",
+    "player": "P",
+    "enemy": "E",
+    "enemy_shooter": "F",
+    "stairs": "S",
+    "coin": "C",
+    "health": "H",
+    "breakable": "B",
+    "empty": ".",
+}
+TILE_COLORS = {
+    "wall": (0.2, 0.2, 0.2),
+    "player": (0.0, 0.8, 1.0),
+    "enemy": (1.0, 0.2, 0.2),
+    "enemy_shooter": (1.0, 0.5, 0.0),
+    "stairs": (0.8, 0.5, 1.0),
+    "coin": (1.0, 0.8, 0.0),
+    "health": (0.0, 1.0, 0.0),
+    "breakable": (0.5, 0.3, 0.1),
+    "empty": (0.1, 0.1, 0.1),
+}
+PATH_CHAR = "1"
+PATH_COLOR = (0.4, 0.4, 0.0)
+# Yolun iki ucu: path işareti bunların üstüne yazılmaz
+PATH_KEEP_TILES = (PLAYER, STAIRS)
+
+# Tanınmayan tile'lar 'empty' gibi görselleştirilir
+CHAR_LUT = np.array(
+    [TILE_CHARS.get(name, TILE_CHARS["empty"]) for name in TILE_TYPES], dtype="<U1"
+)
+COLOR_LUT = np.array(
+    [TILE_COLORS.get(name, TILE_COLORS["empty"]) for name in TILE_TYPES], dtype=np.float32
+)
+
+# 4 yönlü komşuluk (2_5_CONNECT_ROOMS offset sırası: +x, -x, +z, -z)
+NEIGHBOR_OFFSETS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+# Wall maliyeti (3_5_GUARANTEE_PATH COST_ADDER ile aynı)
+WALL_PATH_COST = 1000.0
+
+# main_leveldesign.hip grid1 (Grid SOP, ZX plane): cols = sizeX + 1, rows = sizeY + 1,
+# size = (cols - 1, rows - 1), center = ((cols - 1) / 2, 0, (rows - 0.005) / 2).
+# Point'ler x = 0 .. sizeX, z = k + 0.4975 (float32 P); prim (c, r)'nin ilk vertex'i point (c, r)
+GRID1_CENTER_Z_INSET = 0.005
+GRID1_OFFSET = (0.0, (1.0 - GRID1_CENTER_Z_INSET) / 2.0)
+
+# 3_PLACE_PLAYER_AND_EXIT: aynı anda BFS yapılan kaynak bloğunun hücre sayısı (kaynak x N)
+PAIR_BATCH_CELLS = 1 << 22
+
+# CONTROLLER node'u yoksa stage script'lerinin kullandığı varsayılan değerler
+DEFAULT_PARAMS = {
+    "seed": 12345,
+    "room_count": 5,
+    "enemy_density": 0.0,
+    "loot_density": 1.0,
+    "coin_density": 0.5,
+    "health_density": 0.25,
+    "breakable_density": 0.3,
+    "sizeX": 25,
+    "sizeY": 25,
+    "edge_wall_bias": 1.0,
+    "noise_scale": 1.0,
+    "noise_threshold": 0.5,
+    "min_room_size": 3,
+    "max_room_size": 7,
+    "min_player_exit_dist": 5,
+}
+
+
+def resolve_params(params=None):
+    """Eksik parametreleri DEFAULT_PARAMS ile tamamla"""
+    resolved = dict(DEFAULT_PARAMS)
+    if params:
+        resolved.update(params)
+    return resolved
+
+
+# --------------------------
+# 1) GRID DURUMU
+# --------------------------
+
+class GridIndex:
+    """
+    (x, z) -> point numarası indeksi. Her cook'ta bir kez kurulur.
+    Komşuluk sorguları O(1): komşu hücreler önceden (N, 4) int32 tablo olarak hesaplanır
+    (hücre başına Python listesi yok). Geometride olmayan hücreler (delikler) -1 olarak tutulur.
+    """
+
+    def __init__(self, width, height, order):
+        self.width = width
+        self.height = height
+        self.point_at = np.full(width * height, -1, dtype=np.int64)
+        self.point_at[order] = np.arange(len(order), dtype=np.int64)
+
+        # (hücre, offset) -> komşu hücre, yoksa -1 (offset sırası: +x, -x, +z, -z)
+        cells = np.arange(width * height, dtype=np.int64)
+        xs, zs = cells % width, cells // width
+        self.neighbor_cells = np.full((width * height, 4), -1, dtype=np.int32)
+        for slot, (ox, oz) in enumerate(NEIGHBOR_OFFSETS):
+            nx, nz = xs + ox, zs + oz
+            inside = (0 <= nx) & (nx < width) & (0 <= nz) & (nz < height)
+            neighbor = np.where(inside, nz * width + nx, -1)
+            neighbor[inside] = np.where(self.point_at[neighbor[inside]] >= 0, neighbor[inside], -1)
+            self.neighbor_cells[:, slot] = neighbor
+
+    def point_number(self, x, z):
+        """Grid koordinatındaki point numarası (yoksa -1)"""
+        if 0 <= x < self.width and 0 <= z < self.height:
+            return int(self.point_at[z * self.width + x])
+        return -1
+
+    def neighbors(self, cell):
+        """Var olan 4 yönlü komşu hücreler (offset sırasıyla)"""
+        row = self.neighbor_cells[cell]
+        return row[row >= 0].tolist()
+
+    def neighbour_table(self, order):
+        """(N, 4) komşu point numaraları, var olanlar başta, kalanlar -1"""
+        rows = self.neighbor_cells[order]
+        rows = np.take_along_axis(rows, np.argsort(rows < 0, axis=1, kind="stable"), axis=1)
+        return np.where(rows >= 0, self.point_at[rows], -1)
+
+
+class LevelGrid:
+    """
+    Tek bir level'in array tabanlı durumu.
+
+    tiles:  (height, width) uint8 tile ID'leri
+    room:   (height, width) int32 'class' attribute'u
+    path:   (height, width) bool 'path' point grubu
+    order:  geo.points() sırasındaki flat hücre indeksleri
+    origin: (x, z) grid'in sol alt köşesinin world koordinatı (point P'sinin yuvarlanmışı)
+    offset: (x, z) point P'lerinin origin'e göre kesirli kayması (grid1'de z + 0.4975)
+    positions: geometriden okunan gerçek (x, z) P değerleri, point sırasıyla (yoksa offset'ten)
+    index:  (x, z) -> point numarası / komşuluk indeksi
+    """
+
+    def __init__(self, width, height, origin=(0, 0), order=None, offset=(0.0, 0.0), positions=None):
+        self.width = int(width)
+        self.height = int(height)
+        self.origin = (int(origin[0]), int(origin[1]))
+        self.offset = (float(offset[0]), float(offset[1]))
+        self.positions = None if positions is None else np.asarray(positions, dtype=np.float64)
+        self.tiles = np.full((self.height, self.width), WALL, dtype=np.uint8)
+        self.room = np.zeros((self.height, self.width), dtype=np.int32)
+        self.path = np.zeros((self.height, self.width), dtype=bool)
+        if order is None:
+            order = np.arange(self.width * self.height, dtype=np.int64)
+        self.order = np.asarray(order, dtype=np.int64)
+        self.index = GridIndex(self.width, self.height, self.order)
+
+    @property
+    def size(self):
+        return self.width * self.height
+
+    def point_numbers(self):
+        """Flat hücre indeksi -> point numarası (olmayan hücreler -1)"""
+        return self.index.point_at
+
+    def present(self):
+        """Geometride karşılığı olan hücreler (height, width) maskesi"""
+        return (self.index.point_at >= 0).reshape(self.height, self.width)
+
+    def world_xz(self, cells):
+        """Flat hücre indekslerinin world (x, z) koordinatları"""
+        cells = np.asarray(cells, dtype=np.int64)
+        return cells % self.width + self.origin[0], cells // self.width + self.origin[1]
+
+    def world_positions(self, cells):
+        """Flat hücre indekslerinin point P (x, z) değerleri (Houdini gibi float32'ye yuvarlanmış)"""
+        if self.positions is not None:
+            points = self.index.point_at[np.asarray(cells, dtype=np.int64)]
+            return self.positions[points, 0], self.positions[points, 1]
+        xs, zs = self.world_xz(cells)
+        xs = (xs + self.offset[0]).astype(np.float32).astype(np.float64)
+        zs = (zs + self.offset[1]).astype(np.float32).astype(np.float64)
+        return xs, zs
+
+    def cells_of(self, tile_id):
+        """Verilen tile ID'sine sahip hücreler (geo.points() sırasında)"""
+        flat = self.tiles.reshape(-1)
+        return self.order[flat[self.order] == tile_id]
+
+    def copy(self):
+        clone = LevelGrid(self.width, self.height, self.origin, self.order.copy(), self.offset, self.positions)
+        clone.tiles[:] = self.tiles
+        clone.room[:] = self.room
+        clone.path[:] = self.path
+        return clone
+
+
+def neighbour_table(grid):
+    """2_5_CONNECT_ROOMS 'neighbours' attribute'u: (N, 4) point numaraları"""
+    return grid.index.neighbour_table(grid.order)
+
+
+# Prim komşuluğu (aynı quad'ı paylaşan noktalar): 4 yön + çaprazlar
+PRIM_OFFSETS = ((1, 0), (0, 1), (1, 1), (-1, 1))
+
+
+def prim_neighbour_any(mask):
+    """
+    Prim komşuluğunda (8 yön, grid sınırı içinde) en az bir komşusu mask'te olan hücreler.
+    Shift-and-OR: offset başına dilimlenmiş tek bir OR, hücre başına döngü yok.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    height, width = mask.shape
+    result = np.zeros_like(mask)
+    for dx, dz in PRIM_OFFSETS:
+        for sx, sz in ((dx, dz), (-dx, -dz)):
+            # result[z, x] |= mask[z + sz, x + sx]
+            result[max(-sz, 0):height - max(sz, 0), max(-sx, 0):width - max(sx, 0)] |= \
+                mask[max(sz, 0):height - max(-sz, 0), max(sx, 0):width - max(-sx, 0)]
+    return result
+
+
+def edge_wall_mask(grid):
+    """Kenar duvarlar (H, W): en az bir prim komşusu duvar olmayan duvar hücreleri"""
+    walls = grid.tiles == WALL
+    return walls & prim_neighbour_any(~walls)
+
+
+def label_components(grid, mask):
+    """
+    Bağlı bileşen etiketleme (prim komşuluğu, 8 yön), vektörize union-find.
+    Kenar listesi tek seferde çıkarılır; her turda kökler min-label ile
+    birleştirilir ve pointer jumping ile sıkıştırılır (tur sayısı ~log N).
+
+    Etiketler level_utils.find_rooms ile aynı sırada verilir: ilk noktası
+    geo.points() sırasında önce gelen bileşen 0 olur. Üye olmayan hücreler -1.
+    """
+    member = np.asarray(mask, dtype=bool).reshape(-1) & (grid.index.point_at >= 0)
+    width, height = grid.width, grid.height
+    cells = np.arange(grid.size, dtype=np.int64)
+    xs, zs = cells % width, cells // width
+
+    # --- 1. Kenarlar (her komşu çifti bir kez) ---
+    edge_a, edge_b = [], []
+    for ox, oz in PRIM_OFFSETS:
+        nx, nz = xs + ox, zs + oz
+        ok = member & (0 <= nx) & (nx < width) & (nz < height)
+        ok[ok] = member[(nz * width + nx)[ok]]
+        edge_a.append(cells[ok])
+        edge_b.append((nz * width + nx)[ok])
+    edge_a = np.concatenate(edge_a)
+    edge_b = np.concatenate(edge_b)
+
+    # --- 2. Union-find (hooking + pointer jumping) ---
+    parent = cells.copy()
+    while True:
+        root_a, root_b = parent[edge_a], parent[edge_b]
+        differ = root_a != root_b
+        if not differ.any():
+            break
+        high = np.maximum(root_a[differ], root_b[differ])
+        low = np.minimum(root_a[differ], root_b[differ])
+        np.minimum.at(parent, high, low)
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+
+    # --- 3. Kökleri geo.points() sırasına göre 0..k-1 olarak numarala ---
+    ranks = grid.index.point_at
+    member_cells = cells[member]
+    roots = parent[member_cells]
+    first_rank = np.full(grid.size, np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(first_rank, roots, ranks[member_cells])
+    unique_roots = np.unique(roots)
+    root_order = unique_roots[np.argsort(first_rank[unique_roots], kind="stable")]
+    root_label = np.full(grid.size, -1, dtype=np.int64)
+    root_label[root_order] = np.arange(root_order.size)
+
+    labels = np.full(grid.size, -1, dtype=np.int32)
+    labels[member_cells] = root_label[roots]
+    return labels.reshape(height, width), int(root_order.size)
+
+
+def component_stats(grid, labels, count):
+    """Her bileşen için alan, bounding box (world x/z) ve centroid"""
+    flat = labels.reshape(-1)
+    cells = np.flatnonzero(flat >= 0)
+    ids = flat[cells]
+    xs, zs = grid.world_xz(cells)
+
+    area = np.bincount(ids, minlength=count)
+    sum_x = np.bincount(ids, weights=xs, minlength=count)
+    sum_z = np.bincount(ids, weights=zs, minlength=count)
+    min_x = np.full(count, np.iinfo(np.int64).max, dtype=np.int64)
+    min_z = min_x.copy()
+    max_x = np.full(count, np.iinfo(np.int64).min, dtype=np.int64)
+    max_z = max_x.copy()
+    np.minimum.at(min_x, ids, xs)
+    np.minimum.at(min_z, ids, zs)
+    np.maximum.at(max_x, ids, xs)
+    np.maximum.at(max_z, ids, zs)
+
+    return [
+        {
+            "class": room_id,
+            "area": int(area[room_id]),
+            "bbox": (int(min_x[room_id]), int(min_z[room_id]), int(max_x[room_id]), int(max_z[room_id])),
+            "centroid": (sum_x[room_id] / area[room_id], sum_z[room_id] / area[room_id]),
+        }
+        for room_id in range(count)
+    ]
+
+
+def label_rooms(grid, tile_id=EMPTY):
+    """Odaları etiketle: grid.room'a class yaz, oda istatistiklerini döndür"""
+    labels, count = label_components(grid, grid.tiles == tile_id)
+    rooms = labels >= 0
+    grid.room[rooms] = labels[rooms]
+    return component_stats(grid, labels, count)
+
+
+# --------------------------
+# 2) STAGE'LER
+# --------------------------
+
+def initialize_map(grid):
+    """1_INITIALIZE_MAP: bütün hücreleri 'wall' yap"""
+    grid.tiles[:] = WALL
+    return grid
+
+
+def carve_rooms(grid, params):
+    """2_CARVE_ROOMS: odaları noise ile carve et, carve edilen oda sayısını döndür"""
+    rng = random.Random(params["seed"])
+    room_count = int(params["room_count"])
+    min_room_size = int(params["min_room_size"])
+    max_room_size = int(params["max_room_size"])
+    noise_scale = float(params["noise_scale"])
+
+    grid.room[:] = 0
+    grid.tiles[:] = WALL
+
+    # Harita sınırları (bbox, script'teki gibi int() ile kesilir); oda testi ve noise float P ile
+    xs, zs = grid.world_positions(grid.order)
+    min_x, max_x = int(xs.min()), int(xs.max())
+    min_z, max_z = int(zs.min()), int(zs.max())
+    tiles = grid.tiles.reshape(-1)
+    rooms = grid.room.reshape(-1)
+
+    room_id = 0
+    for _ in range(room_count):
+        room_w = rng.randint(min_room_size, max_room_size)
+        room_h = rng.randint(min_room_size, max_room_size)
+        room_x = rng.randint(min_x, max_x - room_w)
+        room_z = rng.randint(min_z, max_z - room_h)
+
+        room_id += 1
+        inside = (room_x <= xs) & (xs < room_x + room_w) & (room_z <= zs) & (zs < room_z + room_h)
+        # random() çekimleri geo.points() sırasında, oda içindeki her nokta için bir tane
+        carved = [
+            cell for cell, x, z in zip(grid.order[inside].tolist(), xs[inside].tolist(), zs[inside].tolist())
+            if math.sin((x + z) * noise_scale + rng.random() * 2.0) > 0
+        ]
+        tiles[carved] = EMPTY
+        rooms[carved] = room_id
+
+    return room_id
+
+
+def boundary_cells(grid, cells):
+    """Kümenin sınır hücreleri: en az bir 4 yönlü komşusu kümede olmayanlar (sıra korunur)"""
+    member = np.zeros(grid.size, dtype=bool)
+    member[cells] = True
+    neighbor_cells = grid.index.neighbor_cells[cells]
+    outside = (neighbor_cells < 0) | ~member[neighbor_cells]
+    return cells[outside.any(axis=1)]
+
+
+class SortedCellIndex:
+    """x'e göre sıralı hücre indeksi; pencere içi en yakın hücre sorgusu"""
+
+    def __init__(self, grid, cells):
+        ranks = grid.point_numbers()[cells]
+        xs, zs = grid.world_xz(cells)
+        sort = np.lexsort((ranks, xs))
+        self.cells = cells[sort]
+        self.xs = xs[sort]
+        self.zs = zs[sort]
+        self.ranks = ranks[sort]
+
+    def nearest(self, x, z, max_dist2):
+        """(x, z)'ye en yakın hücre: (dist2, rank, cell), max_dist2'den uzaksa None"""
+        reach = math.isqrt(max_dist2) if max_dist2 is not None else None
+        lo = 0 if reach is None else np.searchsorted(self.xs, x - reach, side="left")
+        hi = self.xs.size if reach is None else np.searchsorted(self.xs, x + reach, side="right")
+        if lo >= hi:
+            return None
+        dist2 = (self.xs[lo:hi] - x) ** 2 + (self.zs[lo:hi] - z) ** 2
+        best = int(dist2.min())
+        if max_dist2 is not None and best > max_dist2:
+            return None
+        hits = np.flatnonzero(dist2 == best)
+        k = lo + int(hits[np.argmin(self.ranks[lo:hi][hits])])
+        return best, int(self.ranks[k]), int(self.cells[k])
+
+
+def closest_cell_pair(grid, cells_a, cells_b):
+    """
+    İki hücre kümesi arasındaki en yakın çift (A, B sırasında ilk bulunan minimum).
+
+    En yakın çiftin iki ucu da her zaman kümelerin sınırındadır (iç hücreden
+    karşı tarafa bir adım atan komşu yine kümededir ve daha yakındır), bu yüzden
+    sadece sınır hücreleri karşılaştırılır. Küçük sınır dolaşılır, büyük sınır
+    x'e göre sıralı indeksle pencere içinde aranır.
+    """
+    edge_a = boundary_cells(grid, cells_a)
+    edge_b = boundary_cells(grid, cells_b)
+    swap = edge_a.size > edge_b.size
+    outer, inner = (edge_b, edge_a) if swap else (edge_a, edge_b)
+
+    index = SortedCellIndex(grid, inner)
+    outer_ranks = grid.point_numbers()[outer]
+    outer_xs, outer_zs = grid.world_xz(outer)
+
+    # Anahtar: (dist2, A rank, B rank) -> eski çift döngüsündeki ilk minimum
+    best_key, best_pair = None, None
+    for cell, rank, x, z in zip(outer.tolist(), outer_ranks.tolist(), outer_xs.tolist(), outer_zs.tolist()):
+        found = index.nearest(x, z, best_key[0] if best_key else None)
+        if found is None:
+            continue
+        dist2, inner_rank, inner_cell = found
+        key = (dist2, inner_rank, rank) if swap else (dist2, rank, inner_rank)
+        if best_key is None or key < best_key:
+            best_key = key
+            best_pair = (inner_cell, cell) if swap else (cell, inner_cell)
+
+    return best_pair
+
+
+def frontier_step(adjacency, frontier, visited):
+    """
+    Level-synchronous BFS adımı: frontier'ın ziyaret edilmemiş komşuları, kuyruk sırasıyla.
+    adjacency (N, 4) -1 dolgulu; aynı komşuyu bulan ilk frontier hücresi ebeveyn olur
+    (deque + offset sırasıyla çalışan BFS ile aynı ağaç). Dönüş: (yeni hücreler, ebeveynleri)
+    """
+    candidates = adjacency[frontier].reshape(-1)
+    parents = np.repeat(frontier, adjacency.shape[1])
+    keep = candidates >= 0
+    candidates, parents = candidates[keep], parents[keep]
+    keep = ~visited[candidates]
+    candidates, parents = candidates[keep], parents[keep]
+    _, first = np.unique(candidates, return_index=True)
+    first.sort()
+    return candidates[first], parents[first]
+
+
+def carve_corridor(grid, start_cell, end_cell):
+    """BFS ile start -> end yolunu bul, yol üzerindeki duvarları aç"""
+    adjacency = grid.index.neighbor_cells
+    came_from = np.full(grid.size, -2, dtype=np.int32)
+    came_from[start_cell] = -1
+    visited = np.zeros(grid.size, dtype=bool)
+    visited[start_cell] = True
+    frontier = np.array([start_cell], dtype=np.int32)
+    while frontier.size and not visited[end_cell]:
+        frontier, parents = frontier_step(adjacency, frontier, visited)
+        visited[frontier] = True
+        came_from[frontier] = parents
+
+    if came_from[end_cell] == -2:
+        return []
+
+    path = []
+    cur = end_cell
+    while cur != -1:
+        path.append(cur)
+        cur = int(came_from[cur])
+    path.reverse()
+
+    tiles = grid.tiles.reshape(-1)
+    path_cells = np.array(path, dtype=np.int64)
+    tiles[path_cells[tiles[path_cells] == WALL]] = EMPTY
+    return path
+
+
+def connect_rooms(grid):
+    """2_5_CONNECT_ROOMS: ardışık class ID'lerine sahip odaları koridorla bağla"""
+    rooms = grid.room.reshape(-1)[grid.order]
+    valid = rooms >= 0
+    # Odaları tek seferde grupla (stable sort -> geo.points() sırası korunur)
+    sort = np.argsort(rooms[valid], kind="stable")
+    room_ids, starts = np.unique(rooms[valid][sort], return_index=True)
+    room_cells = np.split(grid.order[valid][sort], starts[1:])
+
+    for i in range(len(room_ids) - 1):
+        start_cell, end_cell = closest_cell_pair(grid, room_cells[i], room_cells[i + 1])
+        carve_corridor(grid, start_cell, end_cell)
+
+    return len(room_ids)
+
+
+def traversable_graph(grid):
+    """
+    Traversable hücreler (empty / player / stairs, geo.points() sırasında)
+    ve kompakt indekslerle komşuluk listeleri.
+    """
+    tiles = grid.tiles.reshape(-1)
+    traversable = grid.order[np.isin(tiles[grid.order], (EMPTY, PLAYER, STAIRS))]
+
+    cell_to_idx = np.full(grid.size, -1, dtype=np.int32)
+    cell_to_idx[traversable] = np.arange(traversable.size, dtype=np.int32)
+    neighbor_cells = grid.index.neighbor_cells[traversable]
+    adjacency = np.where(neighbor_cells >= 0, cell_to_idx[neighbor_cells], -1)
+    return traversable, adjacency
+
+
+def bfs_distances(adjacency, source):
+    """Tek kaynaktan BFS mesafeleri (ulaşılamayan = -1), level başına tek array adımı"""
+    dist = np.full(adjacency.shape[0], -1, dtype=np.int64)
+    dist[source] = 0
+    visited = np.zeros(adjacency.shape[0], dtype=bool)
+    visited[source] = True
+    frontier = np.array([source], dtype=np.int32)
+    level = 0
+    while frontier.size:
+        level += 1
+        frontier, _ = frontier_step(adjacency, frontier, visited)
+        visited[frontier] = True
+        dist[frontier] = level
+    return dist
+
+
+def batched_bfs_distances(adjacency, sources):
+    """
+    Birden çok kaynaktan aynı anda BFS: (len(sources), N) int32 mesafe matrisi (ulaşılamayan = -1).
+    Bütün kaynakların frontier'ları tek flat indeks array'inde (kaynak * N + hücre) ilerler.
+    """
+    num_pts = adjacency.shape[0]
+    count = len(sources)
+    dist = np.full(count * num_pts, -1, dtype=np.int32)
+    frontier = np.arange(count, dtype=np.int64) * num_pts + np.asarray(sources, dtype=np.int64)
+    dist[frontier] = 0
+    owner = np.empty(count * num_pts, dtype=np.int64)
+    level = 0
+    while frontier.size:
+        level += 1
+        offsets = frontier - frontier % num_pts
+        neighbors = adjacency[frontier % num_pts]
+        candidates = (offsets[:, None] + neighbors)[neighbors >= 0]
+        candidates = candidates[dist[candidates] < 0]
+        # Aynı hücreyi bulan frontier'lardan biri kalır (mesafe için sıra önemsiz)
+        owner[candidates] = np.arange(candidates.size)
+        frontier = candidates[owner[candidates] == np.arange(candidates.size)]
+        dist[frontier] = level
+    return dist.reshape(count, num_pts)
+
+
+def place_player_and_exit(grid, params):
+    """
+    3_PLACE_PLAYER_AND_EXIT: hedef mesafeye uyan player/stairs çiftini seç.
+
+    All-pairs distance matrix yerine kaynaklar PAIR_BATCH_CELLS'lik bloklar halinde,
+    tek geçişte işlenir. Her satır (i < j) için sadece özetler tutulur: satır maksimumu ve
+    ilk yeri, min_player_exit_dist bandındaki ve maksimum / maksimum - 1 mesafedeki çift sayıları.
+    Hedef mesafe ve aday sayısı bu özetlerden çıkar; random.choice(candidates) ile aynı
+    indeks çekilir ve seçilen satırın BFS'i bir kez daha yapılır. Bellek O(N).
+    """
+    rng = random.Random(params["seed"] + 1)
+    min_dist_param = params["min_player_exit_dist"]
+
+    traversable, adjacency = traversable_graph(grid)
+    num_pts = traversable.size
+    if num_pts == 0:
+        raise Exception("No traversable tiles for player/exit placement!")
+
+    row_max = np.full(num_pts, -1, dtype=np.int64)
+    row_argmax = np.zeros(num_pts, dtype=np.int64)
+    param_count = np.zeros(num_pts, dtype=np.int64)
+    top_count = np.zeros(num_pts, dtype=np.int64)
+    next_count = np.zeros(num_pts, dtype=np.int64)
+
+    batch = max(1, PAIR_BATCH_CELLS // num_pts)
+    columns = np.arange(num_pts)
+    for first in range(0, num_pts, batch):
+        rows = np.arange(first, min(first + batch, num_pts))
+        dist = batched_bfs_distances(adjacency, rows)
+        # Sadece i < j çiftleri, ulaşılamayanlar -1
+        dist[columns[None, :] <= rows[:, None]] = -1
+        reachable = dist >= 0
+        block_max = dist.max(axis=1)
+        is_top = reachable & (dist == block_max[:, None])
+        row_max[rows] = block_max
+        row_argmax[rows] = np.argmax(is_top, axis=1)
+        param_count[rows] = np.count_nonzero(reachable & (np.abs(dist - min_dist_param) <= 1), axis=1)
+        top_count[rows] = np.count_nonzero(is_top, axis=1)
+        next_count[rows] = np.count_nonzero(reachable & (dist == block_max[:, None] - 1), axis=1)
+
+    # --- Maksimum mesafe (ilk bulunan çift, eski i < j döngüsü gibi) ---
+    max_dist = max(int(row_max.max()), 0)
+    best_pair = (0, 0)
+    if max_dist > 0:
+        best_row = int(np.argmax(row_max == max_dist))
+        best_pair = (best_row, int(row_argmax[best_row]))
+
+    # --- min_player_exit_dist'e göre aday seç (tolerans 1 birim) ---
+    target_dist = min(min_dist_param, max_dist)
+    if target_dist == min_dist_param:
+        counts = param_count
+    else:
+        # target = max_dist: bant sadece max_dist - 1 ve max_dist mesafeleri
+        counts = (np.where(row_max == max_dist, top_count + next_count, 0)
+                  + np.where(row_max == max_dist - 1, top_count, 0))
+    candidate_count = int(counts.sum())
+
+    player_idx, exit_idx = best_pair
+    distance = max_dist
+    if candidate_count:
+        pick = rng.randrange(candidate_count)
+        cumulative = np.cumsum(counts)
+        player_idx = int(np.searchsorted(cumulative, pick, side="right"))
+        pick -= int(cumulative[player_idx] - counts[player_idx])
+        row = bfs_distances(adjacency, player_idx)[player_idx + 1:]
+        hits = np.flatnonzero((row >= 0) & (np.abs(row - target_dist) <= 1))
+        exit_idx = player_idx + 1 + int(hits[pick])
+        distance = int(row[hits[pick]])
+
+    tiles = grid.tiles.reshape(-1)
+    tiles[traversable[player_idx]] = PLAYER
+    tiles[traversable[exit_idx]] = STAIRS
+    return int(traversable[player_idx]), int(traversable[exit_idx]), distance
+
+
+def place_exit_from(grid, params, player_cell):
+    """
+    Player hücresi sabitken (ör. tower'da alt katın stairs'i) sadece stairs'i seç.
+    Tek kaynaklı BFS: hedef mesafe min(min_player_exit_dist, maksimum mesafe), tolerans 1 birim.
+    Player hücresi duvarsa ya da hedef mesafe bileşeni içinde yoksa, en yakın ulaşılamayan
+    traversable hücreye koridor açılır (bileşenler birleşene kadar).
+    """
+    rng = random.Random(params["seed"] + 1)
+    target_param = int(params["min_player_exit_dist"])
+    tiles = grid.tiles.reshape(-1)
+    tiles[player_cell] = PLAYER
+    px, pz = player_cell % grid.width, player_cell // grid.width
+
+    while True:
+        traversable, adjacency = traversable_graph(grid)
+        dist = bfs_distances(adjacency, int(np.flatnonzero(traversable == player_cell)[0]))
+        max_dist = int(dist.max())
+        unreached = traversable[dist < 0]
+        if max_dist >= target_param or unreached.size == 0:
+            break
+        manhattan = np.abs(unreached % grid.width - px) + np.abs(unreached // grid.width - pz)
+        carve_corridor(grid, player_cell, int(unreached[np.argmin(manhattan)]))
+
+    if max_dist == 0:
+        raise Exception("No reachable exit tile from player spawn!")
+
+    target_dist = min(target_param, max_dist)
+    candidates = np.flatnonzero((dist > 0) & (np.abs(dist - target_dist) <= 1))
+    exit_idx = int(candidates[rng.randrange(candidates.size)])
+    tiles[traversable[exit_idx]] = STAIRS
+    return int(player_cell), int(traversable[exit_idx]), int(dist[exit_idx])
+
+
+def weighted_shortest_path(grid, start_cell, end_cell, wall_cost=WALL_PATH_COST):
+    """
+    Tile array üzerinde Dijkstra (binary heap). Bir hücreye girme maliyeti:
+    wall = wall_cost, diğerleri = 1. Yol yoksa [] döner.
+    """
+    step_cost = np.where(grid.tiles.reshape(-1) == WALL, wall_cost, 1.0).tolist()
+    # Komşu tablosu bir kez Python listesine (pop başına NumPy slice'ı yok), -1 = komşu yok
+    neighbor_cells = grid.index.neighbor_cells.tolist()
+    dist = [math.inf] * grid.size
+    came_from = [-1] * grid.size
+    dist[start_cell] = 0.0
+    heap = [(0.0, start_cell)]
+    while heap:
+        d, current = heapq.heappop(heap)
+        if current == end_cell:
+            break
+        if d > dist[current]:
+            continue
+        for neighbor in neighbor_cells[current]:
+            if neighbor < 0:
+                continue
+            nd = d + step_cost[neighbor]
+            if nd < dist[neighbor]:
+                dist[neighbor] = nd
+                came_from[neighbor] = current
+                heapq.heappush(heap, (nd, neighbor))
+
+    if dist[end_cell] == math.inf:
+        return []
+
+    path = [end_cell]
+    while path[-1] != start_cell:
+        path.append(came_from[path[-1]])
+    path.reverse()
+    return path
+
+
+def guarantee_path(grid):
+    """
+    3_5_GUARANTEE_PATH: player -> stairs en ucuz yolu (wall maliyeti 1000).
+    Yol 'path' olarak işaretlenir, yol üzerindeki duvarlar açılır.
+    Player / stairs birden fazlaysa eski script gibi sonuncusu kullanılır.
+    """
+    players = grid.cells_of(PLAYER)
+    exits = grid.cells_of(STAIRS)
+    if players.size == 0 or exits.size == 0:
+        return []
+
+    path = weighted_shortest_path(grid, int(players[-1]), int(exits[-1]))
+    if not path:
+        return []
+
+    tiles = grid.tiles.reshape(-1)
+    path_cells = np.array(path, dtype=np.int64)
+    grid.path[:] = False
+    grid.path.reshape(-1)[path_cells] = True
+    tiles[path_cells[tiles[path_cells] == WALL]] = EMPTY
+    return path
+
+
+def categorize(grid):
+    """
+    Hücreleri tile ID'sine göre tek geçişte grupla (uint8 stable sort):
+    {tile_id: hücreler (geo.points() sırasında)}, bütün tile ID'leri için.
+    """
+    ordered = grid.tiles.reshape(-1)[grid.order]
+    counts = np.bincount(ordered, minlength=len(TILE_TYPES))
+    bounds = np.concatenate(([0], np.cumsum(counts)))
+    cells = grid.order[np.argsort(ordered, kind="stable")]
+    return {tile_id: cells[bounds[tile_id]:bounds[tile_id + 1]] for tile_id in range(len(TILE_TYPES))}
+
+
+def sample_cells(rng, cells, k):
+    """rng.sample(cells.tolist(), k) ile aynı seçim, Python listesi kurmadan"""
+    return cells[rng.sample(range(cells.size), k)]
+
+
+def place_enemies(grid, params, categories=None):
+    """5_PLACE_ENEMIES: boş alanların en fazla %15'ine düşman yerleştir"""
+    rng = random.Random(params["seed"] + 2)
+    enemy_density = float(params["enemy_density"])
+
+    suitable_empty = (categories or categorize(grid))[EMPTY]
+    if not suitable_empty.size or enemy_density <= 0:
+        return 0
+
+    max_possible_enemies = int(suitable_empty.size * 0.15)
+    num_to_place = int(max_possible_enemies * enemy_density)
+    if num_to_place <= 0 or suitable_empty.size < num_to_place:
+        return 0
+
+    picks = sample_cells(rng, suitable_empty, num_to_place)
+    # %20 atıcı, %80 normal düşman (her seçimden sonra bir random(), eski sırayla aynı)
+    shooters = np.array([rng.random() < 0.2 for _ in range(num_to_place)], dtype=bool)
+    grid.tiles.reshape(-1)[picks] = np.where(shooters, ENEMY_SHOOTER, ENEMY)
+    return num_to_place
+
+
+class AliasTable:
+    """
+    Walker / Vose alias tablosu: k ağırlıklı kategori, kurulum O(k), çekiliş başına O(1).
+    Tek uniform sayı hem sütunu hem de sütun içi seçimi belirler.
+    """
+
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=np.float64)
+        k = weights.size
+        total = weights.sum()
+        if k == 0 or total <= 0:
+            raise ValueError("AliasTable needs at least one positive weight")
+
+        scaled = weights * (k / total)
+        prob = np.ones(k, dtype=np.float64)
+        alias = np.arange(k, dtype=np.int64)
+        small = [i for i in range(k) if scaled[i] < 1.0]
+        large = [i for i in range(k) if scaled[i] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+        self.prob = prob
+        self.alias = alias
+
+    def __len__(self):
+        return self.prob.size
+
+    def draw(self, np_rng, size):
+        """size adet kategori indeksi (vektörize)"""
+        scaled = np_rng.random(size) * self.prob.size
+        column = scaled.astype(np.int64)
+        return np.where(scaled - column < self.prob[column], column, self.alias[column])
+
+
+class LootSystem:
+    """
+    6_CREATE_INTERACTABLES soyut loot sistemi (tile array üzerinde).
+    Örnekler: powerup, trap, key, bomb_upgrade, speed_boost vb.
+
+    Toplam loot sayısı tür yoğunluklarından gelir; her loot hücresinin türü
+    ratio * yoğunluk ağırlıklı alias tablosundan çekilir (tür sayısından bağımsız O(1)).
+    """
+
+    def __init__(self):
+        self.loot_types = {}
+        self.total_ratio = 0
+        self._alias_cache = {}
+
+    def add_loot_type(self, name, ratio, tile_id):
+        """Yeni loot türü ekle
+        name: loot türünün adı (coin, health, powerup vs.)
+        ratio: nispi oran (2.0 = 2x daha sık)
+        tile_id: tile array'e yazılacak tile ID'si
+        """
+        self.loot_types[name] = {
+            'ratio': ratio,
+            'tile_id': tile_id,
+            'normalized_ratio': 0  # Hesaplanacak
+        }
+        self._update_ratios()
+
+    def _update_ratios(self):
+        """Oranları normalize et"""
+        self.total_ratio = sum(loot['ratio'] for loot in self.loot_types.values())
+        for loot in self.loot_types.values():
+            loot['normalized_ratio'] = loot['ratio'] / self.total_ratio if self.total_ratio > 0 else 0
+        self._alias_cache.clear()
+
+    def get_loot_counts(self, total_points, individual_densities, global_density):
+        """Her loot türü için yoğunluktan gelen sayı (toplam loot bütçesi bunların toplamı)"""
+        counts = {}
+        for name, loot_data in self.loot_types.items():
+            individual_density = individual_densities.get(name, 0.5)
+            effective_density = individual_density * (global_density * 0.1)
+            counts[name] = {
+                'count': int(total_points * effective_density),
+                'tile_id': loot_data['tile_id'],
+                'ratio': loot_data['ratio'],
+                'density': individual_density,
+            }
+        return counts
+
+    def sampler(self, loot_counts):
+        """Tür ağırlıkları (normalized_ratio * yoğunluk) için alias tablosu; (isimler, tile ID'leri, tablo)"""
+        names = [name for name in loot_counts if self.loot_types[name]['normalized_ratio'] * loot_counts[name]['density'] > 0]
+        weights = tuple(self.loot_types[name]['normalized_ratio'] * loot_counts[name]['density'] for name in names)
+        key = (tuple(names), weights)
+        if key not in self._alias_cache:
+            table = AliasTable(weights) if names else None
+            tile_ids = np.array([loot_counts[name]['tile_id'] for name in names], dtype=np.uint8)
+            self._alias_cache[key] = (names, tile_ids, table)
+        return self._alias_cache[key]
+
+    def place_loot_with_ratios(self, tiles, available_cells, loot_counts, rng):
+        """
+        Loot bütçesi kadar hücreyi rng ile seç, türlerini alias tablosundan toplu çek.
+        available_cells: hücre array'i (geo.points() sırasında); sonuç {tür: yerleşen sayı}
+        """
+        available_cells = np.asarray(available_cells, dtype=np.int64)
+        results = {name: 0 for name in loot_counts}
+        names, tile_ids, table = self.sampler(loot_counts)
+        budget = min(sum(data['count'] for data in loot_counts.values()), available_cells.size)
+        if table is None or budget <= 0:
+            return results
+
+        picks = sample_cells(rng, available_cells, budget)
+        kinds = table.draw(np.random.default_rng(rng.getrandbits(64)), budget)
+        tiles[picks] = tile_ids[kinds]
+        for name, placed in zip(names, np.bincount(kinds, minlength=len(names)).tolist()):
+            results[name] = placed
+        return results
+
+    def place_batch(self, np_rng, empty_counts, individual_densities, global_density):
+        """
+        Birçok level için tek vektörize çağrı.
+        empty_counts: level başına boş hücre sayısı
+        Dönüş: (level indeksi, level'ın boş hücre listesindeki sıra, tile ID) array'leri
+        """
+        empty_counts = np.asarray(empty_counts, dtype=np.int64)
+        loot_counts = self.get_loot_counts(0, individual_densities, global_density)
+        names, tile_ids, table = self.sampler(loot_counts)
+        if table is None or empty_counts.size == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, np.zeros(0, dtype=np.uint8)
+
+        # Level başına bütçe: get_loot_counts ile aynı yuvarlama
+        budgets = np.zeros_like(empty_counts)
+        for name in loot_counts:
+            effective_density = loot_counts[name]['density'] * (global_density * 0.1)
+            budgets += (empty_counts * effective_density).astype(np.int64)
+        budgets = np.minimum(budgets, empty_counts)
+
+        # Her level'da bütçe kadar farklı hücre: rastgele anahtarların en küçükleri
+        levels = np.repeat(np.arange(empty_counts.size), empty_counts)
+        starts = np.concatenate(([0], np.cumsum(empty_counts)[:-1]))
+        order = np.lexsort((np_rng.random(levels.size), levels))
+        rank_in_level = np.arange(levels.size) - starts[levels]
+        chosen = order[rank_in_level < budgets[levels]]
+
+        chosen_levels = levels[chosen]
+        kinds = table.draw(np_rng, chosen.size)
+        return chosen_levels, chosen - starts[chosen_levels], tile_ids[kinds]
+
+
+def default_loot_system():
+    """Mevcut loot türleri (2x coin ratio ile)"""
+    loot_system = LootSystem()
+    loot_system.add_loot_type("coin", 2.0, COIN)
+    loot_system.add_loot_type("health", 1.0, HEALTH)
+    return loot_system
+
+
+def create_interactables(grid, params, loot_system=None, categories=None):
+    """6_CREATE_INTERACTABLES: loot ve kırılabilir duvarları yerleştir"""
+    rng = random.Random(params["seed"] + 3)
+    loot_density = float(params["loot_density"])
+    breakable_density = float(params["breakable_density"])
+    edge_wall_bias = float(params["edge_wall_bias"])
+    if loot_system is None:
+        loot_system = default_loot_system()
+
+    tiles = grid.tiles.reshape(-1)
+    results = {}
+    # Boş ve duvar hücreleri tek geçişte (loot duvarlara dokunmaz, duvar kümesi değişmez)
+    categories = categories or categorize(grid)
+
+    # --- Loot ---
+    empty_cells = categories[EMPTY]
+    if loot_density > 0 and empty_cells.size:
+        individual_densities = {
+            "coin": float(params["coin_density"]),
+            "health": float(params["health_density"]),
+        }
+        loot_counts = loot_system.get_loot_counts(empty_cells.size, individual_densities, loot_density)
+        results.update(loot_system.place_loot_with_ratios(tiles, empty_cells, loot_counts, rng))
+
+    # --- Kırılabilir duvarlar ---
+    if breakable_density > 0:
+        # Kenar / kalın duvar ayrımı tek mask'ten (geo.points() sırası korunur)
+        wall_cells = categories[WALL]
+        is_edge = edge_wall_mask(grid).reshape(-1)[wall_cells]
+        edge_wall_candidates = wall_cells[is_edge]
+        thick_wall_candidates = wall_cells[~is_edge]
+
+        total_candidates = wall_cells.size
+        total_to_convert = int(total_candidates * (breakable_density * 0.2))
+        num_from_edge = int(total_to_convert * edge_wall_bias)
+        num_from_thick = total_to_convert - num_from_edge
+        num_from_edge = min(num_from_edge, edge_wall_candidates.size)
+        num_from_thick = min(num_from_thick, thick_wall_candidates.size)
+
+        edge_picks = sample_cells(rng, edge_wall_candidates, num_from_edge) if num_from_edge > 0 else []
+        thick_picks = sample_cells(rng, thick_wall_candidates, num_from_thick) if num_from_thick > 0 else []
+        tiles[edge_picks] = BREAKABLE
+        tiles[thick_picks] = BREAKABLE
+        results["breakable"] = len(edge_picks) + len(thick_picks)
+
+    return results
+
+
+def visualize(grid):
+    """4_VISUALIZE_MAP: tile ID'lerini char ve renk array'lerine çevir (path -> '1', player / stairs üstte kalır)"""
+    chars = CHAR_LUT[grid.tiles]
+    colors = COLOR_LUT[grid.tiles]
+    # Garanti yol player ve stairs hücrelerini de içerir; onlar yol işaretiyle ezilmez
+    path = grid.path & ~np.isin(grid.tiles, PATH_KEEP_TILES)
+    chars[path] = PATH_CHAR
+    colors[path] = PATH_COLOR
+    return chars, colors
+
+
+# --------------------------
+# 3) PIPELINE
+# --------------------------
+
+def controller_grid(params):
+    """CONTROLLER sizeX / sizeY için grid1 ile aynı point düzeninde LevelGrid ((sizeX + 1) x (sizeY + 1) point)"""
+    return LevelGrid(int(params["sizeX"]) + 1, int(params["sizeY"]) + 1, offset=GRID1_OFFSET)
+
+
+def generate_level(params=None):
+    """Bütün pipeline'ı (1 → 6) tek bir seed için çalıştır"""
+    params = resolve_params(params)
+    grid = controller_grid(params)
+    seed = params["seed"]
+    points = int(grid.order.size)
+
+    # Stage sırası SOP network'ü ile aynı (ölçümler stage_profiler'a)
+    with stage_profiler.stage("1_INITIALIZE_MAP", seed, points=points):
+        initialize_map(grid)
+    with stage_profiler.stage("2_CARVE_ROOMS", seed, points=points):
+        carve_rooms(grid, params)
+    with stage_profiler.stage("2_5_CONNECT_ROOMS", seed, points=points):
+        connect_rooms(grid)
+    with stage_profiler.stage("3_PLACE_PLAYER_AND_EXIT", seed, points=points):
+        place_player_and_exit(grid, params)
+    with stage_profiler.stage("3_5_GUARANTEE_PATH", seed, points=points):
+        guarantee_path(grid)
+    with stage_profiler.stage("5_PLACE_ENEMIES", seed, points=points):
+        place_enemies(grid, params)
+    with stage_profiler.stage("6_CREATE_INTERACTABLES", seed, points=points):
+        create_interactables(grid, params)
+    return grid
+
+
+MISSING_CHAR = "?"
+
+
+def char_codes(chars):
+    """Char array'ini (str veya uint8) uint8 ASCII kodlarına çevir; eksik hücreler 0"""
+    chars = np.asarray(chars)
+    if chars.dtype.kind == "U":
+        return np.ascontiguousarray(chars, dtype="<U1").view(np.uint32).astype(np.uint8)
+    if chars.dtype.kind == "S":
+        return np.ascontiguousarray(chars, dtype="S1").view(np.uint8)
+    return chars.astype(np.uint8, copy=False)
+
+
+def serialize_grid(chars):
+    """
+    Dense (height, width) char array'ini ASCII satırlarına çevir.
+    Eksik hücreler ("" / 0) '?' olur; bütün satırlar tek bir bytes join ile üretilir.
+    Dönüş: (satırlar, eksik hücre sayısı)
+    """
+    codes = char_codes(chars)
+    height, width = codes.shape
+    missing = codes == 0
+    missing_count = int(np.count_nonzero(missing))
+
+    buffer = np.full((height, width + 1), ord("\n"), dtype=np.uint8)
+    buffer[:, :width] = np.where(missing, ord(MISSING_CHAR), codes)
+    rows = buffer.tobytes().decode("ascii").split("\n")[:-1]
+    return rows, missing_count
+
+
+def prim_owner_cells(grid):
+    """
+    grid1 topolojisinde (height - 1, width - 1) prim'in ilk vertex'inin (sol alt köşe, point (c, r))
+    flat hücre indeksleri. 4_VISUALIZE_MAP prim'e bu point'in değerini yazar, my_exporter prim'leri okur.
+    """
+    rows = np.arange(grid.height - 1, dtype=np.int64)[:, None] * grid.width
+    return rows + np.arange(grid.width - 1, dtype=np.int64)
+
+
+def export_chars(grid):
+    """my_exporter'ın GRID_ASCII'si: prim başına owner point'inin char'ı, (height - 1, width - 1)"""
+    chars, _ = visualize(grid)
+    chars[~grid.present()] = ""
+    return chars.reshape(-1)[prim_owner_cells(grid)]
+
+
+def grid_to_ascii(grid):
+    """Grid'i export edilen ASCII satırlarına çevir (z min → z max, x soldan sağa, eksik hücre '?')"""
+    rows, _ = serialize_grid(export_chars(grid))
+    return rows
+
+
+if __name__ == "__main__":
+    level = generate_level()
+    print("\n".join(grid_to_ascii(level)))
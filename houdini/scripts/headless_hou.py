@@ -0,0 +1,929 @@
+"""
+Headless hou
+Stage script'lerinin kullandığı `hou` alt kümesinin Houdini'siz, array tabanlı karşılığı
+
+houdiniScripts/*.py dosyaları değiştirilmeden düz CPython'da (batch worker'larında,
+benchmark'larda) çalışsın diye `import hou` bu modüle yönlendirilir (install()).
+
+Depolama sütun bazlıdır, point / prim başına Python objesi tutulmaz:
+    - point attribute'ları: (n, size) NumPy array'i ("P" dahil)
+    - string attribute'ları: Houdini gibi string tablosu + int32 indeks array'i
+    - array attribute'ları (neighbours): (n, genişlik) array + uzunluk array'i
+    - prim'ler: CSR (prim başına başlangıç offset'i + düz point numarası array'i)
+    - gruplar: bool mask
+Point / Prim objeleri sadece (geometry, numara) taşıyan hafif view'lardır.
+
+Desteklenen alt küme: hou.pwd / hou.node / hou.expandString / hou.attribType / hou.attribData /
+hou.Vector3, Geometry (points, prims, point / prim attribute'ları, bulk getter / setter'lar,
+array attribute'ları, point grupları, clear / merge, intrinsicValue, boundingBox),
+Node (geometry, inputs, parm, cook), Parm (eval, set).
+
+Kullanım:
+    import headless_hou
+    grid = headless_hou.generate_level({"seed": 261, "sizeX": 25, "sizeY": 25})
+
+    headless_hou.build_network(params)          # /obj/main/CONTROLLER + stage node'ları
+    geo = headless_hou.node("/obj/main/4_VISUALIZE_MAP").geometry()
+"""
+
+import contextlib
+import io
+import math
+import os
+import posixpath
+import sys
+
+import numpy as np
+
+import grid_bridge
+import grid_engine
+
+
+DEFAULT_HIP = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NETWORK_PATH = "/obj/main"
+CONTROLLER_NAME = "CONTROLLER"
+GRID_NAME = "grid1"
+
+# main_leveldesign.hip'teki SOP zinciri (diagram.md); hip'te 4_VISUALIZE_MAP'in input'u
+# 6_CREATE_INTERACTABLES, exporter prim char'larını düşman / loot yerleştikten sonra okur
+STAGE_NODES = (
+    "1_INITIALIZE_MAP",
+    "2_CARVE_ROOMS",
+    "2_5_CONNECT_ROOMS",
+    "2_6_CLEANUP",
+    "3_PLACE_PLAYER_AND_EXIT",
+    "3_5_GUARANTEE_PATH",
+    "5_PLACE_ENEMIES",
+    "6_CREATE_INTERACTABLES",
+    "4_VISUALIZE_MAP",
+)
+
+
+class OperationFailed(Exception):
+    pass
+
+
+class attribType:
+    Point = "Point"
+    Prim = "Prim"
+    Vertex = "Vertex"
+    Global = "Global"
+
+
+class attribData:
+    Int = "Int"
+    Float = "Float"
+    String = "String"
+
+
+# --------------------------
+# Vector3 / BoundingBox
+# --------------------------
+
+class Vector3:
+    def __init__(self, *values):
+        if len(values) == 1:
+            values = tuple(values[0])
+        elif not values:
+            values = (0.0, 0.0, 0.0)
+        self._v = tuple(float(v) for v in values)
+
+    def __getitem__(self, index):
+        return self._v[index]
+
+    def __len__(self):
+        return 3
+
+    def __iter__(self):
+        return iter(self._v)
+
+    def __add__(self, other):
+        return Vector3(a + b for a, b in zip(self._v, other))
+
+    def __sub__(self, other):
+        return Vector3(a - b for a, b in zip(self._v, other))
+
+    def __mul__(self, scalar):
+        return Vector3(a * scalar for a in self._v)
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other):
+        return isinstance(other, Vector3) and self._v == other._v
+
+    def __repr__(self):
+        return f"<hou.Vector3 [{self._v[0]}, {self._v[1]}, {self._v[2]}]>"
+
+    def x(self):
+        return self._v[0]
+
+    def y(self):
+        return self._v[1]
+
+    def z(self):
+        return self._v[2]
+
+    def length(self):
+        return math.sqrt(sum(a * a for a in self._v))
+
+    def distanceTo(self, other):
+        return (self - other).length()
+
+    def normalized(self):
+        length = self.length()
+        return self * (1.0 / length) if length else Vector3(self)
+
+    def dot(self, other):
+        return sum(a * b for a, b in zip(self._v, other))
+
+
+class BoundingBox:
+    def __init__(self, minvec, maxvec):
+        self._min = Vector3(minvec)
+        self._max = Vector3(maxvec)
+
+    def minvec(self):
+        return self._min
+
+    def maxvec(self):
+        return self._max
+
+    def sizevec(self):
+        return self._max - self._min
+
+    def center(self):
+        return (self._min + self._max) * 0.5
+
+
+# --------------------------
+# ATTRIBUTE'LAR (sütun bazlı)
+# --------------------------
+
+class Attrib:
+    """
+    Tek attribute sütunu.
+    Sayısal: data (n, size); String: table + data (n,) int32 indeks; Array: data (n, genişlik) + lengths (n,)
+    """
+
+    def __init__(self, geometry, attrib_type, name, data_type, size, default, is_array=False, count=0):
+        self._geometry = geometry
+        self._type = attrib_type
+        self._name = name
+        self._data_type = data_type
+        self._size = size
+        self._default = default
+        self._is_array = is_array
+        if is_array:
+            if data_type == attribData.String:
+                raise OperationFailed("String array attributes are not supported")
+            self.data = np.zeros((count, 0), dtype=self._dtype())
+            self.lengths = np.zeros(count, dtype=np.int64)
+        elif data_type == attribData.String:
+            self.table = [default]
+            self._table_index = {default: 0}
+            self.data = np.zeros(count, dtype=np.int32)
+        else:
+            self.data = np.tile(np.asarray(default, dtype=self._dtype()).reshape(1, size), (count, 1))
+
+    # --- hou.Attrib API ---
+    def name(self):
+        return self._name
+
+    def type(self):
+        return self._type
+
+    def dataType(self):
+        return self._data_type
+
+    def size(self):
+        return self._size
+
+    def isArrayType(self):
+        return self._is_array
+
+    def defaultValue(self):
+        return self._default
+
+    def geometry(self):
+        return self._geometry
+
+    # --- Depolama ---
+    def _dtype(self):
+        return np.int64 if self._data_type == attribData.Int else np.float64
+
+    def _string_index(self, value):
+        index = self._table_index.get(value)
+        if index is None:
+            index = self._table_index[value] = len(self.table)
+            self.table.append(value)
+        return index
+
+    def _resize(self, count):
+        """Eleman sayısını değiştir (yeni elemanlar varsayılan değerle)"""
+        old = self.data.shape[0]
+        if count <= old:
+            self.data = self.data[:count]
+            if self._is_array:
+                self.lengths = self.lengths[:count]
+            return
+        extra = count - old
+        if self._is_array:
+            self.data = np.concatenate([self.data, np.zeros((extra, self.data.shape[1]), dtype=self.data.dtype)])
+            self.lengths = np.concatenate([self.lengths, np.zeros(extra, dtype=np.int64)])
+        elif self._data_type == attribData.String:
+            self.data = np.concatenate([self.data, np.full(extra, self._string_index(self._default), dtype=np.int32)])
+        else:
+            fill = np.tile(np.asarray(self._default, dtype=self.data.dtype).reshape(1, self._size), (extra, 1))
+            self.data = np.concatenate([self.data, fill])
+
+    def _get(self, index):
+        if self._is_array:
+            return tuple(self.data[index, :self.lengths[index]].tolist())
+        if self._data_type == attribData.String:
+            return self.table[self.data[index]]
+        values = self.data[index].tolist()
+        return values[0] if self._size == 1 else tuple(values)
+
+    def _set(self, index, value):
+        if self._is_array:
+            values = np.asarray(value, dtype=self.data.dtype).reshape(-1)
+            if values.size > self.data.shape[1]:
+                pad = np.zeros((self.data.shape[0], values.size - self.data.shape[1]), dtype=self.data.dtype)
+                self.data = np.concatenate([self.data, pad], axis=1)
+            self.data[index, :values.size] = values
+            self.lengths[index] = values.size
+        elif self._data_type == attribData.String:
+            self.data[index] = self._string_index(str(value))
+        else:
+            self.data[index] = np.asarray(value, dtype=self.data.dtype).reshape(self._size)
+
+    def _values(self):
+        """Bulk getter sonucu: düz tuple (Houdini ile aynı)"""
+        if self._is_array:
+            raise OperationFailed(f"Use per-element access for array attribute '{self._name}'")
+        if self._data_type == attribData.String:
+            return tuple(np.asarray(self.table, dtype=object)[self.data].tolist())
+        return tuple(self.data.reshape(-1).tolist())
+
+    def _set_values(self, values):
+        """Bulk setter: düz sequence (sayısal için n * size eleman)"""
+        count = self.data.shape[0]
+        if self._data_type == attribData.String:
+            values = np.asarray(values, dtype=object).reshape(-1)
+            if values.size != count:
+                raise OperationFailed(f"Expected {count} values for '{self._name}', got {values.size}")
+            unique, inverse = np.unique(values.astype(str), return_inverse=True)
+            lut = np.array([self._string_index(value) for value in unique.tolist()], dtype=np.int32)
+            self.data = lut[inverse.reshape(-1)]
+            return
+        values = np.asarray(values, dtype=self.data.dtype).reshape(-1)
+        if values.size != count * self._size:
+            raise OperationFailed(f"Expected {count * self._size} values for '{self._name}', got {values.size}")
+        self.data = values.reshape(count, self._size).copy()
+
+    def _appended(self, other, count):
+        """merge(): other sütununu (yoksa varsayılanları) bu sütunun sonuna ekle"""
+        start = self.data.shape[0]
+        self._resize(start + count)
+        if other is None or count == 0:
+            return
+        if self._is_array:
+            width = max(self.data.shape[1], other.data.shape[1])
+            if width > self.data.shape[1]:
+                pad = np.zeros((self.data.shape[0], width - self.data.shape[1]), dtype=self.data.dtype)
+                self.data = np.concatenate([self.data, pad], axis=1)
+            self.data[start:, :other.data.shape[1]] = other.data
+            self.lengths[start:] = other.lengths
+        elif self._data_type == attribData.String:
+            lut = np.array([self._string_index(value) for value in other.table], dtype=np.int32)
+            self.data[start:] = lut[other.data]
+        else:
+            self.data[start:] = other.data.astype(self.data.dtype)
+
+
+def _default_data_type(default):
+    """addAttrib varsayılan değerinden (tip, boyut)"""
+    values = default if isinstance(default, (tuple, list)) else (default,)
+    if not values:
+        raise OperationFailed("Empty default value")
+    if isinstance(values[0], str):
+        return attribData.String, 1
+    if all(isinstance(v, (int, np.integer)) and not isinstance(v, bool) for v in values):
+        return attribData.Int, len(values)
+    return attribData.Float, len(values)
+
+
+# --------------------------
+# ELEMAN VIEW'LARI
+# --------------------------
+
+class _Element:
+    __slots__ = ("_geometry", "_number")
+
+    _attrib_type = None
+
+    def __init__(self, geometry, number):
+        self._geometry = geometry
+        self._number = int(number)
+
+    def number(self):
+        return self._number
+
+    def geometry(self):
+        return self._geometry
+
+    def __eq__(self, other):
+        return (type(other) is type(self) and other._geometry is self._geometry
+                and other._number == self._number)
+
+    def __hash__(self):
+        return hash((id(self._geometry), self._number))
+
+    def __repr__(self):
+        return f"<hou.{type(self).__name__} #{self._number}>"
+
+    def _attrib(self, name_or_attrib):
+        name = name_or_attrib.name() if isinstance(name_or_attrib, Attrib) else name_or_attrib
+        attrib = self._geometry._attribs[self._attrib_type].get(name)
+        if attrib is None:
+            raise OperationFailed(f"Invalid attribute name '{name}'")
+        return attrib
+
+    def attribValue(self, name_or_attrib):
+        return self._attrib(name_or_attrib)._get(self._number)
+
+    intAttribValue = attribValue
+    floatAttribValue = attribValue
+    stringAttribValue = attribValue
+    intListAttribValue = attribValue
+    floatListAttribValue = attribValue
+
+    def setAttribValue(self, name_or_attrib, value):
+        self._attrib(name_or_attrib)._set(self._number, value)
+
+
+class Point(_Element):
+    __slots__ = ()
+    _attrib_type = attribType.Point
+
+    def position(self):
+        return Vector3(self._geometry._attribs[attribType.Point]["P"].data[self._number])
+
+    def setPosition(self, position):
+        self._geometry._attribs[attribType.Point]["P"].data[self._number] = tuple(position)
+
+    def prims(self):
+        starts, prims = self._geometry._point_prims()
+        return tuple(Prim(self._geometry, p) for p in prims[starts[self._number]:starts[self._number + 1]].tolist())
+
+
+class Prim(_Element):
+    __slots__ = ()
+    _attrib_type = attribType.Prim
+
+    def _point_numbers(self):
+        geo = self._geometry
+        return geo._prim_points[geo._prim_starts[self._number]:geo._prim_starts[self._number + 1]]
+
+    def numVertices(self):
+        return int(self._geometry._prim_starts[self._number + 1] - self._geometry._prim_starts[self._number])
+
+    def points(self):
+        return tuple(Point(self._geometry, p) for p in self._point_numbers().tolist())
+
+    def positions(self):
+        return tuple(Vector3(p) for p in self._geometry._attribs[attribType.Point]["P"].data[self._point_numbers()])
+
+    def boundingBox(self):
+        positions = self._geometry._attribs[attribType.Point]["P"].data[self._point_numbers()]
+        return BoundingBox(positions.min(axis=0), positions.max(axis=0))
+
+
+class PointGroup:
+    """Point grubu (geometry'de bool mask)"""
+
+    def __init__(self, geometry, name):
+        self._geometry = geometry
+        self._name = name
+
+    def _mask(self):
+        return self._geometry._point_groups[self._name]
+
+    def name(self):
+        return self._name
+
+    def geometry(self):
+        return self._geometry
+
+    def points(self):
+        return tuple(Point(self._geometry, p) for p in np.flatnonzero(self._mask()).tolist())
+
+    def _numbers(self, points):
+        if isinstance(points, Point):
+            return [points.number()]
+        if isinstance(points, PointGroup):
+            return np.flatnonzero(points._mask())
+        return [pt.number() for pt in points]
+
+    def add(self, points):
+        self._mask()[self._numbers(points)] = True
+
+    def remove(self, points):
+        self._mask()[self._numbers(points)] = False
+
+    def clear(self):
+        self._mask()[:] = False
+
+    def contains(self, point):
+        return bool(self._mask()[point.number()])
+
+    def isEmpty(self):
+        return not self._mask().any()
+
+
+# --------------------------
+# GEOMETRY
+# --------------------------
+
+class Geometry:
+    """hou.Geometry alt kümesi; bütün veriler sütun array'lerinde"""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._attribs = {attribType.Point: {}, attribType.Prim: {}}
+        self._attribs[attribType.Point]["P"] = Attrib(self, attribType.Point, "P", attribData.Float, 3, (0.0, 0.0, 0.0))
+        self._prim_starts = np.zeros(1, dtype=np.int64)
+        self._prim_points = np.zeros(0, dtype=np.int64)
+        self._point_groups = {}
+        self._reverse = None
+
+    # --- Sayılar / intrinsic'ler ---
+    def _count(self, attrib_type):
+        if attrib_type == attribType.Point:
+            return self._attribs[attribType.Point]["P"].data.shape[0]
+        return self._prim_starts.size - 1
+
+    def intrinsicValue(self, name):
+        if name == "pointcount":
+            return self._count(attribType.Point)
+        if name == "primitivecount":
+            return self._count(attribType.Prim)
+        if name == "vertexcount":
+            return int(self._prim_points.size)
+        raise OperationFailed(f"Unsupported intrinsic '{name}'")
+
+    # --- Elemanlar ---
+    def points(self):
+        return tuple(Point(self, p) for p in range(self._count(attribType.Point)))
+
+    def iterPoints(self):
+        return self.points()
+
+    def point(self, number):
+        return Point(self, number) if 0 <= number < self._count(attribType.Point) else None
+
+    def prims(self):
+        return tuple(Prim(self, p) for p in range(self._count(attribType.Prim)))
+
+    def iterPrims(self):
+        return self.prims()
+
+    def prim(self, number):
+        return Prim(self, number) if 0 <= number < self._count(attribType.Prim) else None
+
+    def createPoints(self, positions):
+        """Toplu point oluştur; positions (n, 3)"""
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        start = self._count(attribType.Point)
+        for attrib in self._attribs[attribType.Point].values():
+            attrib._resize(start + positions.shape[0])
+        self._attribs[attribType.Point]["P"].data[start:] = positions
+        for name, mask in self._point_groups.items():
+            self._point_groups[name] = np.concatenate([mask, np.zeros(positions.shape[0], dtype=bool)])
+        self._reverse = None
+        return tuple(Point(self, p) for p in range(start, start + positions.shape[0]))
+
+    def createPoint(self):
+        return self.createPoints(np.zeros((1, 3)))[0]
+
+    def createPolygons(self, point_numbers):
+        """Toplu polygon oluştur; point_numbers eşit uzunluklu (n, k) int array'i ya da listeler"""
+        rows = [np.asarray([p.number() if isinstance(p, Point) else p for p in row], dtype=np.int64)
+                for row in point_numbers] if not isinstance(point_numbers, np.ndarray) else list(point_numbers)
+        start = self._count(attribType.Prim)
+        lengths = np.array([row.size for row in rows], dtype=np.int64)
+        self._prim_starts = np.concatenate([self._prim_starts, self._prim_points.size + np.cumsum(lengths)])
+        self._prim_points = np.concatenate([self._prim_points] + [np.asarray(row, dtype=np.int64) for row in rows])
+        for attrib in self._attribs[attribType.Prim].values():
+            attrib._resize(start + len(rows))
+        self._reverse = None
+        return tuple(Prim(self, p) for p in range(start, start + len(rows)))
+
+    def _point_prims(self):
+        """Point -> prim ters CSR indeksi (ilk sorguda kurulur)"""
+        if self._reverse is None:
+            counts = np.diff(self._prim_starts)
+            owners = np.repeat(np.arange(counts.size, dtype=np.int64), counts)
+            order = np.argsort(self._prim_points, kind="stable")
+            per_point = np.bincount(self._prim_points, minlength=self._count(attribType.Point))
+            starts = np.concatenate([[0], np.cumsum(per_point)])
+            self._reverse = (starts, owners[order])
+        return self._reverse
+
+    def boundingBox(self):
+        positions = self._attribs[attribType.Point]["P"].data
+        if positions.shape[0] == 0:
+            return BoundingBox((0, 0, 0), (0, 0, 0))
+        return BoundingBox(positions.min(axis=0), positions.max(axis=0))
+
+    # --- Attribute'lar ---
+    def addAttrib(self, attrib_type, name, default_value, transform_as_normal=False, create_local_variable=True):
+        existing = self._attribs.get(attrib_type, {}).get(name)
+        if existing is not None:
+            return existing
+        if attrib_type not in self._attribs:
+            raise OperationFailed(f"Unsupported attribute type {attrib_type}")
+        data_type, size = _default_data_type(default_value)
+        if data_type == attribData.String:
+            default_value = str(default_value if not isinstance(default_value, (tuple, list)) else default_value[0])
+        attrib = Attrib(self, attrib_type, name, data_type, size, default_value, count=self._count(attrib_type))
+        self._attribs[attrib_type][name] = attrib
+        return attrib
+
+    def addArrayAttrib(self, attrib_type, name, data_type, tuple_size=1):
+        existing = self._attribs.get(attrib_type, {}).get(name)
+        if existing is not None:
+            return existing
+        attrib = Attrib(self, attrib_type, name, data_type, tuple_size, (), is_array=True,
+                        count=self._count(attrib_type))
+        self._attribs[attrib_type][name] = attrib
+        return attrib
+
+    def findPointAttrib(self, name):
+        return self._attribs[attribType.Point].get(name)
+
+    def findPrimAttrib(self, name):
+        return self._attribs[attribType.Prim].get(name)
+
+    def pointAttribs(self):
+        return tuple(self._attribs[attribType.Point].values())
+
+    def primAttribs(self):
+        return tuple(self._attribs[attribType.Prim].values())
+
+    def _find(self, attrib_type, name_or_attrib):
+        name = name_or_attrib.name() if isinstance(name_or_attrib, Attrib) else name_or_attrib
+        attrib = self._attribs[attrib_type].get(name)
+        if attrib is None:
+            raise OperationFailed(f"Invalid attribute name '{name}'")
+        return attrib
+
+    def pointFloatAttribValues(self, name):
+        return self._find(attribType.Point, name)._values()
+
+    def pointIntAttribValues(self, name):
+        return self._find(attribType.Point, name)._values()
+
+    def pointStringAttribValues(self, name):
+        return self._find(attribType.Point, name)._values()
+
+    def setPointFloatAttribValues(self, name, values):
+        self._find(attribType.Point, name)._set_values(values)
+
+    def setPointIntAttribValues(self, name, values):
+        self._find(attribType.Point, name)._set_values(values)
+
+    def setPointStringAttribValues(self, name, values):
+        self._find(attribType.Point, name)._set_values(values)
+
+    def primFloatAttribValues(self, name):
+        return self._find(attribType.Prim, name)._values()
+
+    def primIntAttribValues(self, name):
+        return self._find(attribType.Prim, name)._values()
+
+    def primStringAttribValues(self, name):
+        return self._find(attribType.Prim, name)._values()
+
+    def setPrimFloatAttribValues(self, name, values):
+        self._find(attribType.Prim, name)._set_values(values)
+
+    def setPrimIntAttribValues(self, name, values):
+        self._find(attribType.Prim, name)._set_values(values)
+
+    def setPrimStringAttribValues(self, name, values):
+        self._find(attribType.Prim, name)._set_values(values)
+
+    # --- Gruplar ---
+    def findPointGroup(self, name):
+        return PointGroup(self, name) if name in self._point_groups else None
+
+    def createPointGroup(self, name):
+        if name in self._point_groups:
+            raise OperationFailed(f"Point group '{name}' already exists")
+        self._point_groups[name] = np.zeros(self._count(attribType.Point), dtype=bool)
+        return PointGroup(self, name)
+
+    def pointGroups(self):
+        return tuple(PointGroup(self, name) for name in self._point_groups)
+
+    # --- Birleştirme ---
+    def merge(self, other):
+        """other'ın point / prim / attribute / gruplarını bu geometry'nin sonuna ekle"""
+        point_offset = self._count(attribType.Point)
+        point_count = other._count(attribType.Point)
+        prim_count = other._count(attribType.Prim)
+
+        for attrib_type, count in ((attribType.Point, point_count), (attribType.Prim, prim_count)):
+            mine, theirs = self._attribs[attrib_type], other._attribs[attrib_type]
+            for name, attrib in theirs.items():
+                if name not in mine:
+                    new = Attrib(self, attrib_type, name, attrib._data_type, attrib._size, attrib._default,
+                                 attrib._is_array, count=self._count(attrib_type))
+                    mine[name] = new
+            for name, attrib in mine.items():
+                attrib._appended(theirs.get(name), count)
+
+        self._prim_starts = np.concatenate([self._prim_starts, self._prim_points.size + other._prim_starts[1:]])
+        self._prim_points = np.concatenate([self._prim_points, other._prim_points + point_offset])
+
+        names = set(self._point_groups) | set(other._point_groups)
+        for name in names:
+            mine = self._point_groups.get(name, np.zeros(point_offset, dtype=bool))
+            theirs = other._point_groups.get(name, np.zeros(point_count, dtype=bool))
+            self._point_groups[name] = np.concatenate([mine, theirs])
+        self._reverse = None
+
+
+def grid_sop_geometry(size, center, rows, cols):
+    """
+    Grid SOP (Polygon, Quadrilaterals, ZX plane) karşılığı: rows * cols point satır satır
+    (x en hızlı), P = center - size / 2 + indeks * size / (n - 1), float32;
+    (rows - 1) * (cols - 1) quad prim, ilk vertex prim'in sol alt (min x, min z) köşesi
+    """
+    rows, cols = int(rows), int(cols)
+    xs = center[0] - size[0] / 2.0 + np.arange(cols) * (size[0] / max(cols - 1, 1))
+    zs = center[2] - size[1] / 2.0 + np.arange(rows) * (size[1] / max(rows - 1, 1))
+    px, pz = np.meshgrid(xs, zs)
+    positions = np.stack([px.reshape(-1), np.full(px.size, center[1]), pz.reshape(-1)], axis=1)
+    geo = Geometry()
+    geo.createPoints(positions.astype(np.float32).astype(np.float64))
+
+    r, c = np.divmod(np.arange((rows - 1) * (cols - 1), dtype=np.int64), max(cols - 1, 1))
+    base = r * cols + c
+    geo.createPolygons(np.stack([base, base + 1, base + cols + 1, base + cols], axis=1))
+    return geo
+
+
+def grid_geometry(size_x, size_y):
+    """
+    main_leveldesign.hip grid1'i: CONTROLLER sizeX / sizeY'den parm expression'ları ile
+    cols = sizeX + 1, rows = sizeY + 1, size = (cols - 1, rows - 1),
+    center = ((cols - 1) / 2, 0, (rows - 0.005) / 2) -> point'ler x = 0 .. sizeX, z = k + 0.4975,
+    sizeX * sizeY prim (prim merkezleri x + 0.5 / z + 0.9975, exporter bunları hücreye yuvarlar)
+    """
+    cols, rows = int(size_x) + 1, int(size_y) + 1
+    center = ((cols - 1) / 2.0, 0.0, (rows - grid_engine.GRID1_CENTER_Z_INSET) / 2.0)
+    return grid_sop_geometry((cols - 1, rows - 1), center, rows, cols)
+
+
+# --------------------------
+# NODE'LAR / PARM'LAR
+# --------------------------
+
+class Parm:
+    def __init__(self, node, name, value):
+        self._node = node
+        self._name = name
+        self._value = value
+
+    def name(self):
+        return self._name
+
+    def node(self):
+        return self._node
+
+    def eval(self):
+        return self._value
+
+    def evalAsInt(self):
+        return int(self._value)
+
+    def evalAsFloat(self):
+        return float(self._value)
+
+    def evalAsString(self):
+        return str(self._value)
+
+    def set(self, value):
+        self._value = value
+        _session.dirty_all()
+
+
+class Node:
+    """
+    SOP node'u. script verilirse cook'ta çalıştırılır (Python SOP: geometry input 0'ın kopyası),
+    generator verilirse geometry ondan üretilir (Grid SOP gibi).
+    """
+
+    def __init__(self, path, inputs=(), script=None, generator=None, parms=None):
+        self._path = path
+        self._inputs = list(inputs)
+        self._script = script
+        self._generator = generator
+        self._parms = {name: Parm(self, name, value) for name, value in (parms or {}).items()}
+        self._geometry = None
+        self._dirty = True
+        self._cooking = False
+
+    def path(self):
+        return self._path
+
+    def name(self):
+        return posixpath.basename(self._path)
+
+    def inputs(self):
+        return tuple(self._inputs)
+
+    def setInput(self, index, node):
+        while len(self._inputs) <= index:
+            self._inputs.append(None)
+        self._inputs[index] = node
+        self._dirty = True
+
+    def parm(self, name):
+        return self._parms.get(name)
+
+    def parms(self):
+        return tuple(self._parms.values())
+
+    def evalParm(self, name):
+        return self._parms[name].eval()
+
+    def node(self, path):
+        return _session.find(path, relative_to=self._path)
+
+    def geometry(self):
+        if self._dirty and not self._cooking:
+            self.cook()
+        return self._geometry
+
+    def cook(self, force=False):
+        """Input'ları ve bu node'u cook et (script'ler hou.pwd() == bu node iken çalışır)"""
+        if not (force or self._dirty) or self._cooking:
+            return
+        for node in self._inputs:
+            if node is not None:
+                node.cook(force)
+
+        geo = Geometry()
+        if self._inputs and self._inputs[0] is not None:
+            geo.merge(self._inputs[0].geometry())
+        self._geometry = geo
+
+        self._cooking = True
+        try:
+            if self._generator is not None:
+                self._geometry = self._generator(self)
+            elif self._script is not None:
+                _session.run_script(self._script, self)
+        finally:
+            self._cooking = False
+        self._dirty = False
+
+
+class Session:
+    """Node registry'si + hou.pwd() + $HIP"""
+
+    def __init__(self, hip=DEFAULT_HIP):
+        self.hip = hip
+        self.nodes = {}
+        self.current = None
+        self.quiet = False
+        self._code_cache = {}
+
+    def add(self, node):
+        self.nodes[node.path()] = node
+        return node
+
+    def find(self, path, relative_to=None):
+        if not path.startswith("/"):
+            base = relative_to or (self.current.path() if self.current else "/")
+            path = posixpath.join(base, path)
+        return self.nodes.get(posixpath.normpath(path))
+
+    def dirty_all(self):
+        for node in self.nodes.values():
+            node._dirty = True
+
+    def _code(self, script):
+        """Script'i bir kez derle (mtime değişince yeniden)"""
+        mtime = os.path.getmtime(script)
+        cached = self._code_cache.get(script)
+        if cached is None or cached[0] != mtime:
+            with open(script, "r", encoding="utf-8") as f:
+                cached = (mtime, compile(f.read(), script, "exec"))
+            self._code_cache[script] = cached
+        return cached[1]
+
+    def run_script(self, script, node):
+        """Python SOP cook'u: script'i kendi global'leriyle, hou.pwd() == node iken çalıştır"""
+        install()
+        previous = self.current
+        self.current = node
+        init_globals = {"__name__": "__main__", "__file__": script, "__builtins__": __builtins__}
+        try:
+            if self.quiet:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    exec(self._code(script), init_globals)
+            else:
+                exec(self._code(script), init_globals)
+        finally:
+            self.current = previous
+
+
+_session = Session()
+
+
+# --------------------------
+# hou MODÜL FONKSİYONLARI
+# --------------------------
+
+def pwd():
+    return _session.current
+
+
+def node(path):
+    return _session.find(path)
+
+
+def expandString(text):
+    return text.replace("$HIP", _session.hip).replace("${HIP}", _session.hip)
+
+
+def applicationVersionString():
+    return "headless"
+
+
+def install():
+    """`import hou` bu modülü döndürsün (gerçek Houdini'de dokunma)"""
+    existing = sys.modules.get("hou")
+    if existing is None:
+        sys.modules["hou"] = sys.modules[__name__]
+    elif existing is not sys.modules[__name__] and not getattr(existing, "_headless", False):
+        raise RuntimeError("A real hou module is already loaded")
+
+
+_headless = True
+
+
+# --------------------------
+# SOP ZİNCİRİ
+# --------------------------
+
+def build_network(params=None, hip=None, stages=STAGE_NODES, quiet=True):
+    """
+    /obj/main altında CONTROLLER + grid + stage node'larını kur (önceki network silinir).
+    Her stage node'u $HIP/houdiniScripts/<isim>.py'yi çalıştırır, bir öncekinin çıktısını alır.
+    """
+    if hip is not None:
+        _session.hip = hip
+    _session.nodes.clear()
+    _session.quiet = quiet
+
+    controller = _session.add(Node(f"{NETWORK_PATH}/{CONTROLLER_NAME}", parms=grid_engine.resolve_params(params)))
+
+    def make_grid(grid_node):
+        return grid_geometry(controller.evalParm("sizeX"), controller.evalParm("sizeY"))
+
+    previous = _session.add(Node(f"{NETWORK_PATH}/{GRID_NAME}", generator=make_grid))
+    script_dir = os.path.join(_session.hip, "houdiniScripts")
+    for name in stages:
+        previous = _session.add(Node(f"{NETWORK_PATH}/{name}", inputs=[previous],
+                                     script=os.path.join(script_dir, name + ".py")))
+    return previous
+
+
+def set_params(params):
+    """CONTROLLER parm'larını güncelle (bütün node'lar dirty olur)"""
+    controller = _session.find(f"{NETWORK_PATH}/{CONTROLLER_NAME}")
+    for name, value in params.items():
+        parm = controller.parm(name)
+        if parm is None:
+            controller._parms[name] = parm = Parm(controller, name, value)
+        parm.set(value)
+
+
+def generate_level(params=None, output=STAGE_NODES[-1]):
+    """
+    Stage script'lerini headless çalıştırıp output node'unun geometry'sinden LevelGrid döndür
+    (grid_engine.generate_level ile aynı imza). Network process başına bir kez kurulur.
+    """
+    params = grid_engine.resolve_params(params)
+    if _session.find(f"{NETWORK_PATH}/{output}") is None:
+        build_network(params)
+    else:
+        set_params(params)
+    return grid_bridge.grid_from_geometry(_session.find(f"{NETWORK_PATH}/{output}").geometry())
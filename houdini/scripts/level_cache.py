@@ -0,0 +1,166 @@
+"""
+Level Cache
+Üretilmiş level grid'leri için content-addressed disk cache'i (LRU, boyut sınırlı)
+
+Anahtar: sha256(seed + bütün CONTROLLER değerleri + grid boyutu + stage script hash'leri).
+Parametre ya da script değişmediyse export cook'u atlar, değişen level'lar yeniden üretilir.
+Her kayıt <cache_dir>/<key[:2]>/<key>.npy (uint8 ASCII kodları, eksik hücre 0) dosyasıdır;
+erişim zamanı mtime'da tutulur, boyut sınırı aşılınca en eski kayıtlar silinir.
+
+Cache isteğe bağlıdır, BOMBERMAN_LEVEL_CACHE tanımlı değilse kapalıdır (houdini.env veya shell):
+    BOMBERMAN_LEVEL_CACHE=E:/UNITY/BombermanTower/houdini/level_cache   (klasör)
+    BOMBERMAN_LEVEL_CACHE=on                                              (varsayılan klasör)
+    BOMBERMAN_LEVEL_CACHE_MB=512
+"""
+
+import glob
+import hashlib
+import json
+import os
+
+import numpy as np
+
+import grid_engine
+
+
+CACHE_FORMAT = 1
+DEFAULT_MAX_MB = 512
+CACHE_EXTENSION = ".npy"
+
+
+def file_digest(path):
+    """Tek dosyanın sha256'sı"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def script_hashes(script_dirs, pattern="*.py"):
+    """Stage script klasörlerindeki dosyaların {dosya adı: sha256} sözlüğü"""
+    hashes = {}
+    for script_dir in script_dirs:
+        for path in sorted(glob.glob(os.path.join(script_dir, pattern))):
+            hashes[f"{os.path.basename(script_dir)}/{os.path.basename(path)}"] = file_digest(path)
+    return hashes
+
+
+def cache_key(seed, controller_data, grid_size, stage_hashes):
+    """Level'ın içeriğini belirleyen her şeyin hash'i"""
+    payload = {
+        "format": CACHE_FORMAT,
+        "seed": seed,
+        "controller": {k: v for k, v in controller_data.items() if k != "seed"},
+        "grid_size": list(grid_size),
+        "scripts": stage_hashes,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class LevelCache:
+    """Boyut sınırlı LRU disk cache'i; get/put dense grid (str veya uint8) ile çalışır"""
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # Başlangıçta tek tarama; sonrası bellekte tutulur
+        self._total_bytes = 0
+        for path in self._entries():
+            self._total_bytes += os.path.getsize(path)
+
+    def _entries(self):
+        return glob.glob(os.path.join(self.cache_dir, "??", "*" + CACHE_EXTENSION))
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + CACHE_EXTENSION)
+
+    def get(self, key):
+        """Cache'te varsa (height, width) uint8 grid, yoksa None"""
+        path = self._path(key)
+        try:
+            codes = np.load(path, allow_pickle=False)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        # LRU: erişim zamanını güncelle
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        self.hits += 1
+        return codes
+
+    def put(self, key, grid):
+        """Grid'i cache'e yaz (atomik), gerekirse en eski kayıtları sil"""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        old_size = os.path.getsize(path) if os.path.exists(path) else 0
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, grid_engine.char_codes(grid), allow_pickle=False)
+        os.replace(tmp_path, path)
+
+        self._total_bytes += os.path.getsize(path) - old_size
+        if self._total_bytes > self.max_bytes:
+            self.evict(keep=path)
+
+    def evict(self, keep=None):
+        """Toplam boyut max_bytes altına inene kadar en az yakın zamanda kullanılanları sil"""
+        entries = []
+        for path in self._entries():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        entries.sort()
+
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for _, path, size in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        self._total_bytes = total
+        return removed
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size_mb": round(self._total_bytes / (1024.0 * 1024.0), 2),
+            "max_mb": round(self.max_bytes / (1024.0 * 1024.0), 2),
+        }
+
+
+ENABLE_VALUES = ("1", "on", "true", "yes")
+DISABLE_VALUES = ("0", "off", "false", "no")
+
+
+def from_environment(default_dir=None):
+    """
+    BOMBERMAN_LEVEL_CACHE / BOMBERMAN_LEVEL_CACHE_MB ile cache aç.
+    Tanımsız / "off" -> None, "on" -> default_dir, diğer değerler cache klasörü.
+    """
+    cache_dir = os.environ.get("BOMBERMAN_LEVEL_CACHE", "").strip()
+    if not cache_dir or cache_dir.lower() in DISABLE_VALUES:
+        return None
+    if cache_dir.lower() in ENABLE_VALUES:
+        cache_dir = default_dir
+    if not cache_dir:
+        return None
+    max_mb = float(os.environ.get("BOMBERMAN_LEVEL_CACHE_MB", DEFAULT_MAX_MB))
+    return LevelCache(cache_dir, int(max_mb * 1024 * 1024))
@@ -0,0 +1,208 @@
+"""
+Level Format
+Unity level INI formatı (LEVEL DATASET) - Houdini'siz yazıcı
+
+my_exporter (Houdini) ve migrate_levels (headless) aynı bölüm üreticilerini kullanır;
+böylece iki yoldan çıkan dosyalar byte byte aynı düzendedir.
+Grid legend'ı Unity TileSymbols ile aynı (S=stairs, F=enemy shooter, X=explosion);
+CELL_TYPES bloğu mevcut export'larla uyum için aynen bırakıldı.
+"""
+
+import os
+from datetime import datetime
+
+import numpy as np
+
+import grid_engine
+
+
+CURRENT_FORMAT_VERSION = "v4.3"
+DEFAULT_GENERATOR = "Houdini Unknown"
+DATASET_COUNT_WIDTH = 8  # "# Levels: N" alanı, stream sonunda yerinde güncellenir
+
+
+def dataset_header(export_params, level_count=1, generator=DEFAULT_GENERATOR, export_date=None):
+    """Dataset dosyası ana header'ı"""
+    export_date = export_date or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    return f"""# === LEVEL DATASET {export_params['format_version']} ===
+# Generator: {generator}
+# Export Date: {export_date}
+# Encoding: UTF-8
+# Levels: {level_count}
+# Format: Incremental IDs with Suffix
+# ===================================
+"""
+
+
+def level_sections(level_id, controller_data, ascii_grid, grid_width, grid_height, export_params):
+    """Tek level bloğunun bölümlerini sırayla üret (generator, bütün içerik bellekte tutulmaz)"""
+    yield f"""
+# ===================================
+# LEVEL {level_id:04d} : Generated Level
+# ===================================
+
+[CELL_TYPES]
+# ID=Symbol,Name,Passable,Prefab_Index
+0=.,EMPTY,true,0
+1=#,WALL,false,1
+2=o,FLOOR,true,2
+3=P,PLAYER,true,3
+4=E,ENEMY,true,4
+5=S,ENEMY_SHOOTER,true,5
+6=C,COIN,true,6
+7=H,HEALTH,true,7
+8=B,BREAKABLE,false,8
+9=X,STAIRS,true,9
+"""
+    
+    yield f"""
+# ===================================
+# LEVEL CONFIGURATION
+# ===================================
+
+[LEVEL_CONFIG]
+VERSION={export_params['level_version']}
+FORMAT_VERSION={export_params['format_version']}
+LEVEL_NAME=Generated Level {level_id:04d}
+LEVEL_ID={level_id:04d}
+GRID_WIDTH={grid_width}
+GRID_HEIGHT={grid_height}
+"""
+    
+    yield f"""
+# ===================================
+# GENERATION PARAMETERS
+# ===================================
+
+[GENERATION_PARAMS]
+HOUDINI_SEED={controller_data['seed']}
+ROOM_COUNT={controller_data['room_count']}
+ENEMY_DENSITY={controller_data['enemy_density']}
+LOOT_DENSITY={controller_data['loot_density']}
+COIN_DENSITY={controller_data['coin_density']}
+HEALTH_DENSITY={controller_data['health_density']}
+BREAKABLE_DENSITY={controller_data['breakable_density']}
+EDGE_WALL_BIAS={controller_data['edge_wall_bias']}
+NOISE_SCALE={controller_data['noise_scale']}
+NOISE_THRESHOLD={controller_data['noise_threshold']}
+MIN_ROOM_SIZE={controller_data['min_room_size']}
+MAX_ROOM_SIZE={controller_data['max_room_size']}
+MIN_PLAYER_EXIT_DIST={controller_data['min_player_exit_dist']}
+"""
+    
+    # ASCII grid tek join ile
+    yield """
+# ===================================
+# GRID DATA
+# ===================================
+
+[GRID_ASCII]
+""" + "\n".join(ascii_grid) + "\n"
+    
+    # Footer
+    yield f"""
+# ===================================
+# END OF LEVEL {level_id:04d}
+# ===================================
+"""
+
+
+def level_content(level_id, controller_data, ascii_grid, grid_width, grid_height, export_params,
+                  generator=DEFAULT_GENERATOR, export_date=None):
+    """Tek level'lı dosyanın bütün içeriği"""
+    sections = level_sections(level_id, controller_data, ascii_grid, grid_width, grid_height, export_params)
+    return dataset_header(export_params, 1, generator, export_date) + "".join(sections)
+
+
+def level_filename(level_id, export_params):
+    """LEVEL_0001_v1.0.0_v4.3.ini (Unity LevelLoader bu kalıbı tarar)"""
+    return f"LEVEL_{level_id:04d}_{export_params['level_version']}_{export_params['format_version']}.ini"
+
+
+def dataset_filename(export_params):
+    """Çok level'lı INI dataset dosya adı (export_format == "dataset")"""
+    return f"DATASET_{export_params['level_version']}_{export_params['format_version']}.ini"
+
+
+def migrate_grid(codes, strip_path=False):
+    """
+    Eski grid legend'ını güncel olana çevir (tek LUT lookup'ı, uint8 kodlar).
+    Eski export'larda CELL_TYPES'a uygun olarak stairs 'X', atıcı düşman 'S' idi;
+    grid'de 'X' varsa bu legend kullanılmıştır (Unity'de X patlama, level'da bulunmaz).
+    strip_path: garanti yol işareti '1' -> '.' (Unity zaten boş olarak okur)
+    """
+    codes = grid_engine.char_codes(codes)
+    lut = np.arange(256, dtype=np.uint8)
+    if np.any(codes == ord("X")):
+        lut[ord("S")] = ord("F")
+        lut[ord("X")] = ord("S")
+    if strip_path:
+        lut[ord(grid_engine.PATH_CHAR)] = ord(grid_engine.TILE_CHARS["empty"])
+    return lut[codes]
+
+
+class LevelDatasetWriter:
+    """
+    Level'ları cook edildikçe tek bir INI dataset dosyasına akıtan yazıcı.
+    Her level yazıldıktan sonra flush edilir; bellekte sadece o anki level bulunur.
+    close(): [DATASET_INDEX] trailer'ı (LEVEL_ID=byte offset,seed) eklenir,
+    header'daki "# Levels:" sayısı yerinde güncellenir, dosya atomik olarak yerine taşınır.
+    """
+
+    def __init__(self, path, export_params, generator=DEFAULT_GENERATOR):
+        self.path = path
+        self.export_params = export_params
+        self._tmp_path = path + ".tmp"
+        self._file = open(self._tmp_path, "wb")
+        self._index = []
+
+        # Sayı alanı sabit genişlikte: sonradan dosyayı yeniden yazmadan güncellenir
+        header = dataset_header(export_params, " " * DATASET_COUNT_WIDTH, generator).encode("utf-8")
+        self._count_offset = header.index(b"# Levels: ") + len(b"# Levels: ")
+        self._file.write(header)
+
+    def add_level(self, level_id, controller_data, grid_chars):
+        """Bir level'ı (dense char grid) dataset'e ekle ve diske flush et"""
+        grid_height, grid_width = grid_chars.shape
+        ascii_grid, _ = grid_engine.serialize_grid(grid_chars)
+        self._index.append((level_id, self._file.tell(), controller_data['seed']))
+        for section in level_sections(level_id, controller_data, ascii_grid, grid_width, grid_height, self.export_params):
+            self._file.write(section.encode("utf-8"))
+        self._file.flush()
+
+    def __len__(self):
+        return len(self._index)
+
+    def close(self):
+        """Index trailer'ı yaz, level sayısını güncelle, dosyayı yerine taşı"""
+        if self._file is None:
+            return
+        f = self._file
+
+        trailer = "\n# ===================================\n# DATASET INDEX\n# ===================================\n\n"
+        trailer += "[DATASET_INDEX]\n# LEVEL_ID=Byte_Offset,Seed\n"
+        trailer += "".join(f"{level_id:04d}={offset},{seed}\n" for level_id, offset, seed in self._index)
+        f.write(trailer.encode("utf-8"))
+
+        f.seek(self._count_offset)
+        f.write(f"{len(self._index):<{DATASET_COUNT_WIDTH}}".encode("utf-8"))
+        f.close()
+        self._file = None
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        """Yarım kalan dataset'i sil (hedef dosyaya dokunmaz)"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
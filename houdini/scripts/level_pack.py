@@ -0,0 +1,246 @@
+"""
+Level Pack
+Binary level-pack formatı (tek dosyada çok level) - yazıcı + mmap okuyucu
+
+Dosya düzeni (little-endian):
+    HEADER        sabit 64 byte (magic, format versiyonu, level sayısı, bölüm offset'leri)
+    GRIDS         level başına height*width uint8 ASCII kodu (GRID_ASCII ile aynı, satır sonu yok)
+    PARAMS TABLE  level başına sabit genişlikli float64 satırı (PARAM_FIELDS sırasıyla)
+    INDEX         level başına (level_id, seed, width, height, grid offset)
+    NAMES         PARAM_FIELDS isimleri + level/format versiyonu (UTF-8 JSON)
+
+Grid'ler dosyaya cook edildikçe akıtılır; tablo ve index close() sırasında sona eklenir,
+header en son yazılır. Okuyucu dosyayı mmap'ler, her level zero-copy (height, width) view'dır.
+
+Kullanım:
+    with level_pack.LevelPackWriter("levels.blp") as pack:
+        pack.add_level(level_id, controller_data, grid_chars)
+
+    with level_pack.LevelPack("levels.blp") as pack:
+        grid = pack.level(3)          # LEVEL_ID ile
+        grid = pack.by_seed(261)      # seed ile
+        params = pack.params(3)
+"""
+
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+import grid_engine
+
+
+MAGIC = b"BMLP"
+PACK_VERSION = 1
+PACK_EXTENSION = ".blp"
+
+# magic, pack versiyonu, param sayısı, level sayısı, params / index / names offset, names uzunluğu
+HEADER_STRUCT = struct.Struct("<4sHHI QQQI")
+HEADER_SIZE = 64
+
+# GENERATION_PARAMS sırası (get_controller_data() anahtarları); seed index'te tutulur
+PARAM_FIELDS = (
+    "room_count",
+    "enemy_density",
+    "loot_density",
+    "coin_density",
+    "health_density",
+    "breakable_density",
+    "edge_wall_bias",
+    "noise_scale",
+    "noise_threshold",
+    "min_room_size",
+    "max_room_size",
+    "min_player_exit_dist",
+)
+
+INDEX_DTYPE = np.dtype([
+    ("level_id", "<u4"),
+    ("width", "<u2"),
+    ("height", "<u2"),
+    ("seed", "<i8"),
+    ("offset", "<u8"),
+])
+
+
+def grid_codes(grid):
+    """Dense char grid'ini (str / bytes / uint8) pack'e yazılacak uint8 ASCII kodlarına çevir"""
+    codes = grid_engine.char_codes(grid)
+    if codes.ndim != 2:
+        raise ValueError(f"Grid must be 2D, got shape {codes.shape}")
+    return np.where(codes == 0, ord(grid_engine.MISSING_CHAR), codes).astype(np.uint8)
+
+
+class LevelPackWriter:
+    """Level'ları tek bir .blp dosyasına akıtan yazıcı (atomik: .tmp -> os.replace)"""
+
+    def __init__(self, path, level_version="", format_version=""):
+        self.path = path
+        self.level_version = level_version
+        self.format_version = format_version
+        self._tmp_path = path + ".tmp"
+        self._file = open(self._tmp_path, "wb")
+        self._file.write(b"\0" * HEADER_SIZE)
+        self._index = []
+        self._params = []
+
+    def add_level(self, level_id, controller_data, grid):
+        """Bir level ekle; grid (height, width) char / uint8 array'i"""
+        codes = grid_codes(grid)
+        height, width = codes.shape
+        offset = self._file.tell()
+        self._file.write(codes.tobytes())
+
+        self._index.append((level_id, width, height, int(controller_data["seed"]), offset))
+        self._params.append([float(controller_data.get(name, 0.0)) for name in PARAM_FIELDS])
+
+    def __len__(self):
+        return len(self._index)
+
+    def close(self):
+        """Params tablosu, index ve header'ı yaz, dosyayı yerine taşı"""
+        if self._file is None:
+            return
+        f = self._file
+
+        params_offset = f.tell()
+        f.write(np.asarray(self._params, dtype="<f8").reshape(-1, len(PARAM_FIELDS)).tobytes())
+
+        index_offset = f.tell()
+        f.write(np.array(self._index, dtype=INDEX_DTYPE).tobytes())
+
+        names_offset = f.tell()
+        names = json.dumps({
+            "params": list(PARAM_FIELDS),
+            "level_version": self.level_version,
+            "format_version": self.format_version,
+        }).encode("utf-8")
+        f.write(names)
+
+        f.seek(0)
+        f.write(HEADER_STRUCT.pack(
+            MAGIC, PACK_VERSION, len(PARAM_FIELDS), len(self._index),
+            params_offset, index_offset, names_offset, len(names),
+        ))
+        f.close()
+        self._file = None
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        """Yarım kalan pack'i sil (hedef dosyaya dokunmaz)"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class LevelPack:
+    """Memory-mapped .blp okuyucu; grid'ler mmap üzerinde zero-copy view olarak döner"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, param_count, level_count,
+         params_offset, index_offset, names_offset, names_length) = HEADER_STRUCT.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a level pack: {path}")
+        if version != PACK_VERSION:
+            raise ValueError(f"Unsupported level pack version {version}: {path}")
+
+        meta = json.loads(bytes(self._mmap[names_offset:names_offset + names_length]).decode("utf-8"))
+        self.param_names = tuple(meta["params"])
+        self.level_version = meta.get("level_version", "")
+        self.format_version = meta.get("format_version", "")
+
+        self.index = np.frombuffer(self._mmap, dtype=INDEX_DTYPE, count=level_count, offset=index_offset)
+        self.param_table = np.frombuffer(
+            self._mmap, dtype="<f8", count=level_count * param_count, offset=params_offset
+        ).reshape(level_count, param_count)
+
+        self._by_level_id = None
+        self._by_seed = None
+
+    def __len__(self):
+        return self.index.shape[0]
+
+    def _row(self, level_id):
+        if self._by_level_id is None:
+            self._by_level_id = {int(v): row for row, v in enumerate(self.index["level_id"])}
+        try:
+            return self._by_level_id[int(level_id)]
+        except KeyError:
+            raise KeyError(f"LEVEL_ID {level_id} not in pack {self.path}") from None
+
+    def _row_by_seed(self, seed):
+        if self._by_seed is None:
+            # Aynı seed birden çok kez varsa ilk level döner
+            self._by_seed = {}
+            for row, v in enumerate(self.index["seed"]):
+                self._by_seed.setdefault(int(v), row)
+        try:
+            return self._by_seed[int(seed)]
+        except KeyError:
+            raise KeyError(f"Seed {seed} not in pack {self.path}") from None
+
+    def grid_at(self, row):
+        """row. level'ın grid'i: (height, width) uint8 zero-copy view"""
+        entry = self.index[row]
+        height, width = int(entry["height"]), int(entry["width"])
+        return np.frombuffer(
+            self._mmap, dtype=np.uint8, count=height * width, offset=int(entry["offset"])
+        ).reshape(height, width)
+
+    def level(self, level_id):
+        """LEVEL_ID ile grid"""
+        return self.grid_at(self._row(level_id))
+
+    def by_seed(self, seed):
+        """HOUDINI_SEED ile grid"""
+        return self.grid_at(self._row_by_seed(seed))
+
+    def params(self, level_id):
+        """LEVEL_ID'nin generation parametreleri (seed dahil)"""
+        row = self._row(level_id)
+        params = dict(zip(self.param_names, self.param_table[row].tolist()))
+        params["seed"] = int(self.index[row]["seed"])
+        return params
+
+    def ascii_rows(self, level_id):
+        """Grid'i GRID_ASCII satırları olarak döndür"""
+        rows, _ = grid_engine.serialize_grid(self.level(level_id))
+        return rows
+
+    def __iter__(self):
+        """(level_id, seed, grid) üçlüleri, dosya sırasıyla"""
+        for row in range(len(self)):
+            entry = self.index[row]
+            yield int(entry["level_id"]), int(entry["seed"]), self.grid_at(row)
+
+    def close(self):
+        # Dışarıda hâlâ grid view'ı varsa mmap kapatılamaz; GC'ye bırakılır
+        self.index = None
+        self.param_table = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
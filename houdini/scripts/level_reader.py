@@ -0,0 +1,355 @@
+"""
+Level Reader
+Export edilmiş bütün level formatları için lazy okuyucu (Houdini'siz)
+
+Desteklenen formatlar:
+    v3.8, v3.99, v4.0 - v4.3   my_exporter INI'leri (tek level veya DATASET_*.ini çok level)
+    v3.1                       GET_LVL_INFO INI'si ([LEVEL_TAG] bölümü + CONTROLLER PARAMETERS)
+    v3.1 JSON                  GET_LVL_INFO JSON mirror'ı
+
+Dosya bir kez byte olarak okunur, sadece bölüm başlıklarının offset'leri indekslenir.
+CELL_TYPES / LEVEL_CONFIG / GENERATION_PARAMS ilk erişimde parse edilir; GRID_ASCII
+karakter karakter dolaşılmadan (height, width) uint8 array'ine çevrilir.
+
+Kullanım:
+    for level in level_reader.iter_levels("unity/Assets/Levels"):
+        print(level.format_version, level.level_id, level.seed, level.grid.shape)
+"""
+
+import glob
+import json
+import os
+import re
+
+import numpy as np
+
+
+LEVEL_EXTENSIONS = (".ini", ".json")
+
+SECTION_RE = re.compile(rb"^\[([A-Za-z0-9_]+)\][ \t]*\r?$", re.MULTILINE)
+DATASET_VERSION_RE = re.compile(rb"^# === LEVEL DATASET (v[0-9.]+) ===", re.MULTILINE)
+UNITY_V31_RE = re.compile(rb"^# Unity Level Data (v[0-9.]+)", re.MULTILINE)
+# Grid bloğu boş satır, yorum ("# ...") ya da yeni bölümle biter ('#' tek başına duvar karakteri)
+GRID_END_RE = re.compile(rb"\n(?:\r?\n|# |\[)")
+# Dosya başındaki "# Generator: Houdini 20.0.547" tarzı satırlar
+HEADER_FIELD_RE = re.compile(rb"^# ([A-Za-z ]+): (.*?)\r?$", re.MULTILINE)
+
+GRID_SECTION = "GRID_ASCII"
+CELL_TYPES_SECTION = "CELL_TYPES"
+CONFIG_SECTION = "LEVEL_CONFIG"
+PARAMS_SECTION = "GENERATION_PARAMS"
+DATASET_INDEX_SECTION = "DATASET_INDEX"
+
+
+def parse_value(text):
+    """INI değerini int / float / bool / str'ye çevir"""
+    lowered = text.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def parse_key_values(block):
+    """KEY=VALUE satırları (yorumlar ve boş satırlar atlanır)"""
+    values = {}
+    for line in block.decode("utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        values[key.strip()] = parse_value(value.strip())
+    return values
+
+
+def parse_cell_types(block):
+    """[CELL_TYPES] -> {id: {symbol, name, passable, prefab_index, attributes}}"""
+    cell_types = {}
+    for key, value in parse_key_values(block).items():
+        parts = str(value).split(",")
+        attributes = dict(part.split(":", 1) for part in parts[4:] if ":" in part)
+        cell_types[int(key)] = {
+            "symbol": parts[0],
+            "name": parts[1] if len(parts) > 1 else "",
+            "passable": parts[2].lower() == "true" if len(parts) > 2 else True,
+            "prefab_index": int(parts[3]) if len(parts) > 3 else int(key),
+            "attributes": attributes,
+        }
+    return cell_types
+
+
+def grid_from_bytes(block):
+    """
+    GRID_ASCII satırlarını (height, width) uint8 array'ine çevir.
+    Satırlar eşit uzunluktaysa tek reshape (satır sonu sütunu kesilir),
+    değilse kısa satırlar '.' ile doldurulur.
+    """
+    if not block.endswith(b"\n"):
+        block += b"\n"
+    stride = block.find(b"\n") + 1
+    width = stride - 1
+    if width > 0 and block[width - 1:width] == b"\r":
+        width -= 1
+
+    codes = np.frombuffer(block, dtype=np.uint8)
+    if stride > 1 and codes.size % stride == 0:
+        grid = codes.reshape(-1, stride)
+        if np.all(grid[:, stride - 1] == ord("\n")):
+            return grid[:, :width]
+
+    rows = block.decode("ascii").splitlines()
+    width = max(len(row) for row in rows)
+    return np.frombuffer("".join(row.ljust(width, ".") for row in rows).encode("ascii"),
+                         dtype=np.uint8).reshape(len(rows), width)
+
+
+class LevelRecord:
+    """Tek level; bölümler ilk erişimde parse edilir"""
+
+    def __init__(self, level_file, sections):
+        self.level_file = level_file
+        self._sections = sections  # {isim: (başlangıç, bitiş)} byte aralıkları
+        self._cache = {}
+
+    @property
+    def path(self):
+        return self.level_file.path
+
+    @property
+    def format_version(self):
+        return self.level_file.format_version
+
+    def section_names(self):
+        return list(self._sections)
+
+    def raw_section(self, name):
+        start, end = self._sections[name]
+        return self.level_file.data[start:end]
+
+    def _parsed(self, key, parser):
+        if key not in self._cache:
+            self._cache[key] = parser()
+        return self._cache[key]
+
+    @property
+    def cell_types(self):
+        return self._parsed("cell_types", lambda: (
+            parse_cell_types(self.raw_section(CELL_TYPES_SECTION))
+            if CELL_TYPES_SECTION in self._sections else {}
+        ))
+
+    @property
+    def config(self):
+        """[LEVEL_CONFIG] (v3.1: [LEVEL_TAG] bölümü)"""
+        return self._parsed("config", lambda: parse_key_values(self.raw_section(self._config_section())))
+
+    @property
+    def generation_params(self):
+        """[GENERATION_PARAMS] (v3.1: CONTROLLER PARAMETERS, level bölümünün içinde)"""
+        def parse():
+            if PARAMS_SECTION in self._sections:
+                return parse_key_values(self.raw_section(PARAMS_SECTION))
+            return self.config
+        return self._parsed("params", parse)
+
+    def _config_section(self):
+        if CONFIG_SECTION in self._sections:
+            return CONFIG_SECTION
+        for name in self._sections:
+            if name not in (CELL_TYPES_SECTION, PARAMS_SECTION, GRID_SECTION):
+                return name
+        raise KeyError(f"No level config section in {self.path}")
+
+    @property
+    def level_id(self):
+        config = self.config
+        if "LEVEL_ID" in config:
+            return config["LEVEL_ID"]
+        return self._config_section()
+
+    @property
+    def seed(self):
+        return self.generation_params.get("HOUDINI_SEED")
+
+    @property
+    def grid(self):
+        """GRID_ASCII: (height, width) uint8 ASCII kodları"""
+        return self._parsed("grid", lambda: grid_from_bytes(self.raw_section(GRID_SECTION)))
+
+    @property
+    def grid_chars(self):
+        """GRID_ASCII: (height, width) 'S1' karakter view'ı (kopyasız)"""
+        return self.grid.view("S1")
+
+    def ascii_rows(self):
+        return [row.tobytes().decode("ascii") for row in self.grid]
+
+
+class JsonLevelRecord(LevelRecord):
+    """v3.1 JSON mirror'ı (JSON tek seferde parse edilir, grid yine tek reshape)"""
+
+    def __init__(self, level_file, obj):
+        super().__init__(level_file, {})
+        self._obj = obj
+
+    def section_names(self):
+        return [CELL_TYPES_SECTION, self._obj["level"].get("tag", CONFIG_SECTION), GRID_SECTION]
+
+    @property
+    def cell_types(self):
+        return {
+            cell["id"]: {
+                "symbol": cell["symbol"],
+                "name": cell["name"],
+                "passable": cell["passable"],
+                "prefab_index": cell["prefab_index"],
+                "attributes": cell.get("attributes", {}),
+            }
+            for cell in self._obj.get("cell_types", [])
+        }
+
+    @property
+    def config(self):
+        level = self._obj["level"]
+        return {key.upper(): value for key, value in level.items() if not isinstance(value, (dict, list))}
+
+    @property
+    def generation_params(self):
+        params = self._obj["level"].get("controller_parameters", {})
+        return {key: parse_value(str(value)) for key, value in params.items()}
+
+    @property
+    def level_id(self):
+        return self._obj["level"].get("tag")
+
+    @property
+    def grid(self):
+        return self._parsed("grid", lambda: grid_from_bytes(
+            "\n".join(self._obj["level"].get("grid_ascii", [])).encode("ascii")
+        ))
+
+
+class LevelFile:
+    """Bir level dosyası; bölüm başlıkları tek regex taramasıyla indekslenir"""
+
+    def __init__(self, path, data=None):
+        self.path = path
+        self.data = data if data is not None else _read_bytes(path)
+        self.format_version = detect_format(self.data)
+        self._levels = None
+
+    @property
+    def header(self):
+        """İlk bölümden önceki '# Key: Value' alanları (Generator, Export Date, Levels ...)"""
+        if self.format_version == "v3.1-json":
+            meta = json.loads(self.data.decode("utf-8")).get("meta", {})
+            return {"Generator": meta.get("generator", ""), "Export Date": meta.get("export_date", "")}
+        match = SECTION_RE.search(self.data)
+        head = self.data[:match.start() if match else len(self.data)]
+        return {m.group(1).decode("utf-8"): m.group(2).decode("utf-8") for m in HEADER_FIELD_RE.finditer(head)}
+
+    @property
+    def levels(self):
+        if self._levels is None:
+            self._levels = self._split_levels()
+        return self._levels
+
+    def _split_levels(self):
+        if self.format_version == "v3.1-json":
+            return [JsonLevelRecord(self, json.loads(self.data.decode("utf-8")))]
+
+        # Bölüm sınırları: bir bölüm, bir sonraki başlığa kadar sürer
+        headers = [(m.group(1).decode("ascii"), m.start(), m.end()) for m in SECTION_RE.finditer(self.data)]
+        levels = []
+        shared = {}   # v3.1: CELL_TYPES bütün level'lar için ortak
+        current = {}
+        for i, (name, _, body_start) in enumerate(headers):
+            body_end = headers[i + 1][1] if i + 1 < len(headers) else len(self.data)
+            if name == GRID_SECTION:
+                grid_start = body_start + 1
+                match = GRID_END_RE.search(self.data, grid_start)
+                current[name] = (grid_start, match.start() + 1 if match else body_end)
+                levels.append(LevelRecord(self, dict(shared, **current)))
+                current = {}
+            elif name == DATASET_INDEX_SECTION:
+                continue
+            else:
+                current[name] = (body_start, body_end)
+                if name == CELL_TYPES_SECTION and not levels:
+                    shared[name] = current[name]
+        return levels
+
+    def __len__(self):
+        return len(self.levels)
+
+    def __iter__(self):
+        return iter(self.levels)
+
+    def __getitem__(self, index):
+        return self.levels[index]
+
+
+def _read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def detect_format(data):
+    """Dosya başından format versiyonu: 'v3.8' ... 'v4.3', 'v3.1' veya 'v3.1-json'"""
+    head = data[:512]
+    if head.lstrip()[:1] == b"{":
+        return "v3.1-json"
+    match = DATASET_VERSION_RE.search(head)
+    if match:
+        return match.group(1).decode("ascii")
+    match = UNITY_V31_RE.search(head)
+    if match:
+        return match.group(1).decode("ascii")
+    raise ValueError("Unknown level file format")
+
+
+def read_level_file(path):
+    """Tek dosyayı aç (bölümler lazy)"""
+    return LevelFile(path)
+
+
+def read_level(path, index=0):
+    """Dosyadaki index. level (tek level'lı dosyalar için kısayol)"""
+    return read_level_file(path).levels[index]
+
+
+def level_paths(folder, extensions=LEVEL_EXTENSIONS):
+    """Klasördeki level dosyaları (Unity .meta dosyaları hariç), isim sırasıyla"""
+    paths = []
+    for extension in extensions:
+        paths.extend(glob.glob(os.path.join(folder, "*" + extension)))
+    return sorted(paths)
+
+
+def iter_levels(folder, extensions=LEVEL_EXTENSIONS, skip_errors=True):
+    """Klasördeki bütün dosyalardaki bütün level'lar"""
+    for path in level_paths(folder, extensions):
+        try:
+            level_file = read_level_file(path)
+        except (OSError, ValueError) as e:
+            if not skip_errors:
+                raise
+            print(f"⚠️ {os.path.basename(path)} okunamadı: {e}")
+            continue
+        yield from level_file.levels
+
+
+if __name__ == "__main__":
+    import sys
+
+    folder = sys.argv[1] if len(sys.argv) > 1 else "."
+    for level in iter_levels(folder):
+        height, width = level.grid.shape
+        print(f"{os.path.basename(level.path):<36}{level.format_version:<11}"
+              f"id={level.level_id}  seed={level.seed}  {width}x{height}")
@@ -0,0 +1,289 @@
+"""
+Level Migrator
+Levels klasörünü herhangi bir bilinen format versiyonundan güncel INI formatına
+ya da binary level pack'e çevirir (Houdini'siz, process pool ile)
+
+- Her kaynak dosya bir worker'da level_reader ile okunur, grid legend'ı güncellenir
+  (eski 'X' stairs / 'S' atıcı -> 'S' / 'F'; --strip-path ile '1' yol işareti -> '.').
+- INI çıktıları dosya başına atomik yazılır (.tmp -> os.replace).
+- Aynı hedef dosyaya düşen kaynakların (LEVEL_0001_v1.0.0_v3.8 / _v4.2 ...) hepsi çevrilir:
+  en yeni format versiyonlu olan hedef adı alır, diğerleri kaynak versiyonuyla son eklenir
+  (LEVEL_0001_v1.0.0_v4.2_v4.3.ini). İçeriği (seed + grid) aynı olan kopyalar atlanır ve
+  tek tek raporlanır; pack'te farklı içerikli kopyalar en büyük LEVEL_ID'den sonra yeni ID alır.
+
+Kullanım:
+    python migrate_levels.py ../../unity/Assets/Levels --out migrated
+    python migrate_levels.py ../../unity/Assets/Levels --pack levels.blp --workers 8
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import grid_engine
+import level_format
+import level_pack
+import level_reader
+
+
+VERSION_SUFFIX_RE = re.compile(r"_(v[0-9]+(?:\.[0-9]+)*)$")
+LEVEL_NUMBER_RE = re.compile(r"LEVEL_0*([0-9]+)", re.IGNORECASE)
+
+# [GENERATION_PARAMS] anahtarı -> get_controller_data() anahtarı
+GENERATION_PARAM_KEYS = {
+    "HOUDINI_SEED": "seed",
+    "ROOM_COUNT": "room_count",
+    "ENEMY_DENSITY": "enemy_density",
+    "LOOT_DENSITY": "loot_density",
+    "COIN_DENSITY": "coin_density",
+    "HEALTH_DENSITY": "health_density",
+    "BREAKABLE_DENSITY": "breakable_density",
+    "EDGE_WALL_BIAS": "edge_wall_bias",
+    "NOISE_SCALE": "noise_scale",
+    "NOISE_THRESHOLD": "noise_threshold",
+    "MIN_ROOM_SIZE": "min_room_size",
+    "MAX_ROOM_SIZE": "max_room_size",
+    "MIN_PLAYER_EXIT_DIST": "min_player_exit_dist",
+}
+
+
+def version_key(version):
+    """'v3.99' -> (3, 99); sürüm sıralaması için"""
+    return tuple(int(part) for part in version.lstrip("v").split(".") if part.isdigit())
+
+
+def output_name(src_path, target):
+    """Kaynak dosya adındaki format son ekini hedef versiyonla değiştir"""
+    stem = os.path.splitext(os.path.basename(src_path))[0]
+    match = VERSION_SUFFIX_RE.search(stem)
+    if match:
+        stem = stem[:match.start()]
+    return f"{stem}_{target}.ini"
+
+
+def source_version(src_path):
+    match = VERSION_SUFFIX_RE.search(os.path.splitext(os.path.basename(src_path))[0])
+    return version_key(match.group(1)) if match else ()
+
+
+def variant_name(src_path, target):
+    """Aynı hedefe düşen eski kaynak için ad: kaynak format versiyonu stem'de kalır"""
+    stem = os.path.splitext(os.path.basename(src_path))[0]
+    return f"{stem}_{target}.ini"
+
+
+def plan_migration(src_paths, target):
+    """
+    Bütün kaynaklar için (kaynak, hedef ad, grup) listesi; grup = ortak hedef ad.
+    Grubun en yeni versiyonlu kaynağı grup adını alır ve grupta ilk sıradadır,
+    diğerleri variant_name ile (yeniden eskiye).
+    """
+    groups = {}
+    for path in src_paths:
+        groups.setdefault(output_name(path, target), []).append(path)
+
+    plan = []
+    for group in sorted(groups):
+        paths = sorted(groups[group], key=source_version, reverse=True)
+        plan.append((paths[0], group, group))
+        plan.extend((path, variant_name(path, target), group) for path in paths[1:])
+    return plan
+
+
+def content_fingerprint(levels):
+    """Çevrilmiş level'ların (seed + grid) özeti; aynı içerikli kopyaları ayırt etmek için"""
+    digest = hashlib.sha1()
+    for _, _, controller_data, grid in levels:
+        digest.update(f"{controller_data.get('seed', '')}|{grid.shape}|".encode("ascii"))
+        digest.update(grid.tobytes())
+    return digest.hexdigest()
+
+
+def level_number(level, fallback):
+    """LEVEL_ID (v3.1'de LEVEL_001_Tutorial gibi tag'den), yoksa fallback"""
+    level_id = level.level_id
+    if isinstance(level_id, int):
+        return level_id
+    match = LEVEL_NUMBER_RE.search(str(level_id))
+    return int(match.group(1)) if match else fallback
+
+
+def convert_level(level, fallback_id, strip_path):
+    """Tek level -> (level_id, level_version, controller_data, grid kodları)"""
+    params = level.generation_params
+    controller_data = {
+        name: params[key] for key, name in GENERATION_PARAM_KEYS.items() if key in params
+    }
+    level_version = str(level.config.get("VERSION", "v1.0.0"))
+    if not level_version.startswith("v"):
+        level_version = "v" + level_version
+    grid = level_format.migrate_grid(level.grid, strip_path)
+    return level_number(level, fallback_id), level_version, controller_data, grid
+
+
+def ini_controller_data(controller_data):
+    """INI'ye yazılacak bütün GENERATION_PARAMS alanları (kaynakta olmayanlar boş)"""
+    return {name: controller_data.get(name, "") for name in GENERATION_PARAM_KEYS.values()}
+
+
+def write_ini(dst_path, levels, target, generator, export_date):
+    """Güncel formatta atomik yaz (tek level -> LEVEL dosyası, çok level -> DATASET)"""
+    first_version = levels[0][1]
+    export_params = {"level_version": first_version, "format_version": target}
+
+    if len(levels) > 1:
+        with level_format.LevelDatasetWriter(dst_path, export_params, generator) as writer:
+            for level_id, _, controller_data, grid in levels:
+                writer.add_level(level_id, ini_controller_data(controller_data), grid)
+        return
+
+    level_id, _, controller_data, grid = levels[0]
+    height, width = grid.shape
+    rows, _ = grid_engine.serialize_grid(grid)
+    content = level_format.level_content(level_id, ini_controller_data(controller_data), rows, width, height,
+                                         export_params, generator, export_date)
+    tmp_path = dst_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(content)
+    os.replace(tmp_path, dst_path)
+
+
+def migrate_file(task):
+    """Worker: bir kaynak dosyayı çevir; pack hedefinde level'lar ana process'e döner"""
+    src_path, dst_path, target, strip_path = task
+    result = {"source": src_path, "output": dst_path, "levels": 0, "bytes": 0, "error": None, "pack_levels": None}
+    try:
+        level_file = level_reader.read_level_file(src_path)
+        result["bytes"] = len(level_file.data)
+        result["source_version"] = level_file.format_version
+        levels = [convert_level(level, i, strip_path) for i, level in enumerate(level_file.levels, 1)]
+        result["levels"] = len(levels)
+        if not levels:
+            raise ValueError("No levels in file")
+        result["fingerprint"] = content_fingerprint(levels)
+
+        if dst_path is None:
+            result["pack_levels"] = [(level_id, controller_data, grid) for level_id, _, controller_data, grid in levels]
+        else:
+            header = level_file.header
+            write_ini(dst_path, levels, target, header.get("Generator") or level_format.DEFAULT_GENERATOR,
+                      header.get("Export Date"))
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+def migrate_directory(src_dir, out_dir=None, pack_path=None, target=level_format.CURRENT_FORMAT_VERSION,
+                      workers=None, strip_path=False):
+    """Klasörü çevir; out_dir -> INI dosyaları, pack_path -> tek .blp. Özet sözlüğü döner."""
+    if (out_dir is None) == (pack_path is None):
+        raise ValueError("Exactly one of out_dir / pack_path must be given")
+
+    plan = plan_migration(level_reader.level_paths(src_dir), target)
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+        tasks = [(src, os.path.join(out_dir, name), target, strip_path) for src, name, _ in plan]
+    else:
+        tasks = [(src, None, target, strip_path) for src, _, _ in plan]
+
+    print(f"🚚 Migrating {len(tasks)} files -> {pack_path or out_dir} ({target}), "
+          f"workers={workers or os.cpu_count()}")
+    start = time.perf_counter()
+    results = []
+    skipped = []
+    variants = []
+    fingerprints = {}
+    deferred = []
+    max_level_id = 0
+
+    pack = level_pack.LevelPackWriter(pack_path, format_version=target) if pack_path else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(tasks) // (4 * (workers or os.cpu_count() or 1)))
+            for (src, name, group), result in zip(plan, pool.map(migrate_file, tasks, chunksize=chunksize)):
+                results.append(result)
+                if result["error"]:
+                    print(f"   ❌ {os.path.basename(src)}: {result['error']}")
+                    continue
+                seen = fingerprints.setdefault(group, {})
+                if result["fingerprint"] in seen:
+                    # Aynı içerik grupta zaten var: kopyayı at
+                    skipped.append(src)
+                    print(f"   ⏭️  {os.path.basename(src)}: same seed / grid as {seen[result['fingerprint']]}, skipped")
+                    if result["output"] is not None:
+                        os.remove(result["output"])
+                    result["pack_levels"] = None
+                    continue
+                seen[result["fingerprint"]] = os.path.basename(src)
+                if name != group:
+                    variants.append(src)
+                    print(f"   ⚠️  {os.path.basename(src)}: content differs from {group}, kept as {name}")
+
+                if pack is not None:
+                    entries = [(level_id, dict(controller_data, seed=controller_data.get("seed", -1)), grid)
+                               for level_id, controller_data, grid in result["pack_levels"]]
+                    if name != group:
+                        deferred.extend((src, entry) for entry in entries)
+                    else:
+                        for entry in entries:
+                            pack.add_level(*entry)
+                            max_level_id = max(max_level_id, entry[0])
+                    result["pack_levels"] = None
+
+        if pack is not None and deferred:
+            # Farklı içerikli kopyalar LEVEL_ID çakışmasın diye en büyük ID'den sonra eklenir
+            next_id = max_level_id + 1
+            for src, (level_id, controller_data, grid) in deferred:
+                print(f"   ↪️  {os.path.basename(src)}: LEVEL_ID {level_id} -> {next_id} in pack")
+                pack.add_level(next_id, controller_data, grid)
+                next_id += 1
+    except BaseException:
+        if pack is not None:
+            pack.abort()
+        raise
+    if pack is not None:
+        pack.close()
+
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    ok = [r for r in results if not r["error"]]
+    levels = sum(r["levels"] for r in ok)
+    megabytes = sum(r["bytes"] for r in ok) / (1024.0 * 1024.0)
+    summary = {
+        "files": len(ok),
+        "failed": len(results) - len(ok),
+        "skipped": len(skipped),
+        "skipped_files": skipped,
+        "variants": len(variants),
+        "levels": levels,
+        "seconds": elapsed,
+        "files_per_s": len(ok) / elapsed,
+        "levels_per_s": levels / elapsed,
+        "mb_per_s": megabytes / elapsed,
+    }
+    print(f"✅ {summary['files']} files / {levels} levels in {elapsed:.2f}s "
+          f"({summary['files_per_s']:.0f} files/s, {summary['levels_per_s']:.0f} levels/s, "
+          f"{summary['mb_per_s']:.1f} MB/s), {summary['failed']} failed, "
+          f"{summary['skipped']} identical copies skipped, {summary['variants']} differing copies kept")
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Migrate exported levels to the current format or a level pack")
+    parser.add_argument("src", help="Kaynak level klasörü")
+    parser.add_argument("--out", default=None, help="Güncel INI dosyalarının yazılacağı klasör")
+    parser.add_argument("--pack", default=None, help="Tek binary level pack (.blp) çıktısı")
+    parser.add_argument("--target", default=level_format.CURRENT_FORMAT_VERSION, help="Hedef format versiyonu")
+    parser.add_argument("--workers", type=int, default=None, help="Worker process sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--strip-path", action="store_true", help="Garanti yol işaretini ('1') boş hücreye çevir")
+    args = parser.parse_args(argv)
+
+    if (args.out is None) == (args.pack is None):
+        parser.error("--out veya --pack seçeneklerinden tam olarak biri gerekli")
+    migrate_directory(args.src, args.out, args.pack, args.target, args.workers, args.strip_path)
+
+
+if __name__ == "__main__":
+    main()
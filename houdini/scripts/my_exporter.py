@@ -7,7 +7,15 @@ FIX: FORMAT_PARAMS support added
 
 import hou
 import os
-from datetime import datetime
+
+import numpy as np
+
+import grid_bridge
+import grid_engine
+import level_cache
+import level_format
+import level_pack
+import stage_profiler
 
 
 def get_controller_data():
@@ -37,7 +45,13 @@ def get_controller_data():
 
 
 def get_tile_data():
-    """4_VISUALIZE_MAP node'undan tile verilerini çıkar"""
+    """
+    4_VISUALIZE_MAP node'undan tile verilerini çıkar.
+
+    Pozisyonlar ve tile_char değerleri tek seferde (bulk) okunur, grid indekslerine
+    array işlemleriyle çevrilir. Dönüş: (height, width) dense char array'i,
+    z min → z max satırlar, x soldan sağa. Prim'i olmayan hücreler "" kalır.
+    """
     visualize_node = hou.node("/obj/main/4_VISUALIZE_MAP")
     
     if not visualize_node:
@@ -47,147 +61,43 @@ def get_tile_data():
     if not geo:
         raise Exception("No geometry found in 4_VISUALIZE_MAP!")
     
-    prims = geo.prims()
-    if not prims:
+    centers = grid_bridge.prim_centers(geo)
+    if centers.shape[0] == 0:
         raise Exception("No primitives found in 4_VISUALIZE_MAP!")
     
-    print(f"🔍 Tile Data Debug:")
-    print(f"   Total primitives: {len(prims)}")
-    
-    # Tile verilerini topla
-    grid_chars = {}
-    empty_chars = 0
-    valid_chars = 0
-    
-    # DEEP DEBUG: Koordinat dağılımını incele
-    x_coords = []
-    z_coords = []
-    
-    for i, prim in enumerate(prims):
-        bbox = prim.boundingBox()
-        center = bbox.center()
-        
-        # FIX: Koordinat konversiyonu - Houdini world space'ten grid space'e
-        # Houdini'de 0.5, 1.5, 2.5... -> Grid'de 0, 1, 2...
-        x = int(round(center[0] - 0.5))  # FIX: 0.5 offset çıkar
-        z = int(round(center[2] - 0.5))  # FIX: 0.5 offset çıkar
-        
-        x_coords.append(x)
-        z_coords.append(z)
-        
-        # tile_char attribute'unu al
-        try:
-            tile_char = prim.attribValue("tile_char")
-        except:
-            tile_char = None
-        
-        # Debug: İlk birkaç tile'ı göster
-        if i < 10:
-            print(f"   Prim {i}: pos({center[0]:.3f}, {center[2]:.3f}) -> grid({x}, {z}) -> char: '{tile_char}'")
-        
-        if x not in grid_chars:
-            grid_chars[x] = {}
-        grid_chars[x][z] = tile_char
-        
-        # İstatistik
-        if tile_char is None or tile_char == "" or tile_char == ".":
-            empty_chars += 1
-        else:
-            valid_chars += 1
-    
-    # Koordinat analizi
-    x_min, x_max = min(x_coords), max(x_coords)
-    z_min, z_max = min(z_coords), max(z_coords)
-    expected_total = (x_max - x_min + 1) * (z_max - z_min + 1)
-    actual_total = len(prims)
+    # tile_char attribute'unu tek seferde al (yoksa hepsi boş)
+    if geo.findPrimAttrib("tile_char"):
+        tile_chars = np.asarray(geo.primStringAttribValues("tile_char"), dtype="<U1")
+    else:
+        tile_chars = np.full(centers.shape[0], "", dtype="<U1")
     
-    print(f"🔍 Koordinat Analizi (FIXED):")
-    print(f"   X coords: {x_min} to {x_max} (range: {x_max - x_min + 1})")
-    print(f"   Z coords: {z_min} to {z_max} (range: {z_max - z_min + 1})")
-    print(f"   Expected total tiles: {expected_total}")
-    print(f"   Actual primitives: {actual_total}")
-    print(f"   Missing tiles: {expected_total - actual_total}")
-    print(f"   Valid chars: {valid_chars}, Empty chars: {empty_chars}")
+    # Koordinat konversiyonu - Houdini world space'ten grid space'e
+    # Houdini'de 0.5, 1.5, 2.5... -> Grid'de 0, 1, 2...
+    xs = np.rint(centers[:, 0] - 0.5).astype(np.int64)
+    zs = np.rint(centers[:, 2] - 0.5).astype(np.int64)
+    x_min, z_min = int(xs.min()), int(zs.min())
+    grid_width = int(xs.max()) - x_min + 1
+    grid_height = int(zs.max()) - z_min + 1
     
-    # X ve Z koordinat dağılımını kontrol et
-    x_unique = sorted(set(x_coords))
-    z_unique = sorted(set(z_coords))
-    print(f"   Unique X coords: {len(x_unique)} -> {x_unique[:15]}...")
-    print(f"   Unique Z coords: {len(z_unique)} -> {z_unique[:15]}...")
+    # Boş karakterli tile'lar '.', prim'i olmayan hücreler "" (eksik)
+    grid_chars = np.full((grid_height, grid_width), "", dtype="<U1")
+    grid_chars[zs - z_min, xs - x_min] = np.where(tile_chars == "", ".", tile_chars)
     
-    if not grid_chars:
-        raise Exception("No tile data found!")
+    valid_chars = int(np.count_nonzero(tile_chars != ""))
+    print(f"🔍 Tile Data: {centers.shape[0]} primitives -> grid {grid_width}x{grid_height} "
+          f"(X {x_min}..{x_min + grid_width - 1}, Z {z_min}..{z_min + grid_height - 1}), "
+          f"valid chars: {valid_chars}, missing tiles: {grid_width * grid_height - centers.shape[0]}")
     
     return grid_chars
 
 
 def create_ascii_grid(grid_chars):
-    """Grid karakterlerinden ASCII grid oluştur"""
-    # Grid boyutları
-    min_x = min(grid_chars.keys())
-    max_x = max(grid_chars.keys())
-    min_z = min(min(row.keys()) for row in grid_chars.values())
-    max_z = max(max(row.keys()) for row in grid_chars.values())
-    
-    grid_width = max_x - min_x + 1
-    grid_height = max_z - min_z + 1
-    
-    print(f"🔍 Grid Debug:")
-    print(f"   X range: {min_x} to {max_x} (width: {grid_width})")
-    print(f"   Z range: {min_z} to {max_z} (height: {grid_height})")
-    print(f"   Total tiles: {sum(len(row) for row in grid_chars.values())}")
-    
-    # DEEP DEBUG: Hangi koordinatlarda tile var?
-    all_coords = []
-    for x in grid_chars:
-        for z in grid_chars[x]:
-            all_coords.append((x, z))
-    
-    print(f"   İlk 10 koordinat: {all_coords[:10]}")
-    print(f"   Son 10 koordinat: {all_coords[-10:]}")
-    
-    # ASCII grid oluştur - FIX: Doğru yön
-    ascii_grid = []
-    question_count = 0
-    valid_count = 0
-    
-    for z in range(min_z, max_z + 1):  # FIX: Aşağıdan yukarıya (normal order)
-        row = ""
-        row_questions = 0
-        row_valids = 0
-        
-        for x in range(min_x, max_x + 1):  # Soldan sağa
-            if x in grid_chars and z in grid_chars[x]:
-                char = grid_chars[x][z]
-                # FIX: Boş karakter kontrolü
-                if char is None or char == "":
-                    row += "."
-                    row_valids += 1
-                    valid_count += 1
-                else:
-                    row += str(char)
-                    row_valids += 1
-                    valid_count += 1
-            else:
-                row += "?"
-                row_questions += 1
-                question_count += 1
-        
-        ascii_grid.append(row)
-        
-        # Debug: İlk birkaç satırı göster
-        if len(ascii_grid) <= 5:
-            print(f"   Row {z}: {row[:30]}{'...' if len(row) > 30 else ''}")
-            print(f"     -> Valids: {row_valids}, Questions: {row_questions}")
-    
-    print(f"🚨 SUMMARY: Valid tiles: {valid_count}, Missing tiles (?): {question_count}")
+    """Dense grid char array'inden ASCII grid oluştur (tek vektörize join, eksik hücreler '?')"""
+    grid_height, grid_width = grid_chars.shape
+    ascii_grid, question_count = grid_engine.serialize_grid(grid_chars)
     
-    # DEEP DEBUG: grid_chars yapısını kontrol et
-    print(f"🔍 Grid_chars yapısı:")
-    x_keys = sorted(grid_chars.keys())[:5]  # İlk 5 X koordinatı
-    for x in x_keys:
-        z_keys = sorted(grid_chars[x].keys())
-        print(f"   X={x}: Z values = {z_keys[:10]}...")  # İlk 10 Z değeri
+    print(f"🚨 SUMMARY: Grid {grid_width}x{grid_height}, "
+          f"Valid tiles: {grid_width * grid_height - question_count}, Missing tiles (?): {question_count}")
     
     return ascii_grid, grid_width, grid_height
 
@@ -234,7 +144,8 @@ def get_export_parameters(source_node=None):
                 "export_folder": format_node.parm("levels_folder").eval() if format_node.parm("levels_folder") else "E:/UNITY/BombermanTower/unity/Assets/Levels",
                 "format_version": format_node.parm("format_version").eval() if format_node.parm("format_version") else "v3.8",
                 "level_version": format_node.parm("level_version").eval() if format_node.parm("level_version") else "v1.0.0",
-                "level_count": format_node.parm("level_count").eval() if format_node.parm("level_count") else 1  # NEW: Level sayısı
+                "level_count": format_node.parm("level_count").eval() if format_node.parm("level_count") else 1,  # NEW: Level sayısı
+                "export_format": format_node.parm("export_format").eval() if format_node.parm("export_format") else "ini"
             }
         except Exception as e:
             print(f"⚠️ FORMAT_PARAMS node'undan parametre alınırken hata: {e}")
@@ -268,7 +179,8 @@ def get_export_parameters(source_node=None):
                 "export_folder": source_node.parm("levels_folder").eval() if source_node.parm("levels_folder") else "E:/UNITY/BombermanTower/unity/Assets/Levels",
                 "format_version": source_node.parm("format_version").eval() if source_node.parm("format_version") else "v3.8",
                 "level_version": source_node.parm("level_version").eval() if source_node.parm("level_version") else "v1.0.0",
-                "level_count": source_node.parm("level_count").eval() if source_node.parm("level_count") else 1  # NEW: Level sayısı
+                "level_count": source_node.parm("level_count").eval() if source_node.parm("level_count") else 1,  # NEW: Level sayısı
+                "export_format": source_node.parm("export_format").eval() if source_node.parm("export_format") else "ini"
             }
         except Exception as e:
             print(f"⚠️ Source node'dan parametre alınırken hata: {e}")
@@ -279,7 +191,8 @@ def get_export_parameters(source_node=None):
         "export_folder": "E:/UNITY/BombermanTower/unity/Assets/Levels",
         "format_version": "v3.8",
         "level_version": "v1.0.0",
-        "level_count": 1  # NEW: Default 1 level
+        "level_count": 1,  # NEW: Default 1 level
+        "export_format": "ini"  # "ini" (level başına dosya), "dataset" (tek INI dataset) veya "pack" (tek .blp level pack)
     }
 
 
@@ -319,33 +232,83 @@ def cook_pipeline_with_seed(seed_value):
         return False
 
 
-def export_single_level(level_id, seed_value, export_params):
-    """Tek bir level export et"""
+def level_pack_filename(export_params):
+    """Binary level pack dosya adı (export_format == "pack")"""
+    return f"LEVELS_{export_params['level_version']}_{export_params['format_version']}{level_pack.PACK_EXTENSION}"
+
+
+def get_stage_script_hashes():
+    """Level içeriğini etkileyen script'lerin hash'leri (SOP stage'leri + scripts modülleri)"""
+    script_dirs = [hou.expandString("$HIP/houdiniScripts"), hou.expandString("$HIP/scripts")]
+    return level_cache.script_hashes(script_dirs)
+
+
+def open_generation_cache():
+    """Generation cache'ini aç (BOMBERMAN_LEVEL_CACHE tanımlıysa; "on" -> $HIP/level_cache)"""
+    try:
+        return level_cache.from_environment(hou.expandString("$HIP/level_cache"))
+    except Exception as e:
+        print(f"⚠️ Level cache açılamadı, cache'siz devam: {e}")
+        return None
+
+
+def export_single_level(level_id, seed_value, export_params, level_writer=None, cache=None, stage_hashes=None):
+    """
+    Tek bir level export et (level_writer verilirse ayrı INI yerine dataset / pack'e eklenir).
+    cache verilirse aynı seed + CONTROLLER + script hash'leri için cook atlanır.
+    """
     try:
         print(f"📄 Level {level_id:04d} export başlatılıyor (seed: {seed_value})...")
         
-        # 1. Pipeline'ı bu seed ile cook et
-        if not cook_pipeline_with_seed(seed_value):
-            return False
-        
-        # 2. CONTROLLER verilerini al (güncel seed ile)
-        controller_data = get_controller_data()
+        # 0. Cache: anahtar cook'tan önce CONTROLLER değerlerinden hesaplanır
+        grid_chars = None
+        cache_key = None
+        if cache is not None:
+            controller_data = dict(get_controller_data(), seed=seed_value)
+            grid_size = (controller_data['sizeX'], controller_data['sizeY'])
+            cache_key = level_cache.cache_key(seed_value, controller_data, grid_size, stage_hashes or {})
+            grid_chars = cache.get(cache_key)
+            if grid_chars is not None:
+                print(f"   ♻️ Cache hit: {cache_key[:12]} (cook atlandı)")
+        
+        if grid_chars is None:
+            # 1. Pipeline'ı bu seed ile cook et
+            with stage_profiler.stage("EXPORT_COOK", seed_value, level_id=level_id) as record:
+                record["cooked"] = cook_pipeline_with_seed(seed_value)
+            if not record["cooked"]:
+                return False
+            
+            # 2. CONTROLLER verilerini al (güncel seed ile)
+            controller_data = get_controller_data()
+            
+            # 3. Tile verilerini al
+            with stage_profiler.stage("EXPORT_GET_TILE_DATA", seed_value, level_id=level_id):
+                grid_chars = get_tile_data()
+            
+            if cache is not None:
+                cache.put(cache_key, grid_chars)
         
-        # 3. Tile verilerini al
-        grid_chars = get_tile_data()
+        # 4a. Dataset / level pack: level tek dosyaya akıtılır
+        if level_writer is not None:
+            with stage_profiler.stage("EXPORT_WRITE", seed_value, level_id=level_id,
+                                      export_format=export_params['export_format']):
+                level_writer.add_level(level_id, controller_data, grid_chars)
+            print(f"   ✅ Level {level_id:04d} appended to {os.path.basename(level_writer.path)}")
+            return True
         
         # 4. ASCII grid oluştur
-        ascii_grid, grid_width, grid_height = create_ascii_grid(grid_chars)
-        
-        # 5. Unity level içeriğini oluştur
-        content = create_unity_level_content_multi(level_id, controller_data, ascii_grid, grid_width, grid_height, export_params)
-        
-        # 6. Dosyayı yaz
-        filename = f"LEVEL_{level_id:04d}_{export_params['level_version']}_{export_params['format_version']}.ini"
-        filepath = os.path.join(export_params['export_folder'], filename)
+        with stage_profiler.stage("EXPORT_ASCII_GRID", seed_value, level_id=level_id):
+            ascii_grid, grid_width, grid_height = create_ascii_grid(grid_chars)
         
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content)
+        # 5. Unity level içeriğini oluştur + 6. Dosyayı yaz
+        with stage_profiler.stage("EXPORT_WRITE", seed_value, level_id=level_id):
+            content = create_unity_level_content_multi(level_id, controller_data, ascii_grid, grid_width, grid_height, export_params)
+            
+            filename = f"LEVEL_{level_id:04d}_{export_params['level_version']}_{export_params['format_version']}.ini"
+            filepath = os.path.join(export_params['export_folder'], filename)
+            
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write(content)
         
         print(f"   ✅ Level {level_id:04d} exported: {filename}")
         return True
@@ -357,85 +320,22 @@ def export_single_level(level_id, seed_value, export_params):
 
 def create_unity_level_content_multi(level_id, controller_data, ascii_grid, grid_width, grid_height, export_params):
     """Unity level dosyası içeriğini oluştur - multi level için"""
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    houdini_version = get_houdini_version()
-    
-    # Ana header
-    content = f"""# === LEVEL DATASET {export_params['format_version']} ===
-# Generator: Houdini {houdini_version}
-# Export Date: {current_time}
-# Encoding: UTF-8
-# Levels: 1
-# Format: Incremental IDs with Suffix
-# ===================================
-
-# ===================================
-# LEVEL {level_id:04d} : Generated Level
-# ===================================
-
-[CELL_TYPES]
-# ID=Symbol,Name,Passable,Prefab_Index
-0=.,EMPTY,true,0
-1=#,WALL,false,1
-2=o,FLOOR,true,2
-3=P,PLAYER,true,3
-4=E,ENEMY,true,4
-5=S,ENEMY_SHOOTER,true,5
-6=C,COIN,true,6
-7=H,HEALTH,true,7
-8=B,BREAKABLE,false,8
-9=X,STAIRS,true,9
-
-# ===================================
-# LEVEL CONFIGURATION
-# ===================================
-
-[LEVEL_CONFIG]
-VERSION={export_params['level_version']}
-FORMAT_VERSION={export_params['format_version']}
-LEVEL_NAME=Generated Level {level_id:04d}
-LEVEL_ID={level_id:04d}
-GRID_WIDTH={grid_width}
-GRID_HEIGHT={grid_height}
-
-# ===================================
-# GENERATION PARAMETERS
-# ===================================
-
-[GENERATION_PARAMS]
-HOUDINI_SEED={controller_data['seed']}
-ROOM_COUNT={controller_data['room_count']}
-ENEMY_DENSITY={controller_data['enemy_density']}
-LOOT_DENSITY={controller_data['loot_density']}
-COIN_DENSITY={controller_data['coin_density']}
-HEALTH_DENSITY={controller_data['health_density']}
-BREAKABLE_DENSITY={controller_data['breakable_density']}
-EDGE_WALL_BIAS={controller_data['edge_wall_bias']}
-NOISE_SCALE={controller_data['noise_scale']}
-NOISE_THRESHOLD={controller_data['noise_threshold']}
-MIN_ROOM_SIZE={controller_data['min_room_size']}
-MAX_ROOM_SIZE={controller_data['max_room_size']}
-MIN_PLAYER_EXIT_DIST={controller_data['min_player_exit_dist']}
-
-# ===================================
-# GRID DATA
-# ===================================
-
-[GRID_ASCII]"""
-    
-    # ASCII grid'i ekle
-    for row in ascii_grid:
-        content += f"\n{row}"
-    
-    # Footer
-    content += f"""
-
-# ===================================
-# END OF LEVEL {level_id:04d}
-# ===================================
-"""
-    
-    return content
+    return level_format.level_content(level_id, controller_data, ascii_grid, grid_width, grid_height,
+                                      export_params, f"Houdini {get_houdini_version()}")
+
+
+def open_level_writer(export_params):
+    """export_format'a göre tek dosyalık yazıcıyı aç ("ini" -> None, level başına ayrı dosya)"""
+    export_format = export_params.get('export_format', 'ini')
+    if export_format == "dataset":
+        path = os.path.join(export_params['export_folder'], level_format.dataset_filename(export_params))
+        return level_format.LevelDatasetWriter(path, export_params, f"Houdini {get_houdini_version()}")
+    if export_format == "pack":
+        path = os.path.join(export_params['export_folder'], level_pack_filename(export_params))
+        return level_pack.LevelPackWriter(path, export_params['level_version'], export_params['format_version'])
+    if export_format != "ini":
+        raise Exception(f"Unknown export format: {export_format}")
+    return None
 
 
 def export_level_complete(source_node=None, show_ui_message=True):
@@ -477,20 +377,47 @@ def export_level_complete(source_node=None, show_ui_message=True):
         failed_exports = 0
         exported_files = []
         
-        for level_num in range(1, level_count + 1):
-            # Her level için seed'i artır
-            current_seed = base_seed + (level_num - 1)
-            
-            print(f"\n📦 === LEVEL {level_num}/{level_count} ===")
-            
-            if export_single_level(level_num, current_seed, export_params):
-                successful_exports += 1
-                filename = f"LEVEL_{level_num:04d}_{export_params['level_version']}_{export_params['format_version']}.ini"
-                exported_files.append(filename)
-            else:
-                failed_exports += 1
+        # Dataset / level pack: bütün level'lar tek dosyaya akıtılır
+        level_writer = open_level_writer(export_params)
+        if level_writer is not None:
+            print(f"📦 {export_params['export_format']} file: {level_writer.path}")
+        
+        # Generation cache: değişmeyen level'lar yeniden cook edilmez
+        cache = open_generation_cache()
+        stage_hashes = get_stage_script_hashes() if cache is not None else None
+        if cache is not None:
+            print(f"♻️ Level cache: {cache.cache_dir} ({len(stage_hashes)} script hash)")
+        
+        try:
+            for level_num in range(1, level_count + 1):
+                # Her level için seed'i artır
+                current_seed = base_seed + (level_num - 1)
+                
+                print(f"\n📦 === LEVEL {level_num}/{level_count} ===")
+                
+                if export_single_level(level_num, current_seed, export_params, level_writer, cache, stage_hashes):
+                    successful_exports += 1
+                    if level_writer is None:
+                        filename = f"LEVEL_{level_num:04d}_{export_params['level_version']}_{export_params['format_version']}.ini"
+                        exported_files.append(filename)
+                else:
+                    failed_exports += 1
+        except BaseException:
+            if level_writer is not None:
+                level_writer.abort()
+            raise
+        
+        if level_writer is not None:
+            level_writer.close()
+            exported_files.append(f"{os.path.basename(level_writer.path)} ({len(level_writer)} levels)")
         
         # 5. Özet rapor
+        cache_line = ""
+        if cache is not None:
+            cache_stats = cache.stats()
+            cache_line = (f"\n   ♻️ Cache: {cache_stats['hits']} hit / {cache_stats['misses']} miss "
+                          f"({cache_stats['size_mb']}/{cache_stats['max_mb']} MB)")
+        
         success_msg = f"""🎉 Multi-Level Export Complete!
 
 📊 SUMMARY:
@@ -498,7 +425,7 @@ def export_level_complete(source_node=None, show_ui_message=True):
    ❌ Failed: {failed_exports}/{level_count}
    📁 Folder: {export_params['export_folder']}
    📄 Format: {export_params['format_version']}
-   🎲 Base Seed: {base_seed}
+   🎲 Base Seed: {base_seed}{cache_line}
 
 📄 FILES:"""
         
@@ -549,7 +476,7 @@ def export_single_level_legacy():
         
         # 3. Tile verilerini al
         grid_chars = get_tile_data()
-        print(f"🗺️ Tile data collected: {len(grid_chars)} columns")
+        print(f"🗺️ Tile data collected: {grid_chars.shape[1]}x{grid_chars.shape[0]} grid")
         
         # 4. ASCII grid oluştur
         ascii_grid, grid_width, grid_height = create_ascii_grid(grid_chars)
@@ -642,7 +569,7 @@ def test_module():
         print(f"✅ Controller data: {controller_data['seed']}")
         
         grid_chars = get_tile_data()
-        print(f"✅ Tile data: {len(grid_chars)} columns")
+        print(f"✅ Tile data: {grid_chars.shape[1]}x{grid_chars.shape[0]} grid")
         
         export_params = get_export_parameters()
         print(f"✅ Export params: {export_params['format_version']}")
@@ -0,0 +1,246 @@
+"""
+Parameter Sweep
+CONTROLLER parametreleri üzerinde Houdini'siz, process pool ile parametre taraması (grid_engine)
+
+Her konfigürasyon (parametre grid'inin bir kombinasyonu ya da rastgele aralıklardan bir örnek)
+aynı N seed ile üretilir; seed'ler ortak olduğu için konfigürasyonlar birbirleriyle doğrudan
+karşılaştırılabilir. İşler (konfigürasyon, seed parçası) olarak worker'lara dağıtılır,
+level istatistikleri konfigürasyon başına tek tabloda (CSV) toplanır.
+
+Level istatistikleri:
+    floor_area    export edilen (prim) hücrelerden duvar olmayanların sayısı
+    path_length   player -> stairs garanti yolunun hücre sayısı
+    enemy_count   export edilen hücrelerdeki enemy + enemy_shooter sayısı
+    failure_rate  exception atan, player / stairs'i olmayan ya da player -> stairs yolu
+                  min_player_exit_dist - 1 adımdan kısa kalan level oranı (placement toleransı 1
+                  birim; en büyük bölge hedef mesafe için fazla küçükse olur)
+
+Kullanım:
+    python param_sweep.py --grid enemy_density=0,0.05,0.1 --grid noise_scale=0.5,1.0 --seeds 200 --out sweep.csv
+    python param_sweep.py --range loot_density=0.5:2.0 --range min_room_size=2:5 --samples 40 --seeds 100
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import grid_engine
+
+
+STAT_FIELDS = ("floor_area", "path_length", "enemy_count")
+
+
+def parse_axis(text):
+    """'enemy_density=0,0.05,0.1' -> ('enemy_density', [0, 0.05, 0.1])"""
+    name, _, values = text.partition("=")
+    if not values:
+        raise ValueError(f"Expected NAME=V1,V2,... got {text!r}")
+    return name.strip(), [_parse_number(v) for v in values.split(",") if v.strip()]
+
+
+def parse_range(text):
+    """'loot_density=0.5:2.0' -> ('loot_density', (0.5, 2.0))"""
+    name, _, bounds = text.partition("=")
+    low, sep, high = bounds.partition(":")
+    if not sep:
+        raise ValueError(f"Expected NAME=LOW:HIGH got {text!r}")
+    return name.strip(), (_parse_number(low), _parse_number(high))
+
+
+def _parse_number(text):
+    text = text.strip()
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def grid_configs(axes):
+    """{isim: [değerler]} -> bütün kombinasyonlar (isim sırası korunur)"""
+    if not axes:
+        return [{}]
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(axes[name] for name in names))]
+
+
+def random_configs(ranges, count, seed=0):
+    """{isim: (alt, üst)} aralıklarından count örnek; iki sınır da int ise randint, değilse uniform"""
+    rng = random.Random(seed)
+    configs = []
+    for _ in range(count):
+        config = {}
+        for name, (low, high) in ranges.items():
+            if isinstance(low, int) and isinstance(high, int):
+                config[name] = rng.randint(low, high)
+            else:
+                config[name] = round(rng.uniform(low, high), 6)
+        configs.append(config)
+    return configs
+
+
+def level_stats(grid, min_exit_dist=grid_engine.DEFAULT_PARAMS["min_player_exit_dist"]):
+    """
+    Tek level'ın istatistikleri (STAT_FIELDS sırasıyla) + başarı bayrağı.
+    Başarı: garanti yolu var ve en az min_exit_dist - 1 adım (yol hücre sayısı >= min_exit_dist).
+    """
+    # Alan / düşman sayısı export edilen hücrelerden (prim owner point'leri), yol bütün point'lerden
+    cells = grid_engine.prim_owner_cells(grid).reshape(-1)
+    tiles = grid.tiles.reshape(-1)[cells]
+    counts = np.bincount(tiles, minlength=len(grid_engine.TILE_IDS))
+    path_length = int(np.count_nonzero(grid.path))
+    stats = (
+        cells.size - int(counts[grid_engine.WALL]),
+        path_length,
+        int(counts[grid_engine.ENEMY] + counts[grid_engine.ENEMY_SHOOTER]),
+    )
+    return stats, path_length > 0 and path_length >= min_exit_dist
+
+
+def run_chunk(task):
+    """Worker: bir konfigürasyonun seed parçası -> (config_id, (n, 3) istatistikler, başarısız sayısı)"""
+    config_id, params, first_seed, count = task
+    rows = []
+    failed = 0
+    for seed in range(first_seed, first_seed + count):
+        try:
+            grid = grid_engine.generate_level(dict(params, seed=seed))
+        except Exception:
+            failed += 1
+            continue
+        stats, ok = level_stats(grid, int(params["min_player_exit_dist"]))
+        if not ok:
+            failed += 1
+            continue
+        rows.append(stats)
+    return config_id, np.array(rows, dtype=np.float64).reshape(-1, len(STAT_FIELDS)), failed
+
+
+def summarize_config(config_id, config, samples, failed, seeds):
+    """Konfigürasyonun tablo satırı (ortalama / std / min / max)"""
+    row = {"config": config_id}
+    row.update(config)
+    row["levels"] = seeds
+    row["failed"] = failed
+    row["failure_rate"] = round(failed / seeds, 4) if seeds else 0.0
+    for i, name in enumerate(STAT_FIELDS):
+        column = samples[:, i]
+        if column.size:
+            row[f"{name}_mean"] = round(float(column.mean()), 3)
+            row[f"{name}_std"] = round(float(column.std()), 3)
+            row[f"{name}_min"] = int(column.min())
+            row[f"{name}_max"] = int(column.max())
+        else:
+            row.update({f"{name}_{k}": "" for k in ("mean", "std", "min", "max")})
+    return row
+
+
+def write_table(path, rows):
+    """Satırları CSV'ye atomik yaz (sütunlar ilk satırın sırasıyla)"""
+    fields = []
+    for row in rows:
+        fields.extend(key for key in row if key not in fields)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(tmp_path, path)
+
+
+def sweep(configs, seeds, base_seed=grid_engine.DEFAULT_PARAMS["seed"], params=None, workers=None, chunk_size=32):
+    """
+    Her konfigürasyonu base_seed .. base_seed + seeds - 1 ile üret.
+    params: konfigürasyonların üzerine yazıldığı temel CONTROLLER değerleri.
+    Dönüş: konfigürasyon sırasıyla tablo satırları.
+    """
+    base = grid_engine.resolve_params(params)
+    base.pop("seed", None)
+
+    tasks = []
+    for config_id, config in enumerate(configs):
+        config_params = dict(base, **config)
+        for offset in range(0, seeds, chunk_size):
+            tasks.append((config_id, config_params, base_seed + offset, min(chunk_size, seeds - offset)))
+
+    samples = {config_id: [] for config_id in range(len(configs))}
+    failures = dict.fromkeys(samples, 0)
+
+    total = len(configs) * seeds
+    print(f"🔬 Parameter sweep: {len(configs)} configs x {seeds} seeds = {total} levels, "
+          f"workers={workers or os.cpu_count()}")
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for config_id, chunk, failed in pool.map(run_chunk, tasks):
+            samples[config_id].append(chunk)
+            failures[config_id] += failed
+
+    rows = [
+        summarize_config(config_id, config, np.concatenate(samples[config_id]), failures[config_id], seeds)
+        for config_id, config in enumerate(configs)
+    ]
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    print(f"✅ {total} levels in {elapsed:.2f}s ({total / elapsed:.0f} levels/s), "
+          f"{sum(failures.values())} failed")
+    return rows
+
+
+def print_table(rows, sort_by=None, limit=20):
+    """En iyi satırları konsola yaz (sort_by sütununa göre, '-' önekli ise azalan)"""
+    if sort_by:
+        key = sort_by.lstrip("-")
+        rows = sorted(rows, key=lambda r: (r.get(key) == "", r.get(key) or 0), reverse=sort_by.startswith("-"))
+    config_keys = [k for k in rows[0] if k not in ("config", "levels", "failed") and not k.startswith(STAT_FIELDS)
+                   and k != "failure_rate"] if rows else []
+    for row in rows[:limit]:
+        config = " ".join(f"{k}={row[k]}" for k in config_keys)
+        stats = "  ".join(f"{name}={row[name + '_mean']}" for name in STAT_FIELDS)
+        print(f"   #{row['config']:<4} {config:<48} {stats}  fail={row['failure_rate']:.1%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parallel parameter sweep over CONTROLLER generation params")
+    parser.add_argument("--grid", action="append", default=[], metavar="NAME=V1,V2",
+                        help="Parametre grid ekseni (tekrarlanabilir, kombinasyonları taranır)")
+    parser.add_argument("--range", action="append", default=[], metavar="NAME=LOW:HIGH",
+                        help="Rastgele örneklenecek parametre aralığı (tekrarlanabilir)")
+    parser.add_argument("--samples", type=int, default=20, help="--range için rastgele konfigürasyon sayısı")
+    parser.add_argument("--sample-seed", type=int, default=0, help="Rastgele konfigürasyon seed'i")
+    parser.add_argument("--seeds", type=int, default=100, help="Konfigürasyon başına level (seed) sayısı")
+    parser.add_argument("--base-seed", type=int, default=grid_engine.DEFAULT_PARAMS["seed"])
+    parser.add_argument("--params", default=None, help="Temel CONTROLLER parametreleri (JSON dosyası)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker process sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--chunk-size", type=int, default=32, help="Worker işi başına seed sayısı")
+    parser.add_argument("--out", default="sweep.csv", help="Sonuç tablosu (CSV)")
+    parser.add_argument("--sort", default="failure_rate", help="Konsol sıralaması (ör. -path_length_mean)")
+    args = parser.parse_args(argv)
+
+    params = None
+    if args.params:
+        with open(args.params, "r", encoding="utf-8") as f:
+            params = json.load(f)
+
+    unknown = [name for name, _ in map(parse_axis, args.grid)] + [name for name, _ in map(parse_range, args.range)]
+    unknown = [name for name in unknown if name not in grid_engine.DEFAULT_PARAMS or name == "seed"]
+    if unknown:
+        parser.error(f"Bilinmeyen CONTROLLER parametresi: {', '.join(unknown)}")
+
+    configs = grid_configs(dict(map(parse_axis, args.grid)))
+    if args.range:
+        sampled = random_configs(dict(map(parse_range, args.range)), args.samples, args.sample_seed)
+        configs = [dict(grid, **sample) for grid in configs for sample in sampled]
+
+    rows = sweep(configs, args.seeds, args.base_seed, params, args.workers, args.chunk_size)
+    write_table(args.out, rows)
+    print(f"📄 Table: {args.out}")
+    print_table(rows, args.sort)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Stage Profiler
+Generation pipeline için ortak ölçüm katmanı (houdiniScripts + my_exporter + grid_engine)
+Her stage için wall time, point/prim sayısı ve peak memory kaydı tutar.
+
+Kayıtlar JSON Lines log'a yazılır (satır başına bir stage), istenirse stage başına
+cProfile dump'ı (.prof) alınır. Log yolu verilmezse bütün ölçümler no-op'tur.
+
+Açmak için (houdini.env veya shell):
+    BOMBERMAN_PROFILE_LOG=E:/UNITY/BombermanTower/houdini/profile/stages.jsonl
+    BOMBERMAN_PROFILE_DIR=E:/UNITY/BombermanTower/houdini/profile/cprofile   (opsiyonel)
+    BOMBERMAN_PROFILE_MEMORY=0                                               (tracemalloc kapalı)
+ya da kod içinden: stage_profiler.configure(log_path=..., profile_dir=...)
+
+Özet:
+    python stage_profiler.py stages.jsonl
+"""
+
+import cProfile
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+
+_config = {
+    "log_path": os.environ.get("BOMBERMAN_PROFILE_LOG") or None,
+    "profile_dir": os.environ.get("BOMBERMAN_PROFILE_DIR") or None,
+    "memory": os.environ.get("BOMBERMAN_PROFILE_MEMORY", "1") != "0",
+}
+
+# Açık stage'ler (iç içe stage'lerde peak memory dışarı taşınır)
+_stack = []
+
+
+def configure(log_path=None, profile_dir=None, memory=True):
+    """Profiling'i kod içinden aç / kapat (log_path=None -> kapalı)"""
+    _config["log_path"] = log_path
+    _config["profile_dir"] = profile_dir
+    _config["memory"] = memory
+
+
+def is_enabled():
+    return bool(_config["log_path"])
+
+
+def geometry_counts(geo):
+    """Point / prim sayıları (per-point Python objesi yaratmadan)"""
+    return {
+        "points": geo.intrinsicValue("pointcount"),
+        "prims": geo.intrinsicValue("primitivecount"),
+    }
+
+
+def write_record(record, log_path=None):
+    """Tek kaydı JSON Lines log'a ekle"""
+    log_path = log_path or _config["log_path"]
+    log_dir = os.path.dirname(log_path)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+@contextmanager
+def stage(name, seed=None, geo=None, **extra):
+    """
+    Bir stage'i ölç:
+        with stage_profiler.stage("2_CARVE_ROOMS", seed=seed, geo=geo) as record:
+            ...
+            record["rooms"] = room_id   # ek alanlar kayda eklenebilir
+    geo verilirse point/prim sayıları stage sonunda geometriden okunur.
+    """
+    record = {"stage": name, "seed": seed}
+    record.update(extra)
+    if not is_enabled():
+        yield record
+        return
+
+    # --- Memory: iç içe stage'lerde üst stage'in peak'i korunur ---
+    track_memory = _config["memory"]
+    started_tracing = False
+    frame = {"child_peak": 0}
+    if track_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        if _stack:
+            parent = _stack[-1]
+            parent["child_peak"] = max(parent["child_peak"], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        frame["base"] = tracemalloc.get_traced_memory()[0]
+    _stack.append(frame)
+
+    profiler = cProfile.Profile() if _config["profile_dir"] else None
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    try:
+        yield record
+        record["status"] = "ok"
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = str(e)
+        raise
+    finally:
+        if profiler:
+            profiler.disable()
+        record["wall_time_s"] = round(time.perf_counter() - start, 6)
+        _stack.pop()
+
+        if track_memory:
+            peak = max(tracemalloc.get_traced_memory()[1], frame["child_peak"])
+            record["peak_memory_kb"] = round(max(peak - frame["base"], 0) / 1024.0, 1)
+            if _stack:
+                _stack[-1]["child_peak"] = max(_stack[-1]["child_peak"], peak)
+            if started_tracing:
+                tracemalloc.stop()
+
+        if geo is not None:
+            try:
+                record.update(geometry_counts(geo))
+            except Exception:
+                pass
+
+        if profiler:
+            os.makedirs(_config["profile_dir"], exist_ok=True)
+            profile_path = os.path.join(
+                _config["profile_dir"], f"{name}_seed{seed}_{os.getpid()}_{time.time_ns()}.prof"
+            )
+            profiler.dump_stats(profile_path)
+            record["profile"] = profile_path
+
+        record["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        record["pid"] = os.getpid()
+        write_record(record)
+
+
+def read_records(log_path):
+    """JSON Lines log'unu kayıt listesi olarak oku"""
+    with open(log_path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def summarize(records):
+    """Stage bazlı özet: sayı, ortalama / maksimum süre, maksimum peak memory"""
+    summary = {}
+    for record in records:
+        entry = summary.setdefault(record["stage"], {"count": 0, "total_s": 0.0, "max_s": 0.0, "max_memory_kb": 0.0})
+        entry["count"] += 1
+        entry["total_s"] += record.get("wall_time_s", 0.0)
+        entry["max_s"] = max(entry["max_s"], record.get("wall_time_s", 0.0))
+        entry["max_memory_kb"] = max(entry["max_memory_kb"], record.get("peak_memory_kb", 0.0))
+    for entry in summary.values():
+        entry["mean_s"] = entry["total_s"] / entry["count"]
+    return summary
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Kullanım: python stage_profiler.py <stages.jsonl>")
+        sys.exit(1)
+
+    print(f"{'STAGE':<28}{'COUNT':>8}{'MEAN (ms)':>12}{'MAX (ms)':>12}{'PEAK MEM (KB)':>16}")
+    for name, entry in sorted(summarize(read_records(sys.argv[1])).items()):
+        print(f"{name:<28}{entry['count']:>8}{entry['mean_s'] * 1000:>12.2f}"
+              f"{entry['max_s'] * 1000:>12.2f}{entry['max_memory_kb']:>16.1f}")
@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+# Modüller houdini/scripts altında düz import edilir (Houdini'deki $HIP/scripts gibi)
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+
+EXPORT_SEEDS = (261, 5, 17)
+
+
+@pytest.fixture(scope="session")
+def levels():
+    """Export edilen level'lar: (level_id, controller_data, prim char grid'i) üçlüleri"""
+    import grid_engine
+
+    result = []
+    for level_id, seed in enumerate(EXPORT_SEEDS, start=1):
+        params = grid_engine.resolve_params({"seed": seed})
+        result.append((level_id, params, grid_engine.export_chars(grid_engine.generate_level(params))))
+    return result
@@ -0,0 +1,83 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+import chunked_floor
+import grid_engine
+
+
+BLOCKED = (ord(grid_engine.TILE_CHARS["wall"]), ord(grid_engine.TILE_CHARS["breakable"]))
+
+
+@pytest.fixture(scope="module")
+def plan():
+    return chunked_floor.FloorPlan({"seed": 283}, 96, 80, chunk_size=32)
+
+
+def window_walls(plan, chunk):
+    """Chunk penceresinin duvar mask'i (kırılabilir duvarlar duvar sayılır), global koordinatlarla"""
+    grid = chunked_floor.render_chunk(plan, chunk)
+    walls = np.isin(grid.tiles, (grid_engine.WALL, grid_engine.BREAKABLE))
+    return plan.window_bounds(chunk), walls
+
+
+def test_overlap_ring_matches_neighbour_core(plan):
+    """Pencerenin overlap halkası komşu chunk'ın çekirdeğiyle aynı duvar / boşluk düzenini görür"""
+    for chunk in range(plan.chunk_count):
+        (wx0, wz0, wx1, wz1), walls = window_walls(plan, chunk)
+        for neighbor in plan.neighbours(chunk):
+            if neighbor == chunk:
+                continue
+            (nx0, nz0, _, _), neighbor_walls = window_walls(plan, neighbor)
+            x0, z0, x1, z1 = plan.chunk_bounds(neighbor)
+            # Komşunun çekirdeği ile bu pencerenin kesişimi
+            ix0, iz0, ix1, iz1 = max(x0, wx0), max(z0, wz0), min(x1, wx1), min(z1, wz1)
+            assert ix0 < ix1 and iz0 < iz1
+            np.testing.assert_array_equal(
+                walls[iz0 - wz0:iz1 - wz0, ix0 - wx0:ix1 - wx0],
+                neighbor_walls[iz0 - nz0:iz1 - nz0, ix0 - nx0:ix1 - nx0],
+            )
+
+
+def test_render_is_independent_of_chunk_order(plan):
+    fresh = chunked_floor.FloorPlan({"seed": 283}, 96, 80, chunk_size=32)
+    last = plan.chunk_count - 1
+    for chunk in range(plan.chunk_count):
+        chunked_floor.render_chunk(plan, chunk)
+    expected = chunked_floor.render_chunk(plan, last)
+    np.testing.assert_array_equal(chunked_floor.render_chunk(fresh, last).tiles, expected.tiles)
+
+
+def reachable(floor, start):
+    height, width = floor.shape
+    seen = np.zeros(floor.shape, dtype=bool)
+    seen[start[1], start[0]] = True
+    queue = deque([start])
+    while queue:
+        x, z = queue.popleft()
+        for ox, oz in grid_engine.NEIGHBOR_OFFSETS:
+            nx, nz = x + ox, z + oz
+            if 0 <= nx < width and 0 <= nz < height and not seen[nz, nx] and floor[nz, nx] not in BLOCKED:
+                seen[nz, nx] = True
+                queue.append((nx, nz))
+    return seen
+
+
+def test_floor_connects_player_to_stairs(tmp_path):
+    manifest = chunked_floor.generate_floor(str(tmp_path), {"seed": 7}, 100, 70, chunk_size=32)
+    floor = chunked_floor.assemble_floor(str(tmp_path))
+    assert floor.shape == (70, 100)
+
+    (px, pz), (sx, sz) = manifest["player"], manifest["exit"]
+    assert chr(floor[pz, px]) == grid_engine.TILE_CHARS["player"]
+    assert chr(floor[sz, sx]) == grid_engine.TILE_CHARS["stairs"]
+    assert reachable(floor, (px, pz))[sz, sx]
+
+    assert manifest["path_chunks"] > 1
+    assert manifest["path_length"] == np.count_nonzero(floor == ord(grid_engine.PATH_CHAR)) + 2
+
+
+def test_max_room_size_must_fit_chunk():
+    with pytest.raises(ValueError):
+        chunked_floor.FloorPlan({"seed": 1, "max_room_size": 8}, 64, 64, chunk_size=8)
@@ -0,0 +1,46 @@
+import numpy as np
+
+import grid_engine
+import headless_hou
+import level_reader
+
+
+def test_serialize_grid_round_trip(levels):
+    _, _, chars = levels[0]
+    rows, missing = grid_engine.serialize_grid(chars)
+    assert missing == 0
+    assert len(rows) == chars.shape[0] and {len(row) for row in rows} == {chars.shape[1]}
+    np.testing.assert_array_equal(level_reader.grid_from_bytes("\n".join(rows).encode("ascii")),
+                                  grid_engine.char_codes(chars))
+
+
+def test_serialize_grid_marks_missing_cells():
+    chars = np.array([["#", "", "P"], [".", "S", ""]], dtype="<U1")
+    rows, missing = grid_engine.serialize_grid(chars)
+    assert rows == ["#?P", ".S?"]
+    assert missing == 2
+
+
+def test_char_codes_accepts_str_bytes_and_codes():
+    chars = np.array([["#", "P"], ["S", "."]], dtype="<U1")
+    codes = grid_engine.char_codes(chars)
+    assert codes.dtype == np.uint8
+    np.testing.assert_array_equal(codes, [[35, 80], [83, 46]])
+    np.testing.assert_array_equal(grid_engine.char_codes(chars.astype("S1")), codes)
+    np.testing.assert_array_equal(grid_engine.char_codes(codes), codes)
+
+
+def test_grid_to_ascii_marks_holes():
+    grid = grid_engine.LevelGrid(4, 3, order=np.array([0, 1, 2, 3, 4, 6, 7, 8, 9, 10, 11]))
+    rows = grid_engine.grid_to_ascii(grid)
+    assert rows == ["###", "#?#"]
+
+
+def test_exporter_create_ascii_grid(levels, capsys):
+    headless_hou.install()
+    import my_exporter
+
+    _, _, chars = levels[1]
+    ascii_grid, width, height = my_exporter.create_ascii_grid(chars)
+    assert (width, height) == (chars.shape[1], chars.shape[0])
+    assert ascii_grid == grid_engine.serialize_grid(chars)[0]
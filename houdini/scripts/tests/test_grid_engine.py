@@ -0,0 +1,99 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+import grid_engine
+import headless_hou
+
+
+PARITY_PARAMS = [
+    {"seed": 261},
+    {"seed": 7, "enemy_density": 0.5, "room_count": 8},
+    {"seed": 42, "sizeX": 40, "sizeY": 30, "min_player_exit_dist": 12},
+]
+
+
+@pytest.mark.parametrize("params", PARITY_PARAMS)
+def test_headless_stage_scripts_match_engine(params):
+    expected = grid_engine.generate_level(params)
+    actual = headless_hou.generate_level(params)
+    np.testing.assert_array_equal(actual.tiles, expected.tiles)
+    np.testing.assert_array_equal(actual.room, expected.room)
+    np.testing.assert_array_equal(actual.path, expected.path)
+
+
+def baseline_carve_rooms(positions, params):
+    """Baseline 2_CARVE_ROOMS.py döngüsü (point başına float P ile), tile_type listesi"""
+    rng = random.Random(params["seed"])
+    tile_types = ["wall"] * len(positions)
+    min_x, max_x = int(min(p[0] for p in positions)), int(max(p[0] for p in positions))
+    min_z, max_z = int(min(p[2] for p in positions)), int(max(p[2] for p in positions))
+    for _ in range(params["room_count"]):
+        room_w = rng.randint(params["min_room_size"], params["max_room_size"])
+        room_h = rng.randint(params["min_room_size"], params["max_room_size"])
+        room_x = rng.randint(min_x, max_x - room_w)
+        room_z = rng.randint(min_z, max_z - room_h)
+        for i, pos in enumerate(positions):
+            if (room_x <= pos[0] < room_x + room_w) and (room_z <= pos[2] < room_z + room_h):
+                if math.sin((pos[0] + pos[2]) * params["noise_scale"] + rng.random() * 2.0) > 0:
+                    tile_types[i] = "empty"
+    return tile_types
+
+
+def grid1_positions(size_x, size_y):
+    """grid1 point P'leri (geo.points() sırası): x = 0 .. sizeX, z = k + 0.4975, float32"""
+    cols, rows = size_x + 1, size_y + 1
+    zs, xs = np.divmod(np.arange(cols * rows), cols)
+    z_offset = (rows - grid_engine.GRID1_CENTER_Z_INSET) / 2 - (rows - 1) / 2
+    positions = np.stack([xs, np.zeros_like(xs), zs + z_offset], axis=1).astype(np.float32)
+    return positions.astype(np.float64).tolist()
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_carve_rooms_uses_float_point_positions(seed):
+    params = grid_engine.resolve_params({"seed": seed, "sizeX": 15, "sizeY": 15, "noise_scale": 0.8})
+    grid = grid_engine.controller_grid(params)
+    grid_engine.carve_rooms(grid, params)
+
+    expected = baseline_carve_rooms(grid1_positions(15, 15), params)
+    actual = np.asarray(grid_engine.TILE_TYPES)[grid.tiles.reshape(-1)[grid.order]].tolist()
+    assert actual == expected
+
+
+def test_controller_grid_matches_grid1_layout():
+    grid = grid_engine.controller_grid({"sizeX": 12, "sizeY": 9})
+    assert (grid.width, grid.height) == (13, 10)
+    xs, zs = grid.world_positions(grid.order)
+    expected = np.asarray(grid1_positions(12, 9))
+    np.testing.assert_array_equal(xs, expected[:, 0])
+    np.testing.assert_array_equal(zs, expected[:, 2])
+
+
+def test_export_chars_reads_prim_owner_points():
+    grid = grid_engine.generate_level({"seed": 11, "sizeX": 20, "sizeY": 14})
+    chars = grid_engine.export_chars(grid)
+    assert chars.shape == (14, 20)
+    np.testing.assert_array_equal(chars, grid_engine.visualize(grid)[0][:-1, :-1])
+    assert grid_engine.grid_to_ascii(grid) == grid_engine.serialize_grid(chars)[0]
+
+
+def test_generate_level_is_deterministic():
+    first = grid_engine.generate_level({"seed": 3})
+    second = grid_engine.generate_level({"seed": 3})
+    np.testing.assert_array_equal(first.tiles, second.tiles)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_visualize_keeps_player_and_stairs_on_path(seed):
+    grid = grid_engine.generate_level({"seed": seed})
+    chars, colors = grid_engine.visualize(grid)
+
+    player, stairs = grid_engine.TILE_CHARS["player"], grid_engine.TILE_CHARS["stairs"]
+    assert np.count_nonzero(chars == player) == 1
+    assert np.count_nonzero(chars == stairs) == 1
+    # Yolun uçları player / stairs, aradaki hücreler yol işareti
+    assert grid.path[chars == player].all() and grid.path[chars == stairs].all()
+    assert np.count_nonzero(chars == grid_engine.PATH_CHAR) == np.count_nonzero(grid.path) - 2
+    np.testing.assert_allclose(colors[chars == player][0], grid_engine.TILE_COLORS["player"])
@@ -0,0 +1,67 @@
+import heapq
+
+import numpy as np
+import pytest
+
+import grid_engine
+
+
+def reference_cost(tiles, start, end, wall_cost=grid_engine.WALL_PATH_COST):
+    """(x, z) koordinatlarıyla düz Dijkstra: en ucuz yolun maliyeti"""
+    height, width = tiles.shape
+    best = {start: 0.0}
+    heap = [(0.0, start)]
+    while heap:
+        d, (x, z) = heapq.heappop(heap)
+        if (x, z) == end:
+            return d
+        if d > best[(x, z)]:
+            continue
+        for ox, oz in grid_engine.NEIGHBOR_OFFSETS:
+            nx, nz = x + ox, z + oz
+            if 0 <= nx < width and 0 <= nz < height:
+                nd = d + (wall_cost if tiles[nz, nx] == grid_engine.WALL else 1.0)
+                if nd < best.get((nx, nz), float("inf")):
+                    best[(nx, nz)] = nd
+                    heapq.heappush(heap, (nd, (nx, nz)))
+    return None
+
+
+def path_cost(grid, path, wall_cost=grid_engine.WALL_PATH_COST):
+    tiles = grid.tiles.reshape(-1)
+    return sum(wall_cost if tiles[cell] == grid_engine.WALL else 1.0 for cell in path[1:])
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_weighted_shortest_path_is_cheapest(seed):
+    rng = np.random.default_rng(seed)
+    grid = grid_engine.LevelGrid(30, 20)
+    grid.tiles[:] = np.where(rng.random((20, 30)) < 0.45, grid_engine.WALL, grid_engine.EMPTY)
+    start, end = 0, grid.size - 1
+
+    path = grid_engine.weighted_shortest_path(grid, start, end)
+    assert path[0] == start and path[-1] == end
+    # Ardışık hücreler 4 yönlü komşu
+    steps = np.abs(np.diff(np.array(path) % 30)) + np.abs(np.diff(np.array(path) // 30))
+    assert (steps == 1).all()
+    assert path_cost(grid, path) == reference_cost(grid.tiles, (0, 0), (29, 19))
+
+
+def test_guarantee_path_opens_walls_between_player_and_stairs():
+    grid = grid_engine.LevelGrid(9, 5)
+    grid.tiles[:] = grid_engine.WALL
+    tiles = grid.tiles.reshape(-1)
+    tiles[grid.index.point_number(0, 2)] = grid_engine.PLAYER
+    tiles[grid.index.point_number(8, 2)] = grid_engine.STAIRS
+
+    path = grid_engine.guarantee_path(grid)
+    assert len(path) == 9
+    assert grid.path.sum() == 9 and grid.path[2].all()
+    assert (grid.tiles[2, 1:8] == grid_engine.EMPTY).all()
+
+
+def test_guarantee_path_without_stairs_is_empty():
+    grid = grid_engine.LevelGrid(4, 4)
+    grid.tiles.reshape(-1)[0] = grid_engine.PLAYER
+    assert grid_engine.guarantee_path(grid) == []
+    assert not grid.path.any()
@@ -0,0 +1,47 @@
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+import grid_bridge
+import grid_engine
+import headless_hou
+
+
+def test_grid_geometry_matches_grid1_layout():
+    geo = headless_hou.grid_geometry(12, 9)
+    assert geo.intrinsicValue("pointcount") == 13 * 10
+    assert geo.intrinsicValue("primitivecount") == 12 * 9
+
+    positions = np.asarray(geo.pointFloatAttribValues("P")).reshape(-1, 3)
+    # Satır satır, x en hızlı: x = 0 .. sizeX, z = k + 0.4975 (float32)
+    np.testing.assert_array_equal(positions[:13, 0], np.arange(13))
+    np.testing.assert_array_equal(positions[::13, 2], (np.arange(10) + np.float32(0.4975)).astype(np.float32))
+
+    # İlk vertex prim'in sol alt köşesi, prim merkezleri exporter'da 0 .. sizeX - 1 hücrelerine düşer
+    np.testing.assert_array_equal(grid_bridge.prim_owner_points(geo)[:3], [0, 1, 2])
+    centers = grid_bridge.prim_centers(geo)
+    assert np.rint(centers[:, 0] - 0.5).max() == 11 and np.rint(centers[:, 2] - 0.5).max() == 8
+
+
+def test_grid_from_geometry_keeps_float_positions():
+    geo = headless_hou.grid_geometry(6, 4)
+    grid = grid_bridge.grid_from_geometry(geo)
+    expected = grid_engine.controller_grid({"sizeX": 6, "sizeY": 4})
+    assert (grid.width, grid.height) == (expected.width, expected.height)
+    for actual, wanted in zip(grid.world_positions(grid.order), expected.world_positions(expected.order)):
+        np.testing.assert_array_equal(actual, wanted)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_exporter_reads_engine_grid(seed):
+    """my_exporter.get_tile_data, headless grid1 + stage script'leri üzerinde engine'in export'una eşit"""
+    headless_hou.install()
+    import my_exporter
+
+    params = {"seed": seed, "sizeX": 18, "sizeY": 12, "enemy_density": 0.3}
+    headless_hou.generate_level(params)
+    with contextlib.redirect_stdout(io.StringIO()):
+        chars = my_exporter.get_tile_data()
+    np.testing.assert_array_equal(chars, grid_engine.export_chars(grid_engine.generate_level(params)))
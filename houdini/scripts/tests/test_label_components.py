@@ -0,0 +1,80 @@
+import importlib.util
+import os
+
+import numpy as np
+import pytest
+
+import grid_engine
+import headless_hou
+
+
+LEVEL_UTILS = os.path.join(headless_hou.DEFAULT_HIP, "houdiniScripts", "level_utils.py")
+
+
+def baseline_find_rooms(geo):
+    """Baseline level_utils.find_rooms: prim komşuluğu üzerinde kuyruklu flood fill"""
+    visited = set()
+    class_id = 0
+    for pt in geo.points():
+        if pt.stringAttribValue("tile_type") == "empty" and pt.number() not in visited:
+            room_points = []
+            queue = [pt]
+            visited.add(pt.number())
+            while queue:
+                current_pt = queue.pop(0)
+                room_points.append(current_pt)
+                for prim in current_pt.prims():
+                    for neighbor in prim.points():
+                        if neighbor.number() not in visited and neighbor.stringAttribValue("tile_type") == "empty":
+                            visited.add(neighbor.number())
+                            queue.append(neighbor)
+            for room_pt in room_points:
+                room_pt.setAttribValue("class", class_id)
+            class_id += 1
+    return class_id
+
+
+def random_geometry(seed, size_x=14, size_y=11, empty_ratio=0.45):
+    rng = np.random.default_rng(seed)
+    geo = headless_hou.grid_geometry(size_x, size_y)
+    count = geo.intrinsicValue("pointcount")
+    names = np.where(rng.random(count) < empty_ratio, "empty", "wall")
+    geo.addAttrib(headless_hou.attribType.Point, "tile_type", "wall")
+    geo.addAttrib(headless_hou.attribType.Point, "class", -1)
+    geo.setPointStringAttribValues("tile_type", names.tolist())
+    return geo
+
+
+def load_level_utils():
+    headless_hou.install()
+    spec = importlib.util.spec_from_file_location("level_utils", LEVEL_UTILS)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_find_rooms_matches_baseline_flood_fill(seed):
+    expected_geo = random_geometry(seed)
+    expected_count = baseline_find_rooms(expected_geo)
+
+    geo = random_geometry(seed)
+    room_stats = load_level_utils().find_rooms(geo)
+    assert len(room_stats) == expected_count
+    # Boş olmayan point'lerin class'ı ikisinde de başlangıç değeri (-1)
+    assert geo.pointIntAttribValues("class") == expected_geo.pointIntAttribValues("class")
+
+
+def test_component_stats():
+    grid = grid_engine.LevelGrid(6, 4)
+    grid.tiles[:] = grid_engine.WALL
+    grid.tiles[0, 0:2] = grid_engine.EMPTY
+    grid.tiles[1, 2] = grid_engine.EMPTY     # çapraz komşu: aynı bileşen
+    grid.tiles[3, 5] = grid_engine.EMPTY
+
+    labels, count = grid_engine.label_components(grid, grid.tiles == grid_engine.EMPTY)
+    assert count == 2
+    assert labels[0, 0] == labels[1, 2] == 0 and labels[3, 5] == 1
+    stats = grid_engine.component_stats(grid, labels, count)
+    assert stats[0]["area"] == 3 and stats[0]["bbox"] == (0, 0, 2, 1)
+    assert stats[1]["centroid"] == (5.0, 3.0)
@@ -0,0 +1,81 @@
+import os
+
+import numpy as np
+import pytest
+
+import grid_engine
+import level_cache
+
+
+PARAMS = {"seed": 5, "room_count": 6, "enemy_density": 0.3}
+HASHES = {"houdiniScripts/2_CARVE_ROOMS.py": "a" * 64}
+
+
+def grid(fill):
+    return np.full((4, 6), fill, dtype="<U1")
+
+
+def test_cache_key_changes_with_inputs():
+    key = level_cache.cache_key(5, PARAMS, (25, 25), HASHES)
+    assert key == level_cache.cache_key(5, dict(PARAMS), (25, 25), dict(HASHES))
+    assert key != level_cache.cache_key(6, PARAMS, (25, 25), HASHES)
+    assert key != level_cache.cache_key(5, dict(PARAMS, enemy_density=0.4), (25, 25), HASHES)
+    assert key != level_cache.cache_key(5, PARAMS, (25, 26), HASHES)
+    assert key != level_cache.cache_key(5, PARAMS, (25, 25), {k: "b" * 64 for k in HASHES})
+
+
+def test_script_hashes_track_file_content(tmp_path):
+    script = tmp_path / "1_INITIALIZE_MAP.py"
+    script.write_text("print('a')\n")
+    before = level_cache.script_hashes([str(tmp_path)])
+    script.write_text("print('b')\n")
+    after = level_cache.script_hashes([str(tmp_path)])
+    assert list(before) == [f"{tmp_path.name}/1_INITIALIZE_MAP.py"]
+    assert before != after
+
+
+def test_get_put_round_trip(tmp_path):
+    cache = level_cache.LevelCache(str(tmp_path))
+    assert cache.get("ab" * 32) is None
+    cache.put("ab" * 32, grid("#"))
+    np.testing.assert_array_equal(cache.get("ab" * 32), grid_engine.char_codes(grid("#")))
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    keys = [c * 64 for c in "abc"]
+    cache = level_cache.LevelCache(str(tmp_path))
+    for i, key in enumerate(keys[:2]):
+        cache.put(key, grid("#"))
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+    entry_size = os.path.getsize(cache._path(keys[0]))
+
+    # 'a' en eskisi ama okununca en yeni olur; yer açmak için 'b' silinir
+    assert cache.get(keys[0]) is not None
+    cache.max_bytes = 2 * entry_size
+    cache.put(keys[2], grid("."))
+    assert os.path.exists(cache._path(keys[0]))
+    assert not os.path.exists(cache._path(keys[1]))
+    assert os.path.exists(cache._path(keys[2]))
+    assert cache.stats()["size_mb"] == round(2 * entry_size / (1024.0 * 1024.0), 2)
+
+    # Yeniden açılan cache boyutu diskten okur
+    assert level_cache.LevelCache(str(tmp_path))._total_bytes == 2 * entry_size
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, None), ("off", None), ("0", None), ("on", "default"), ("custom", "custom"),
+])
+def test_from_environment(monkeypatch, tmp_path, value, expected):
+    if value is None:
+        monkeypatch.delenv("BOMBERMAN_LEVEL_CACHE", raising=False)
+    else:
+        monkeypatch.setenv("BOMBERMAN_LEVEL_CACHE", value if value != "custom" else str(tmp_path / "custom"))
+    monkeypatch.setenv("BOMBERMAN_LEVEL_CACHE_MB", "2")
+
+    cache = level_cache.from_environment(default_dir=str(tmp_path / "default"))
+    if expected is None:
+        assert cache is None
+    else:
+        assert cache.cache_dir == str(tmp_path / expected)
+        assert cache.max_bytes == 2 * 1024 * 1024
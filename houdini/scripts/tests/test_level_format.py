@@ -0,0 +1,56 @@
+import re
+
+import numpy as np
+import pytest
+
+import grid_engine
+import level_format
+import level_reader
+
+
+EXPORT_PARAMS = {"level_version": "v1.0.0", "format_version": level_format.CURRENT_FORMAT_VERSION}
+
+
+def test_dataset_writer_round_trip(levels, tmp_path):
+    path = str(tmp_path / level_format.dataset_filename(EXPORT_PARAMS))
+    with level_format.LevelDatasetWriter(path, EXPORT_PARAMS) as writer:
+        for level_id, params, chars in levels:
+            writer.add_level(level_id, params, chars)
+
+    records = level_reader.read_level_file(path).levels
+    assert len(records) == len(levels)
+    for record, (level_id, params, chars) in zip(records, levels):
+        assert record.level_id == level_id
+        assert record.seed == params["seed"]
+        np.testing.assert_array_equal(record.grid, grid_engine.char_codes(chars))
+
+
+def test_dataset_writer_index_trailer(levels, tmp_path):
+    path = tmp_path / level_format.dataset_filename(EXPORT_PARAMS)
+    with level_format.LevelDatasetWriter(str(path), EXPORT_PARAMS) as writer:
+        for level_id, params, chars in levels:
+            writer.add_level(level_id, params, chars)
+
+    data = path.read_bytes()
+    # Header'daki sayı stream sonunda yerinde güncellenir
+    assert re.search(rb"^# Levels: (\d+) *$", data, re.M).group(1) == str(len(levels)).encode()
+
+    trailer = data[data.index(b"[DATASET_INDEX]"):].decode("utf-8").splitlines()[2:]
+    assert len(trailer) == len(levels)
+    for line, (level_id, params, _) in zip(trailer, levels):
+        key, value = line.split("=")
+        offset, seed = (int(v) for v in value.split(","))
+        assert (int(key), seed) == (level_id, params["seed"])
+        # Offset level bloğunun başını gösterir
+        block = data[offset:offset + 80].decode("utf-8")
+        assert f"# LEVEL {level_id:04d} : Generated Level" in block.split("[CELL_TYPES]")[0]
+
+
+def test_dataset_writer_abort_keeps_target(levels, tmp_path):
+    path = tmp_path / "DATASET.ini"
+    with pytest.raises(RuntimeError):
+        with level_format.LevelDatasetWriter(str(path), EXPORT_PARAMS) as writer:
+            level_id, params, chars = levels[0]
+            writer.add_level(level_id, params, chars)
+            raise RuntimeError("cook failed")
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+import grid_engine
+import level_format
+import level_pack
+
+
+def write_pack(levels, path):
+    with level_pack.LevelPackWriter(path, "v1.0.0", level_format.CURRENT_FORMAT_VERSION) as writer:
+        for level_id, params, chars in levels:
+            writer.add_level(level_id, params, chars)
+
+
+def test_level_pack_round_trip(levels, tmp_path):
+    path = str(tmp_path / ("levels" + level_pack.PACK_EXTENSION))
+    write_pack(levels, path)
+
+    with level_pack.LevelPack(path) as pack:
+        assert len(pack) == len(levels)
+        assert pack.level_version == "v1.0.0"
+        for (level_id, seed, grid), (expected_id, params, chars) in zip(pack, levels):
+            assert (level_id, seed) == (expected_id, params["seed"])
+            np.testing.assert_array_equal(grid, grid_engine.char_codes(chars))
+        level_id, params, chars = levels[1]
+        np.testing.assert_array_equal(pack.by_seed(params["seed"]), grid_engine.char_codes(chars))
+        assert pack.params(level_id)["room_count"] == params["room_count"]
+        assert pack.ascii_rows(level_id) == grid_engine.serialize_grid(chars)[0]
+
+
+def test_level_pack_missing_level(levels, tmp_path):
+    path = str(tmp_path / ("levels" + level_pack.PACK_EXTENSION))
+    write_pack(levels, path)
+
+    with level_pack.LevelPack(path) as pack:
+        with pytest.raises(KeyError):
+            pack.level(max(level_id for level_id, _, _ in levels) + 1)
+        with pytest.raises(KeyError):
+            pack.by_seed(-1)
+
+
+def test_level_pack_writer_abort_keeps_target(levels, tmp_path):
+    path = tmp_path / ("levels" + level_pack.PACK_EXTENSION)
+    with pytest.raises(RuntimeError):
+        with level_pack.LevelPackWriter(str(path)) as writer:
+            level_id, params, chars = levels[0]
+            writer.add_level(level_id, params, chars)
+            raise RuntimeError("cook failed")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_not_a_level_pack(tmp_path):
+    path = tmp_path / "DATASET.ini"
+    path.write_bytes(b"[LEVEL]\n" * level_pack.HEADER_SIZE)
+    with pytest.raises(ValueError):
+        level_pack.LevelPack(str(path))
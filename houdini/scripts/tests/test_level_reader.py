@@ -0,0 +1,104 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+import grid_engine
+import level_format
+import level_reader
+
+
+EXPORT_PARAMS = {"level_version": "v1.0.0", "format_version": level_format.CURRENT_FORMAT_VERSION}
+UNITY_LEVELS = os.path.join(os.path.dirname(__file__), "..", "..", "..", "unity", "Assets", "Levels")
+
+GRID_LINES = ["#####", "#P.X#", "#####"]
+
+# GET_LVL_INFO çıktısının kısaltılmış hali
+V31_INI = """# ========================================================
+# Unity Level Data v3.1
+# Generator: Houdini 20.0.547
+# ========================================================
+
+[CELL_TYPES]
+# ID=Symbol,Name,Passable,Prefab_Index,Attributes
+0=.,EMPTY,true,0
+1=#,WALL,false,1
+
+# ========================================================
+# LEVEL_001_Tutorial : Tutorial Level
+# ========================================================
+[LEVEL_001_Tutorial]
+GRID_WIDTH=5
+GRID_HEIGHT=3
+
+# === CONTROLLER PARAMETERS ===
+HOUDINI_SEED=12345
+NOISE_SCALE=0.25
+
+[GRID_ASCII]
+""" + "\n".join(GRID_LINES) + "\n"
+
+V31_JSON = {
+    "meta": {"format_version": "3.1", "export_date": "2025-01-01T00:00:00", "generator": "Houdini 20.0.547"},
+    "cell_types": [
+        {"id": 0, "symbol": ".", "name": "EMPTY", "passable": True, "prefab_index": 0, "attributes": {}},
+        {"id": 1, "symbol": "#", "name": "WALL", "passable": False, "prefab_index": 1, "attributes": {}},
+    ],
+    "level": {
+        "tag": "LEVEL_001_Tutorial",
+        "grid_width": 5,
+        "grid_height": 3,
+        "controller_parameters": {"HOUDINI_SEED": "12345", "NOISE_SCALE": "0.25"},
+        "grid_ascii": GRID_LINES,
+    },
+}
+
+
+def test_single_level_file_round_trip(levels, tmp_path):
+    level_id, params, chars = levels[0]
+    height, width = chars.shape
+    rows, _ = grid_engine.serialize_grid(chars)
+    path = tmp_path / level_format.level_filename(level_id, EXPORT_PARAMS)
+    path.write_text(level_format.level_content(level_id, params, rows, width, height, EXPORT_PARAMS),
+                    encoding="utf-8")
+
+    record = level_reader.read_level(str(path))
+    assert record.format_version == level_format.CURRENT_FORMAT_VERSION
+    assert record.level_id == level_id
+    assert record.seed == params["seed"]
+    assert record.config["GRID_WIDTH"] == width and record.config["GRID_HEIGHT"] == height
+    np.testing.assert_array_equal(record.grid, grid_engine.char_codes(chars))
+    assert record.ascii_rows() == rows
+
+
+def test_detect_format():
+    assert level_reader.detect_format(b"# === LEVEL DATASET v4.3 ===\n") == "v4.3"
+    assert level_reader.detect_format(V31_INI.encode("utf-8")) == "v3.1"
+    assert level_reader.detect_format(json.dumps(V31_JSON).encode("utf-8")) == "v3.1-json"
+    with pytest.raises(ValueError):
+        level_reader.detect_format(b"[GRID_ASCII]\n#####\n")
+
+
+@pytest.mark.parametrize("name, content", [
+    ("level_001_tutorial.ini", V31_INI),
+    ("level_001_tutorial.json", json.dumps(V31_JSON)),
+])
+def test_v31_level(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+
+    record = level_reader.read_level(str(path))
+    assert record.level_id == "LEVEL_001_Tutorial"
+    assert record.seed == 12345
+    assert record.config["GRID_WIDTH"] == 5
+    assert record.cell_types[1]["name"] == "WALL"
+    assert record.ascii_rows() == GRID_LINES
+
+
+def test_iter_levels_reads_unity_exports():
+    records = list(level_reader.iter_levels(UNITY_LEVELS))
+    assert len(records) == 9
+    assert {record.format_version for record in records} == {"v3.8", "v3.99", "v4.0", "v4.1", "v4.2", "v4.3"}
+    assert all(record.grid.shape == (25, 25) for record in records)
+    assert [record.seed for record in records if record.format_version == "v4.3"] == [283, 260, 261]
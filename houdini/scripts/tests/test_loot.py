@@ -0,0 +1,73 @@
+import random
+
+import numpy as np
+import pytest
+
+import grid_engine
+
+
+WEIGHTS = [2.0, 1.0, 0.0, 5.0, 0.5]
+
+
+def implied_distribution(table):
+    """Alias tablosunun tam olasılıkları: sütun başına 1/k, prob / alias arasında bölünür"""
+    k = len(table)
+    dist = np.zeros(k)
+    np.add.at(dist, np.arange(k), table.prob / k)
+    np.add.at(dist, table.alias, (1.0 - table.prob) / k)
+    return dist
+
+
+def test_alias_table_reproduces_weights():
+    table = grid_engine.AliasTable(WEIGHTS)
+    expected = np.array(WEIGHTS) / sum(WEIGHTS)
+    np.testing.assert_allclose(implied_distribution(table), expected, atol=1e-12)
+
+    draws = table.draw(np.random.default_rng(0), 200_000)
+    freq = np.bincount(draws, minlength=len(WEIGHTS)) / draws.size
+    np.testing.assert_allclose(freq, expected, atol=0.005)
+    assert freq[2] == 0.0
+
+
+@pytest.mark.parametrize("weights", [[], [0.0, 0.0], [-1.0, 1.0]])
+def test_alias_table_rejects_empty_weights(weights):
+    with pytest.raises(ValueError):
+        grid_engine.AliasTable(weights)
+
+
+def test_loot_types_follow_ratio_and_density():
+    loot_system = grid_engine.default_loot_system()
+    densities = {"coin": 0.5, "health": 0.5}
+    loot_counts = loot_system.get_loot_counts(100_000, densities, 2.0)
+    assert loot_counts["coin"]["count"] == loot_counts["health"]["count"] == 10_000
+
+    tiles = np.zeros(100_000, dtype=np.uint8)
+    cells = np.arange(0, 100_000, 2)
+    results = loot_system.place_loot_with_ratios(tiles, cells, loot_counts, random.Random(3))
+    assert sum(results.values()) == 20_000
+    assert (tiles[1::2] == 0).all()
+    assert results["coin"] == (tiles == grid_engine.COIN).sum()
+    # coin ratio 2x: türlerin 2/3'ü coin
+    assert abs(results["coin"] / 20_000 - 2.0 / 3.0) < 0.01
+
+    # Yoğunluğu sıfır olan tür hiç çekilmez
+    loot_counts = loot_system.get_loot_counts(1000, {"coin": 0.5, "health": 0.0}, 2.0)
+    results = loot_system.place_loot_with_ratios(np.zeros(1000, dtype=np.uint8), np.arange(1000),
+                                                 loot_counts, random.Random(3))
+    assert results == {"coin": 100, "health": 0}
+
+
+def test_place_batch_budgets_and_distribution():
+    loot_system = grid_engine.default_loot_system()
+    densities = {"coin": 0.6, "health": 0.3}
+    empty_counts = np.array([0, 7, 400, 5000])
+    levels, ranks, tile_ids = loot_system.place_batch(np.random.default_rng(1), empty_counts, densities, 3.0)
+
+    expected = sum((empty_counts * d * 0.3).astype(np.int64) for d in densities.values())
+    np.testing.assert_array_equal(np.bincount(levels, minlength=empty_counts.size), expected)
+    assert (ranks < empty_counts[levels]).all()
+    # Level içinde aynı hücre iki kez seçilmez
+    assert len(set(zip(levels.tolist(), ranks.tolist()))) == levels.size
+
+    coin_share = (tile_ids == grid_engine.COIN).mean()
+    assert abs(coin_share - (2.0 * 0.6) / (2.0 * 0.6 + 0.3)) < 0.03
@@ -0,0 +1,70 @@
+import os
+
+import numpy as np
+import pytest
+
+import level_format
+import level_pack
+import level_reader
+import migrate_levels
+
+
+UNITY_LEVELS = os.path.join(os.path.dirname(__file__), "..", "..", "..", "unity", "Assets", "Levels")
+
+
+def codes(rows):
+    return np.frombuffer("".join(rows).encode("ascii"), dtype=np.uint8).reshape(len(rows), -1)
+
+
+def test_migrate_grid_remaps_old_legend():
+    # Eski legend: 'X' stairs, 'S' atıcı düşman
+    old = codes(["#PSX#", "#1..#"])
+    np.testing.assert_array_equal(level_format.migrate_grid(old), codes(["#PFS#", "#1..#"]))
+    np.testing.assert_array_equal(level_format.migrate_grid(old, strip_path=True), codes(["#PFS#", "#...#"]))
+
+    # 'X' yoksa grid zaten güncel legend'da: 'S' stairs olarak kalır
+    current = codes(["#PFS#"])
+    np.testing.assert_array_equal(level_format.migrate_grid(current), current)
+
+
+def test_plan_migration_names_variants():
+    src = ["LEVEL_0001_v1.0.0_v3.8.ini", "LEVEL_0001_v1.0.0_v4.3.ini",
+           "LEVEL_0001_v1.0.0_v4.2.ini", "LEVEL_0002_v1.0.0_v4.2.ini"]
+    plan = migrate_levels.plan_migration(src, "v4.3")
+    assert plan == [
+        ("LEVEL_0001_v1.0.0_v4.3.ini", "LEVEL_0001_v1.0.0_v4.3.ini", "LEVEL_0001_v1.0.0_v4.3.ini"),
+        ("LEVEL_0001_v1.0.0_v4.2.ini", "LEVEL_0001_v1.0.0_v4.2_v4.3.ini", "LEVEL_0001_v1.0.0_v4.3.ini"),
+        ("LEVEL_0001_v1.0.0_v3.8.ini", "LEVEL_0001_v1.0.0_v3.8_v4.3.ini", "LEVEL_0001_v1.0.0_v4.3.ini"),
+        ("LEVEL_0002_v1.0.0_v4.2.ini", "LEVEL_0002_v1.0.0_v4.3.ini", "LEVEL_0002_v1.0.0_v4.3.ini"),
+    ]
+
+
+def test_migrate_directory_to_ini(tmp_path):
+    summary = migrate_levels.migrate_directory(UNITY_LEVELS, out_dir=str(tmp_path), workers=1)
+    assert (summary["files"], summary["failed"]) == (9, 0)
+    assert (summary["skipped"], summary["variants"]) == (3, 3)
+
+    names = sorted(os.listdir(tmp_path))
+    assert names == [
+        "LEVEL_0001_v1.0.0_v4.1_v4.3.ini", "LEVEL_0001_v1.0.0_v4.2_v4.3.ini", "LEVEL_0001_v1.0.0_v4.3.ini",
+        "LEVEL_0002_v1.0.0_v4.2_v4.3.ini", "LEVEL_0002_v1.0.0_v4.3.ini", "LEVEL_0003_v1.0.0_v4.3.ini",
+    ]
+    for name in names:
+        record = level_reader.read_level(str(tmp_path / name))
+        assert record.format_version == level_format.CURRENT_FORMAT_VERSION
+        assert not (record.grid == ord("X")).any()
+
+
+def test_migrate_directory_to_pack_reassigns_ids(tmp_path):
+    path = str(tmp_path / ("levels" + level_pack.PACK_EXTENSION))
+    migrate_levels.migrate_directory(UNITY_LEVELS, pack_path=path, workers=1)
+
+    with level_pack.LevelPack(path) as pack:
+        entries = [(level_id, seed) for level_id, seed, _ in pack]
+    # Farklı içerikli kopyalar en büyük LEVEL_ID'den sonra yeni ID alır
+    assert entries == [(1, 283), (2, 260), (3, 261), (4, 209), (5, 209), (6, 210)]
+
+
+def test_migrate_directory_needs_one_target(tmp_path):
+    with pytest.raises(ValueError):
+        migrate_levels.migrate_directory(UNITY_LEVELS)
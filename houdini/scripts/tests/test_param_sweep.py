@@ -0,0 +1,59 @@
+import numpy as np
+
+import grid_engine
+import param_sweep
+
+
+def corridor_grid(path_cells):
+    """Duvarla çevrili 8x4 grid, ortadaki satırda path_cells uzunluğunda garanti yolu"""
+    grid = grid_engine.LevelGrid(8, 4)
+    grid.tiles[:] = grid_engine.WALL
+    grid.tiles[1, 1:1 + path_cells] = grid_engine.EMPTY
+    grid.tiles[2, 1] = grid_engine.ENEMY
+    grid.tiles[2, 7] = grid_engine.ENEMY_SHOOTER   # son sütun: export edilmez
+    grid.path[1, 1:1 + path_cells] = True
+    return grid
+
+
+def test_level_stats_counts_exported_cells():
+    stats, ok = param_sweep.level_stats(corridor_grid(5), min_exit_dist=5)
+    # floor_area / enemy_count prim owner hücrelerinden (7x3), path_length bütün point'lerden
+    assert stats == (5 + 1, 5, 1)
+    assert ok
+
+
+def test_level_stats_failure_rule():
+    grid = corridor_grid(5)
+    assert param_sweep.level_stats(grid, min_exit_dist=5)[1]
+    assert not param_sweep.level_stats(grid, min_exit_dist=6)[1]
+    grid.path[:] = False
+    assert not param_sweep.level_stats(grid, min_exit_dist=0)[1]
+
+
+def test_run_chunk_counts_failures():
+    params = grid_engine.resolve_params(None)
+    params.pop("seed")
+
+    _, rows, failed = param_sweep.run_chunk((0, params, 0, 12))
+    assert (failed, rows.shape) == (0, (12, len(param_sweep.STAT_FIELDS)))
+
+    # Hedef mesafe bölgelere sığmayınca level başarısız sayılır
+    params["min_player_exit_dist"] = 40
+    _, rows, failed = param_sweep.run_chunk((1, params, 0, 12))
+    expected = sum(
+        not param_sweep.level_stats(grid_engine.generate_level(dict(params, seed=seed)), 40)[1]
+        for seed in range(12)
+    )
+    assert failed == expected > 0
+    assert rows.shape[0] == 12 - failed
+    assert (rows[:, 1] >= 40).all()
+
+
+def test_summarize_config_failure_rate():
+    samples = np.array([[10, 5, 1], [20, 7, 3]], dtype=np.float64)
+    row = param_sweep.summarize_config(3, {"enemy_density": 0.1}, samples, 2, 4)
+    assert row["failure_rate"] == 0.5 and row["levels"] == 4
+    assert row["path_length_mean"] == 6.0 and row["enemy_count_max"] == 3
+
+    empty = param_sweep.summarize_config(4, {}, np.zeros((0, 3)), 4, 4)
+    assert empty["failure_rate"] == 1.0 and empty["floor_area_mean"] == ""
@@ -0,0 +1,39 @@
+import pytest
+
+import grid_engine
+import headless_hou
+import stage_profiler
+
+
+@pytest.fixture
+def profile_log(tmp_path):
+    log_path = str(tmp_path / "stages.jsonl")
+    stage_profiler.configure(log_path=log_path, memory=False)
+    yield log_path
+    stage_profiler.configure(log_path=None)
+
+
+def test_stage_scripts_record_seed(profile_log):
+    headless_hou.generate_level({"seed": 77})
+    records = stage_profiler.read_records(profile_log)
+    assert [r["stage"] for r in records] == list(headless_hou.STAGE_NODES)
+    assert all(r["seed"] == 77 and r["status"] == "ok" for r in records)
+    assert all(r["points"] == 26 * 26 for r in records)
+
+
+def test_engine_stages_record_seed(profile_log):
+    grid_engine.generate_level({"seed": 5})
+    records = stage_profiler.read_records(profile_log)
+    assert len(records) == 7
+    assert {r["seed"] for r in records} == {5}
+
+    summary = stage_profiler.summarize(records)
+    assert summary["2_CARVE_ROOMS"]["count"] == 1
+
+
+def test_failed_stage_is_recorded(profile_log):
+    with pytest.raises(ValueError):
+        with stage_profiler.stage("BROKEN", seed=1):
+            raise ValueError("boom")
+    (record,) = stage_profiler.read_records(profile_log)
+    assert record["stage"] == "BROKEN" and record["status"] == "error"
@@ -0,0 +1,40 @@
+import numpy as np
+
+import grid_engine
+import level_pack
+import level_reader
+import tower
+
+
+PARAMS = {"seed": 11, "sizeX": 20, "sizeY": 16}
+
+
+def test_floor_seeds_follow_stride():
+    seeds = [floor_params["seed"] for _, floor_params, _ in tower.iter_floors(4, PARAMS)]
+    assert seeds == [tower.floor_seed(11, floor) for floor in range(4)]
+    assert seeds == [11, 15, 19, 23]
+
+
+def test_first_floor_matches_single_level():
+    _, floor_params, grid = next(tower.iter_floors(1, PARAMS))
+    np.testing.assert_array_equal(grid_engine.export_chars(grid),
+                                  grid_engine.export_chars(grid_engine.generate_level(floor_params)))
+
+
+def test_floors_spawn_on_previous_stairs(tmp_path):
+    result = tower.export_tower(str(tmp_path), 5, PARAMS, pack=True)
+    floors = result["floors"]
+    assert [floor for floor, _, _, _ in floors] == list(range(5))
+    for (_, _, _, stairs), (_, _, spawn, _) in zip(floors, floors[1:]):
+        assert spawn == stairs
+
+    records = level_reader.read_level_file(result["ini"]).levels
+    assert [record.level_id for record in records] == [1, 2, 3, 4, 5]
+    assert [record.seed for record in records] == [seed for _, seed, _, _ in floors]
+    # Katlar farklı: oda düzeni kat seed'inden
+    assert len({record.grid.tobytes() for record in records}) == 5
+
+    with level_pack.LevelPack(result["pack"]) as pack:
+        for record, (level_id, seed, grid) in zip(records, pack):
+            assert (level_id, seed) == (record.level_id, record.seed)
+            np.testing.assert_array_equal(grid, record.grid)
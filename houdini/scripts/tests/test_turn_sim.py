@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+import turn_sim
+
+
+def level(*rows):
+    return np.array([list(row) for row in rows])
+
+
+def run(sim, actions, turns):
+    """turns kadar tur; her turdan sonra render'ları döndür"""
+    frames = []
+    for t in range(turns):
+        sim.step(np.full(sim.num_envs, actions[t] if t < len(actions) else turn_sim.NOOP))
+        frames.append([sim.render(env) for env in range(sim.num_envs)])
+    return frames
+
+
+def column(frame, col=0):
+    return "".join(row[col] for row in frame)
+
+
+def test_bomb_explodes_after_fuse_with_range_minus_one_waves():
+    # Player ilk turda baktığı yöne (alt satır) bomba koyar; dalga 3 adım gider (menzil 4 - 1)
+    in_range = level("P", ".", ".", ".", "B", ".")
+    out_of_range = level("P", ".", ".", ".", ".", "B")
+    sim = turn_sim.TurnSimulator([in_range, out_of_range], num_envs=2, seed=0)
+    sim.reset()
+    frames = run(sim, [turn_sim.PLACE_BOMB], 8)
+
+    assert [column(frame[1]) for frame in frames] == [
+        "PO...B",   # tur 1: bomba
+        "PO...B",
+        "PO...B",
+        "P.X..B",   # tur 4: patlama, ilk dalga 1. hücrede
+        "P..X.B",
+        "P...XB",   # tur 6: son dalga 3. hücrede
+        "P....B",   # 4. hücreye dalga açılmaz
+        "P....B",
+    ]
+    # Menzil içindeki kırılabilir duvar 6. turda yıkılır
+    assert column(frames[4][0]) == "P..XB."
+    assert column(frames[5][0]) == "P....."
+    # Yukarı giden ilk dalga bitişikteki player'a 4. turda hasar verir
+    np.testing.assert_array_equal(sim.player_hp, [turn_sim.PLAYER_MAX_HEALTH - 1] * 2)
+
+
+def test_shooter_fires_on_fourth_turn():
+    # Atıcı dört yandan kırılabilir duvarla çevrili: hareket edemez, 4. turda baktığı yöndekini yıkar
+    boxed = level(".B.", "BFB", ".B.", "P..")
+    sim = turn_sim.TurnSimulator([boxed], num_envs=64, seed=1)
+    sim.reset()
+    frames = run(sim, [], 4)
+    walls = [[sum(row.count("B") for row in env) for env in frame] for frame in frames]
+    assert walls[:3] == [[4] * 64] * 3
+    assert walls[3] == [3] * 64
+
+
+def test_projectile_waits_one_turn_after_spawn():
+    sim = turn_sim.TurnSimulator([level("F.....", "#####P")], num_envs=1, seed=2)
+    sim.reset()
+    # Bir sonraki turda sağa ateş etsin
+    sim.unit_counter[:] = turn_sim.SHOOT_INTERVAL - 1
+    sim.unit_facing[:] = turn_sim.DIRECTIONS.index((1, 0))
+    frames = run(sim, [], 4)
+    assert [frame[0][0].index("*") for frame in frames] == [1, 1, 2, 3]
+
+
+def test_stairs_ends_episode_and_resets():
+    sim = turn_sim.TurnSimulator([level("PS")], num_envs=1, seed=3)
+    sim.reset()
+    _, reward, done, info = sim.step(np.array([turn_sim.RIGHT]))
+    assert done[0]
+    assert info["events"]["stairs"][0] == 1 and info["episode_turns"][0] == 1
+    assert reward[0] == pytest.approx(turn_sim.REWARD_WEIGHTS["stairs"] + turn_sim.REWARD_WEIGHTS["turn"])
+    # Biten environment başa sarılır
+    assert sim.render(0) == ["PS"] and sim.turn[0] == 0
+
+
+def test_level_codes_legend_and_spawn():
+    # Eski legend: 'X' stairs, 'S' atıcı; birden fazla 'P' varsa sonuncusu spawn
+    codes = turn_sim.level_codes(level("P.S", "X.P"))
+    assert codes.shape == (4, 5)
+    assert (codes[0] == turn_sim.WALL).all() and (codes[:, 0] == turn_sim.WALL).all()
+    np.testing.assert_array_equal(codes[1:-1, 1:-1], [
+        [turn_sim.EMPTY, turn_sim.EMPTY, turn_sim.SHOOTER],
+        [turn_sim.STAIRS, turn_sim.EMPTY, turn_sim.PLAYER],
+    ])
+
+
+def test_levels_without_spawn_are_skipped():
+    sim = turn_sim.TurnSimulator([level("..S"), level("P.S")], num_envs=2)
+    assert sim.skipped_levels == [0]
+    assert sim.reset()[1, 1, 1] == turn_sim.PLAYER
+    with pytest.raises(ValueError):
+        turn_sim.TurnSimulator([level("..S")], num_envs=1)
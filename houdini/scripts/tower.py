@@ -0,0 +1,148 @@
+"""
+Tower
+Çok katlı tower'ı tek geçişte üretir ve tek dosya olarak export eder (Houdini'siz, grid_engine)
+
+Her kat 1 → 6 pipeline'ının aynısıdır, farklar:
+    - bütün katlar tek LevelGrid üzerinde üretilir: (x, z) indeksi, komşuluk tabloları ve
+      loot alias tablosu bir kez kurulur, katlar arasında sadece tile / room / path sıfırlanır
+    - kat k'nın seed'i base_seed + k * FLOOR_SEED_STRIDE (stage offset'leri seed .. seed+3
+      çakışmaz); oda boyutları / noise kat seed'inden çekilir, yoksa bütün katlar aynı olur
+    - kat 0 3_PLACE_PLAYER_AND_EXIT ile, sonraki katlar alt katın stairs hücresinde spawn olur:
+      grid_engine.place_exit_from sadece o hücreden tek BFS yapar (all-pairs BFS yok)
+Katlar cook edildikçe tek bir INI dataset'ine (level_id = kat numarası) ve istenirse
+level pack'e (.blp) akıtılır; bellekte sadece o anki kat bulunur.
+
+Kullanım:
+    python tower.py --floors 50 --seed 283 --out export
+    python tower.py --floors 20 --params params.json --pack
+"""
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+import grid_engine
+import level_format
+import level_pack
+import stage_profiler
+
+
+FLOOR_SEED_STRIDE = 4
+TOWER_STAGE = "TOWER_FLOOR"
+DEFAULT_EXPORT_PARAMS = {"level_version": "v1.0.0", "format_version": level_format.CURRENT_FORMAT_VERSION}
+
+
+def floor_seed(base_seed, floor):
+    """Kat seed'i (stage'ler seed .. seed+3 kullandığı için katlar arası 4 adım)"""
+    return base_seed + floor * FLOOR_SEED_STRIDE
+
+
+def tower_filename(base_seed, floors, export_params, extension=".ini"):
+    """TOWER_283_050F_v1.0.0_v4.3.ini"""
+    return (f"TOWER_{base_seed}_{floors:03d}F_{export_params['level_version']}_"
+            f"{export_params['format_version']}{extension}")
+
+
+def iter_floors(floors, params=None):
+    """
+    Katları sırayla üret: (kat, kat parametreleri, grid).
+    grid bütün katlarda aynı nesnedir; bir sonraki kata geçmeden kullanılmalıdır.
+    """
+    params = grid_engine.resolve_params(params)
+    base_seed = int(params["seed"])
+    grid = grid_engine.controller_grid(params)
+    loot_system = grid_engine.default_loot_system()
+    points = int(grid.order.size)
+
+    spawn_cell = None
+    for floor in range(floors):
+        floor_params = dict(params, seed=floor_seed(base_seed, floor))
+        with stage_profiler.stage(TOWER_STAGE, floor_params["seed"], floor=floor, points=points):
+            grid.path[:] = False
+            grid_engine.initialize_map(grid)
+            grid_engine.carve_rooms(grid, floor_params)
+            grid_engine.connect_rooms(grid)
+            if spawn_cell is None:
+                _, exit_cell, _ = grid_engine.place_player_and_exit(grid, floor_params)
+            else:
+                _, exit_cell, _ = grid_engine.place_exit_from(grid, floor_params, spawn_cell)
+            if not grid_engine.guarantee_path(grid):
+                raise Exception(f"No player -> stairs path on floor {floor}")
+            grid_engine.place_enemies(grid, floor_params)
+            grid_engine.create_interactables(grid, floor_params, loot_system)
+        yield floor, floor_params, grid
+        # Bir üst katın player'ı bu katın stairs'inin üstünde başlar
+        spawn_cell = exit_cell
+
+
+def export_tower(export_folder, floors, params=None, export_params=None, pack=False):
+    """
+    Tower'ı tek INI dataset'i (+ istenirse .blp) olarak yaz.
+    Dönüş: {"ini": yol, "pack": yol / None, "floors": [(kat, seed, spawn (x, z), stairs (x, z))]}
+    """
+    params = grid_engine.resolve_params(params)
+    export_params = dict(DEFAULT_EXPORT_PARAMS, **(export_params or {}))
+    base_seed = int(params["seed"])
+    os.makedirs(export_folder, exist_ok=True)
+
+    ini_path = os.path.join(export_folder, tower_filename(base_seed, floors, export_params))
+    pack_path = os.path.join(export_folder, tower_filename(base_seed, floors, export_params, ".blp")) if pack else None
+
+    writer = level_format.LevelDatasetWriter(ini_path, export_params, generator="tower.py (grid_engine)")
+    pack_writer = level_pack.LevelPackWriter(pack_path, export_params["level_version"],
+                                             export_params["format_version"]) if pack else None
+    summary = []
+    try:
+        for floor, floor_params, grid in iter_floors(floors, params):
+            chars = grid_engine.export_chars(grid)
+            writer.add_level(floor + 1, floor_params, chars)
+            if pack_writer is not None:
+                pack_writer.add_level(floor + 1, floor_params, chars)
+            (player_cell,), (exit_cell,) = grid.cells_of(grid_engine.PLAYER), grid.cells_of(grid_engine.STAIRS)
+            xs, zs = grid.world_xz(np.array([player_cell, exit_cell]))
+            summary.append((floor, floor_params["seed"], (int(xs[0]), int(zs[0])), (int(xs[1]), int(zs[1]))))
+    except BaseException:
+        writer.abort()
+        if pack_writer is not None:
+            pack_writer.abort()
+        raise
+    writer.close()
+    if pack_writer is not None:
+        pack_writer.close()
+    return {"ini": ini_path, "pack": pack_path, "floors": summary}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a multi-floor tower in a single pass")
+    parser.add_argument("--floors", type=int, default=10, help="Kat sayısı")
+    parser.add_argument("--seed", type=int, default=None, help="Tower seed'i (kat 0), varsayılan CONTROLLER seed'i")
+    parser.add_argument("--params", default=None, help="CONTROLLER parametreleri (JSON dosyası)")
+    parser.add_argument("--out", default="export", help="Export klasörü")
+    parser.add_argument("--level-version", default=DEFAULT_EXPORT_PARAMS["level_version"])
+    parser.add_argument("--pack", action="store_true", help="Ayrıca binary level pack (.blp) yaz")
+    args = parser.parse_args(argv)
+
+    params = {}
+    if args.params:
+        with open(args.params, "r", encoding="utf-8") as f:
+            params = json.load(f)
+    if args.seed is not None:
+        params["seed"] = args.seed
+
+    start = time.perf_counter()
+    result = export_tower(args.out, args.floors, params, {"level_version": args.level_version}, args.pack)
+    elapsed = max(time.perf_counter() - start, 1e-9)
+
+    print(f"🗼 Tower: {args.floors} floors in {elapsed:.2f}s ({args.floors / elapsed:.0f} floors/s)")
+    for floor, seed, spawn, stairs in result["floors"]:
+        print(f"   F{floor:03d}  seed={seed:<8} P={spawn}  S={stairs}")
+    print(f"📄 Dataset: {result['ini']}")
+    if result["pack"]:
+        print(f"📦 Pack: {result['pack']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,635 @@
+"""
+Turn Simulator
+Unity tur kurallarının Houdini'siz / Unity'siz, binlerce environment'ı aynı anda ilerleten NumPy kopyası
+
+Export edilmiş herhangi bir level grid'i (INI, DATASET, .blp, grid_engine char grid'i / LevelGrid) yüklenir;
+her environment Unity'deki levelMap gibi tek bir kod grid'i tutar (kenara 1 hücre duvar eklenir,
+harita dışı kontrolleri böylece duvar kontrolüne dönüşür).
+
+Bir tur TurnManager.ProcessTurn ile aynı sırada işlenir:
+    1. Niyet toplama (GetAction), sıra: player, enemy / shooter, ExplosionWave, Projectile, Bomb
+       - EnemyTile:        rastgele yön (MoveAction)
+       - EnemyShooterTile: 4. turda baktığı yöne ateş eder (mermi / bitişik hedefe hasar),
+                           diğer turlarda %50 yön değiştirip o yöne MoveAction
+       - ExplosionWave:    bir sonraki hücreye dalga açar (geçilemez hücreye hasar verip durur), yok olur
+       - BombTile:         3 tur sonra patlar, 4 yöne menzil - 1 adımlık dalga
+    2. Eylemler kuyruk sırasıyla: player hareketi / bomba, düşman hareketleri, mermi hareketleri
+       (MovementHelper.TryMove: saldırı, dost ateşi yok, coin / health toplama)
+O turda doğan nesneler (mermi, dalga, bomba) Unity'deki gibi bir sonraki turdan itibaren çalışır.
+
+Vektörizasyon environment ekseninde yapılır: aynı environment içindeki nesneler Unity'deki kayıt
+sırasıyla (slot sırası) tek tek, bütün environment'larda aynı anda işlenir. Böylece env içi
+sıralı yan etkiler (aynı hücreye iki mermi, dalganın düşmanı öldürmesi vb.) korunur.
+Slot döngüleri sadece o slotu dolu environment'lara bakar (seyrek slotlar sıkıştırılır, mermi /
+dalga slotları env başına sayaçla sınırlanır, aynı sıradaki atıcılar tek çağrıda ateş eder).
+Tek CPU'da 25x25 level'larla 16k environment: ~0.9M env-step/s.
+
+Farklar (bilinçli):
+    - rastgele çekimler UnityEngine.Random yerine numpy Generator'dan
+    - Destroy() gecikmesi: aynı turda ölen birim o turun niyet toplamasında hâlâ ateş edebilir
+      (Unity ile aynı), ama ölü player bomba koyamaz
+    - episode sonu: player ölünce, stairs hücresine basınca ya da max_turns dolunca (Unity'de stairs
+      hiçbir şey yapmaz); biten environment'lar otomatik olarak başa sarılır
+
+Kullanım:
+    sim = turn_sim.TurnSimulator(turn_sim.load_levels("export/DATASET_v1.0.0_v4.3.ini"), num_envs=4096)
+    obs = sim.reset()
+    obs, reward, done, info = sim.step(actions)       # actions: (num_envs,) NOOP/UP/DOWN/LEFT/RIGHT/BOMB
+
+    python turn_sim.py export/ --envs 4096 --steps 500   # rastgele policy ile throughput ölçümü
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+import grid_engine
+import level_format
+import level_pack
+import level_reader
+
+
+# --------------------------
+# 0) KODLAR VE KURALLAR
+# --------------------------
+
+# Simülasyon hücre kodları (Unity TileType karşılıkları)
+EMPTY = 0
+WALL = 1
+BREAKABLE = 2
+STAIRS = 3
+COIN = 4
+HEALTH = 5
+PLAYER = 6
+ENEMY = 7
+SHOOTER = 8
+BOMB = 9
+PROJECTILE = 10
+EXPLOSION = 11
+CODE_COUNT = 12
+
+# TurnManager.GetDebugSymbol ile aynı semboller
+CODE_CHARS = ".#BS$HPEFO*X"
+
+# GRID_ASCII char'ı -> kod (LevelLoader: tanınmayan her şey Empty, '1' yol işareti dahil)
+CHAR_CODES = np.full(256, EMPTY, dtype=np.uint8)
+for _char, _code in (("#", WALL), ("B", BREAKABLE), ("S", STAIRS), ("C", COIN), ("H", HEALTH),
+                     ("P", PLAYER), ("E", ENEMY), ("F", SHOOTER)):
+    CHAR_CODES[ord(_char)] = _code
+
+# MovementHelper.IsTilePassable / IsUnit
+PASSABLE_CODES = (EMPTY, STAIRS)
+PLAYER_PASSABLE_CODES = PASSABLE_CODES + (COIN, HEALTH)
+
+# Vector2Int.up, down, left, right (Unity'de y satır indeksi, up = y + 1)
+DIRECTIONS = ((0, 1), (0, -1), (-1, 0), (1, 0))
+
+# Player aksiyonları
+NOOP, UP, DOWN, LEFT, RIGHT, PLACE_BOMB = range(6)
+ACTION_COUNT = 6
+
+# Prefab / SerializeField varsayılanları
+PLAYER_MAX_HEALTH = 3
+ENEMY_HEALTH = 1
+HEAL_AMOUNT = 1
+BOMB_FUSE_TURNS = 3
+EXPLOSION_RANGE = 4
+SHOOT_INTERVAL = 4
+
+# Aynı anda canlı bomba (sigorta 3 tur, turda en fazla 1 bomba) ve dalga (bomba başına 4 zincir) üst sınırları
+BOMB_CAPACITY = BOMB_FUSE_TURNS + 1
+WAVE_CAPACITY = 4 * (BOMB_FUSE_TURNS + 1)
+
+# Aktif env oranı 1 / SPARSE_SLOT_RATIO'nun altındaki düşman slotları sıkıştırılarak işlenir
+SPARSE_SLOT_RATIO = 4
+
+DEFAULT_MAX_TURNS = 500
+REWARD_WEIGHTS = {
+    "coin": 1.0,
+    "heal": 0.5,
+    "kill": 1.0,
+    "damage": -1.0,
+    "stairs": 10.0,
+    "death": -10.0,
+    "turn": -0.01,
+}
+EVENT_NAMES = ("coin", "heal", "kill", "damage", "stairs", "death")
+
+
+# --------------------------
+# 1) LEVEL YÜKLEME
+# --------------------------
+
+def load_levels(source):
+    """Klasör / INI / DATASET / .blp -> (height, width) uint8 char grid listesi"""
+    if source.endswith(".blp"):
+        with level_pack.LevelPack(source) as pack:
+            return [np.array(grid) for _, _, grid in pack]
+    if os.path.isdir(source):
+        return [np.array(level.grid) for level in level_reader.iter_levels(source)]
+    return [np.array(level.grid) for level in level_reader.read_level_file(source)]
+
+
+def level_codes(grid):
+    """
+    Char grid'i (str / bytes / uint8) ya da grid_engine.LevelGrid'i (export edilen prim grid'i)
+    kenarı duvarla çevrili simülasyon kodlarına çevir.
+    Eski legend'lı ('X' = stairs) grid'ler önce güncel legend'a taşınır.
+    Birden fazla 'P' varsa LevelLoader gibi satır sırasında sonuncusu spawn olur; hiç yoksa ValueError.
+    """
+    if isinstance(grid, grid_engine.LevelGrid):
+        grid = grid_engine.export_chars(grid)
+    codes = CHAR_CODES[level_format.migrate_grid(grid)]
+    height, width = codes.shape
+    padded = np.full((height + 2, width + 2), WALL, dtype=np.uint8)
+    padded[1:-1, 1:-1] = codes
+
+    players = np.flatnonzero(padded == PLAYER)
+    if players.size == 0:
+        raise ValueError("Level has no player spawn ('P')")
+    padded.reshape(-1)[players[:-1]] = EMPTY
+    return padded
+
+
+def is_passable(codes, player=False):
+    """MovementHelper.IsTilePassable (player için coin / health de); küçük LUT gather'ından hızlı karşılaştırmalar"""
+    allowed = PLAYER_PASSABLE_CODES if player else PASSABLE_CODES
+    result = codes == allowed[0]
+    for code in allowed[1:]:
+        result |= codes == code
+    return result
+
+
+def select_u8(condition, a, b):
+    """np.where(condition, a, b) uint8 array'leri için bit maskesiyle (rastgele maskede dallanma yok)"""
+    mask = -condition.view(np.uint8)
+    return (a & mask) | (b & ~mask)
+
+
+# --------------------------
+# 2) BATCHED SİMÜLATÖR
+# --------------------------
+
+class TurnSimulator:
+    """
+    num_envs environment'ı aynı anda ilerleten tur simülatörü.
+    levels: char grid'leri ve / veya grid_engine.LevelGrid'ler. Player spawn'ı ('P') olmayan
+    level'lar uyarıyla atlanır (indeksleri skipped_levels'ta); environment i, kalan level'ların
+    i % len(...)'incisiyle başlar ve her reset'te aynı level'a döner.
+    Bütün level'lar en büyük boyuta duvarla doldurulur.
+
+    Bütün hücre referansları (player, düşman, bomba, dalga, mermi) tek flat kod array'ine
+    global indekslerdir (env * hücre sayısı + hücre); env başına değerler (E,),
+    düşman slotları slot-major (K, E) tutulur.
+
+    obs:  (num_envs, height + 2, width + 2) uint8 kod grid'i (iç array'in view'ı, step'te güncellenir)
+    """
+
+    def __init__(self, levels, num_envs, seed=None, max_turns=DEFAULT_MAX_TURNS, reward_weights=None):
+        padded, self.skipped_levels = [], []
+        for i, grid in enumerate(levels):
+            try:
+                padded.append(level_codes(grid))
+            except ValueError as e:
+                print(f"⚠️ Skipping level {i}: {e}")
+                self.skipped_levels.append(i)
+        if not padded:
+            raise ValueError("TurnSimulator needs at least one level with a player spawn")
+        self.height = max(codes.shape[0] for codes in padded)
+        self.width = max(codes.shape[1] for codes in padded)
+        self.num_envs = int(num_envs)
+        self.max_turns = int(max_turns)
+        self.reward_weights = dict(REWARD_WEIGHTS, **(reward_weights or {}))
+        self.rng = np.random.default_rng(seed)
+        self.delta = np.array([dy * self.width + dx for dx, dy in DIRECTIONS], dtype=np.int64)
+        self._build_level_tables(padded)
+
+        E, N, K = self.num_envs, self.height * self.width, self.unit_capacity
+        self.cells_per_env = N
+        self.base = np.arange(E, dtype=np.int64) * N
+        self.level_of = np.arange(E, dtype=np.int64) % len(padded)
+        stairs = self.level_stairs[self.level_of]
+        self.stairs_cell = np.where(stairs >= 0, self.base + stairs, -1)
+        self.codes = np.zeros((E, N), dtype=np.uint8)
+        self.flat = self.codes.reshape(-1)
+        self.turn = np.zeros(E, dtype=np.int64)
+
+        self.player_cell = np.zeros(E, dtype=np.int64)
+        self.player_hp = np.zeros(E, dtype=np.int16)
+        self.player_alive = np.zeros(E, dtype=bool)
+        self.player_dir = np.zeros(E, dtype=np.int64)
+        self.coins = np.zeros(E, dtype=np.int32)
+
+        self.unit_cell = np.zeros((K, E), dtype=np.int64)
+        self.unit_kind = np.zeros((K, E), dtype=np.uint8)
+        self.unit_alive = np.zeros((K, E), dtype=bool)
+        self.unit_hp = np.zeros((K, E), dtype=np.int16)
+        self.unit_shooter = np.zeros((K, E), dtype=bool)
+        self.unit_counter = np.zeros((K, E), dtype=np.uint8)
+        self.unit_facing = np.zeros((K, E), dtype=np.uint8)
+
+        self.bomb_cell = np.zeros((E, BOMB_CAPACITY), dtype=np.int64)
+        self.bomb_turn = np.zeros((E, BOMB_CAPACITY), dtype=np.int64)
+        self.bomb_alive = np.zeros((E, BOMB_CAPACITY), dtype=bool)
+
+        # Dalgalar FIFO: her dalga doğduktan sonraki ilk turda işlenip yok olur
+        self.wave_cell = np.zeros((E, WAVE_CAPACITY), dtype=np.int64)
+        self.wave_dir = np.zeros((E, WAVE_CAPACITY), dtype=np.int64)
+        self.wave_steps = np.zeros((E, WAVE_CAPACITY), dtype=np.int64)
+        self.wave_death = np.zeros((E, WAVE_CAPACITY), dtype=np.int64)
+        self.wave_head = np.zeros(E, dtype=np.int64)
+        self.wave_count = np.zeros(E, dtype=np.int64)
+
+        # Mermiler herhangi bir anda ölebilir: slot + doğum sırası (kayıt sırası)
+        P = self.shot_capacity
+        self.shot_cell = np.zeros((E, P), dtype=np.int64)
+        self.shot_dir = np.zeros((E, P), dtype=np.int64)
+        self.shot_first = np.zeros((E, P), dtype=bool)
+        self.shot_alive = np.zeros((E, P), dtype=bool)
+        self.shot_count = np.zeros(E, dtype=np.int64)
+        self.shot_seq = np.zeros((E, P), dtype=np.int64)
+        self.next_seq = np.zeros(E, dtype=np.int64)
+
+        self.events = {name: np.zeros(E, dtype=np.int32) for name in EVENT_NAMES}
+        self.episode_return = np.zeros(E, dtype=np.float64)
+
+    def _build_level_tables(self, padded):
+        """Level başına başlangıç durumu (kodlar, player, stairs, düşman slotları)"""
+        L, N = len(padded), self.height * self.width
+        self.level_codes = np.full((L, self.height, self.width), WALL, dtype=np.uint8)
+        for i, codes in enumerate(padded):
+            self.level_codes[i, :codes.shape[0], :codes.shape[1]] = codes
+        self.level_codes = self.level_codes.reshape(L, N)
+
+        units = [np.flatnonzero((codes == ENEMY) | (codes == SHOOTER)) for codes in self.level_codes]
+        shooters = max(int(np.count_nonzero(codes == SHOOTER)) for codes in self.level_codes)
+        self.unit_capacity = max(1, max(cells.size for cells in units))
+        # Mermi en fazla max(height, width) + 1 tur yaşar, atıcı 4 turda bir ateş eder
+        self.shot_capacity = max(1, shooters * ((max(self.height, self.width) + 1) // SHOOT_INTERVAL + 1))
+
+        self.level_player = np.array([np.flatnonzero(codes == PLAYER)[0] for codes in self.level_codes])
+        self.level_stairs = np.array([
+            stairs[0] if stairs.size else -1
+            for stairs in (np.flatnonzero(codes == STAIRS) for codes in self.level_codes)
+        ], dtype=np.int64)
+        self.level_unit_cell = np.full((L, self.unit_capacity), -1, dtype=np.int64)
+        self.level_unit_kind = np.zeros((L, self.unit_capacity), dtype=np.uint8)
+        for i, cells in enumerate(units):
+            # LevelLoader satır satır instantiate eder: kayıt sırası = flat hücre sırası
+            self.level_unit_cell[i, :cells.size] = cells
+            self.level_unit_kind[i, :cells.size] = self.level_codes[i, cells]
+
+    # --- Durum ---
+
+    @property
+    def obs(self):
+        return self.codes.reshape(self.num_envs, self.height, self.width)
+
+    def reset(self, envs=None):
+        """Verilen environment'ları (varsayılan: hepsi) level başına döndür"""
+        ev = np.arange(self.num_envs) if envs is None else np.asarray(envs, dtype=np.int64)
+        if ev.size == 0:
+            return self.obs
+        lv = self.level_of[ev]
+        base = self.base[ev]
+        self.codes[ev] = self.level_codes[lv]
+        self.turn[ev] = 0
+
+        self.player_cell[ev] = base + self.level_player[lv]
+        self.player_hp[ev] = PLAYER_MAX_HEALTH
+        self.player_alive[ev] = True
+        self.player_dir[ev] = UP - 1
+        self.coins[ev] = 0
+
+        unit_cells = self.level_unit_cell[lv].T
+        alive = unit_cells >= 0
+        self.unit_cell[:, ev] = np.where(alive, unit_cells + base, base)
+        self.unit_kind[:, ev] = self.level_unit_kind[lv].T
+        self.unit_shooter[:, ev] = self.unit_kind[:, ev] == SHOOTER
+        self.unit_alive[:, ev] = alive
+        self.unit_hp[:, ev] = ENEMY_HEALTH
+        self.unit_counter[:, ev] = 0
+        # EnemyShooterTile.Init: rastgele başlangıç yönü
+        self.unit_facing[:, ev] = self.rng.integers(0, 4, size=(self.unit_capacity, ev.size))
+
+        self.bomb_alive[ev] = False
+        self.wave_head[ev] = 0
+        self.wave_count[ev] = 0
+        self.shot_alive[ev] = False
+        self.shot_count[ev] = 0
+        self.next_seq[ev] = 0
+        self.episode_return[ev] = 0.0
+        return self.obs
+
+    def render(self, env=0):
+        """Tek environment'ın TurnManager debug haritası (kenar duvarı hariç)"""
+        codes = self.obs[env, 1:-1, 1:-1]
+        return ["".join(CODE_CHARS[code] for code in row) for row in codes.tolist()]
+
+    def _random_bytes(self, shape):
+        """Uniform uint8 çekimleri (bit generator'ın ham 64 bit çıktısından, rng.integers'tan hızlı)"""
+        count = int(np.prod(shape))
+        raw = self.rng.bit_generator.random_raw((count + 7) // 8)
+        return raw.view(np.uint8)[:count].reshape(shape)
+
+    # --- Kurallar ---
+
+    def _damage(self, ev, cells, by_player=False):
+        """IDamageable.TakeDamage(1): player, düşmanlar ve kırılabilir duvarlar (ev tekil)"""
+        code = self.flat[cells]
+
+        hit = code == PLAYER
+        if hit.any():
+            e = ev[hit]
+            self.player_hp[e] -= 1
+            self.events["damage"][e] += 1
+            dead = e[self.player_hp[e] <= 0]
+            self.player_hp[dead] = 0
+            self.flat[self.player_cell[dead]] = EMPTY
+            self.player_alive[dead] = False
+            self.events["death"][dead] += 1
+
+        hit = (code == ENEMY) | (code == SHOOTER)
+        if hit.any():
+            e, c = ev[hit], cells[hit]
+            # Hücredeki birimin slotu: aynı env'de o hücrede duran canlı slot
+            k = np.argmax(self.unit_alive[:, e] & (self.unit_cell[:, e] == c), axis=0)
+            self.unit_hp[k, e] -= 1
+            dead = self.unit_hp[k, e] <= 0
+            e, c, k = e[dead], c[dead], k[dead]
+            self.flat[c] = EMPTY
+            self.unit_alive[k, e] = False
+            if by_player:
+                self.events["kill"][e] += 1
+
+        hit = code == BREAKABLE
+        if hit.any():
+            self.flat[cells[hit]] = EMPTY
+
+    def _try_move(self, ev, src, dirs, mover_code, is_player=False, active=None):
+        """
+        MovementHelper.TryMove: hedef birimse saldırı (sadece player <-> düşman),
+        hedef ölürse üstüne yürünür; değilse geçilebilirlik, player için coin / health toplama.
+        active: verilirse sadece maskedeki satırlar hareket eder (bütün env'ler tek seferde)
+        Dönüş: (hareket eden satırların indeksleri, hedef hücreler)
+        """
+        tgt = src + self.delta.take(dirs)
+        code = self.flat[tgt]
+        hostile = ((code == ENEMY) | (code == SHOOTER)) if is_player else (code == PLAYER)
+        if active is not None:
+            hostile &= active
+        if hostile.any():
+            hit = np.flatnonzero(hostile)
+            self._damage(ev[hit], tgt[hit], by_player=is_player)
+            code = self.flat[tgt]
+
+        passable = is_passable(code, is_player)
+        if active is not None:
+            passable &= active
+        # Yoğun maskeler yerine indeks array'i (boolean indeksleme çok daha yavaş)
+        moved = np.flatnonzero(passable)
+        if is_player:
+            e, code = ev[moved], code[moved]
+            collected = e[code == COIN]
+            self.coins[collected] += 1
+            self.events["coin"][collected] += 1
+            healed = e[code == HEALTH]
+            self.player_hp[healed] = np.minimum(self.player_hp[healed] + HEAL_AMOUNT, PLAYER_MAX_HEALTH)
+            self.events["heal"][healed] += 1
+        self.flat[src[moved]] = EMPTY
+        self.flat[tgt[moved]] = mover_code[moved] if np.ndim(mover_code) else mover_code
+        return moved, tgt
+
+    def _shoot(self, ev, cells, dirs):
+        """EnemyShooterTile.Shoot: önü açıksa mermi, değilse öndeki nesneye hasar"""
+        tgt = cells + self.delta[dirs]
+        open_ = is_passable(self.flat[tgt])
+        if not open_.all():
+            self._damage(ev[~open_], tgt[~open_])
+        e, t, d = ev[open_], tgt[open_], dirs[open_]
+        if e.size == 0:
+            return
+        slot = np.argmin(self.shot_alive[e], axis=1)
+        self.shot_cell[e, slot] = t
+        self.shot_dir[e, slot] = d
+        self.shot_first[e, slot] = True
+        self.shot_alive[e, slot] = True
+        self.shot_count[e] += 1
+        self.shot_seq[e, slot] = self.next_seq[e]
+        self.next_seq[e] += 1
+        self.flat[t] = PROJECTILE
+
+    def _spawn_wave(self, ev, cells, dirs, steps, death):
+        """ExplosionWave.Spawn: menzil bittiyse hiçbir şey, geçilemez hücreye hasar, değilse dalga"""
+        live = steps > 0
+        ev, cells, dirs, steps, death = ev[live], cells[live], dirs[live], steps[live], death[live]
+        open_ = is_passable(self.flat[cells])
+        if not open_.all():
+            self._damage(ev[~open_], cells[~open_], by_player=True)
+        ev, cells = ev[open_], cells[open_]
+        if ev.size == 0:
+            return
+        slot = (self.wave_head[ev] + self.wave_count[ev]) % WAVE_CAPACITY
+        self.wave_cell[ev, slot] = cells
+        self.wave_dir[ev, slot] = dirs[open_]
+        self.wave_steps[ev, slot] = steps[open_]
+        self.wave_death[ev, slot] = death[open_]
+        self.wave_count[ev] += 1
+        self.flat[cells] = EXPLOSION
+
+    # --- Tur ---
+
+    def step(self, actions):
+        """
+        Bütün environment'ları bir tur ilerlet.
+        Dönüş: (obs, reward, done, info); biten environment'lar otomatik reset edilir,
+        info'daki episode_* alanları reset'ten önceki değerlerdir.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        E = self.num_envs
+        for counts in self.events.values():
+            counts[:] = 0
+        self.turn += 1
+
+        units_alive = self.unit_alive.copy()
+        # Tur başında var olan mermiler (bu tur atılanlar ilk turlarını bekler)
+        shot_envs = np.flatnonzero(self.shot_count)
+        shots_active = self.shot_alive[shot_envs]
+
+        # --- 1a. Enemy / shooter niyetleri (tek byte'tan: yön, %50 dönüş, yeni yön) ---
+        draws = self._random_bytes(units_alive.shape)
+        random_dir = draws & 3
+        turn_around = (draws & 4) != 0
+        new_facing = (draws >> 3) & 3
+
+        is_shooter = self.unit_shooter
+        shooters = units_alive & is_shooter
+        self.unit_counter += shooters
+        shoot = shooters & (self.unit_counter >= SHOOT_INTERVAL)
+        self.unit_counter *= ~shoot
+        turning = shooters & ~shoot & turn_around
+        self.unit_facing[:] = select_u8(turning, new_facing, self.unit_facing)
+        move_dir = select_u8(is_shooter, self.unit_facing, random_dir)
+        plan_move = units_alive & ~shoot
+
+        # Ateş etmek anında yan etki: env içinde kayıt sırasıyla (j. atıcılar bütün env'lerde birlikte)
+        if shoot.any():
+            rank = np.cumsum(shoot, axis=0, dtype=np.int8)
+            unit_cell, unit_facing = self.unit_cell.reshape(-1), self.unit_facing.reshape(-1)
+            for j in range(1, int(rank[-1].max()) + 1):
+                units = np.flatnonzero(shoot & (rank == j))
+                self._shoot(units % E, unit_cell[units], unit_facing[units])
+
+        # --- 1b. Patlama dalgaları (tur başında var olanlar, doğum sırasıyla) ---
+        wave_envs = np.flatnonzero(self.wave_count)
+        waves_start = self.wave_count[wave_envs]
+        for j in range(int(waves_start.max(initial=0))):
+            ev = wave_envs[waves_start > j]
+            slot = self.wave_head[ev]
+            self.wave_head[ev] = (slot + 1) % WAVE_CAPACITY
+            self.wave_count[ev] -= 1
+            cells = self.wave_cell[ev, slot]
+            live = self.turn[ev] < self.wave_death[ev, slot]
+            e, s = ev[live], slot[live]
+            dirs = self.wave_dir[e, s]
+            self._spawn_wave(e, cells[live] + self.delta[dirs], dirs, self.wave_steps[e, s] - 1,
+                             self.wave_death[e, s])
+            self.flat[cells] = EMPTY
+
+        # --- 1c. Bombalar (turda en fazla bir bomba patlar) ---
+        exploding = self.bomb_alive & (self.bomb_turn <= (self.turn - BOMB_FUSE_TURNS)[:, None])
+        ev, slot = np.divmod(np.flatnonzero(exploding), BOMB_CAPACITY)
+        if ev.size:
+            cells = self.bomb_cell[ev, slot]
+            death = self.turn[ev] + EXPLOSION_RANGE
+            steps = np.full(ev.size, EXPLOSION_RANGE - 1, dtype=np.int64)
+            for d in range(len(DIRECTIONS)):
+                self._spawn_wave(ev, cells + self.delta[d], np.full(ev.size, d, dtype=np.int64), steps, death)
+            self.flat[cells] = EMPTY
+            self.bomb_alive[ev, slot] = False
+
+        # --- 2a. Player eylemi ---
+        reached = np.zeros(E, dtype=bool)
+        ev = np.flatnonzero(self.player_alive & (actions >= UP) & (actions <= RIGHT))
+        if ev.size:
+            dirs = actions[ev] - UP
+            moved, tgt = self._try_move(ev, self.player_cell[ev], dirs, PLAYER, is_player=True)
+            e = ev[moved]
+            self.player_cell[e] = tgt[moved]
+            self.player_dir[e] = dirs[moved]
+            reached[e] = tgt[moved] == self.stairs_cell[e]
+
+        ev = np.flatnonzero(self.player_alive & (actions == PLACE_BOMB))
+        if ev.size:
+            tgt = self.player_cell[ev] + self.delta[self.player_dir[ev]]
+            placed = self.flat[tgt] == EMPTY
+            e, t = ev[placed], tgt[placed]
+            slot = np.argmin(self.bomb_alive[e], axis=1)
+            self.bomb_cell[e, slot] = t
+            self.bomb_turn[e, slot] = self.turn[e]
+            self.bomb_alive[e, slot] = True
+            self.flat[t] = BOMB
+
+        # --- 2b. Enemy / shooter hareketleri (ölenler tileObjects kontrolüne takılır) ---
+        all_envs = np.arange(E)
+        for k in range(self.unit_capacity):
+            active = plan_move[k] & self.unit_alive[k]
+            count = np.count_nonzero(active)
+            if count == 0:
+                continue
+            if count * SPARSE_SLOT_RATIO < E:
+                # Seyrek slot: sadece aktif env'ler
+                ev = np.flatnonzero(active)
+                moved, tgt = self._try_move(ev, self.unit_cell[k, ev], move_dir[k, ev], self.unit_kind[k, ev])
+                self.unit_cell[k, ev[moved]] = tgt[moved]
+                continue
+            src = self.unit_cell[k]
+            moved, tgt = self._try_move(all_envs, src, move_dir[k], self.unit_kind[k], active=active)
+            src[moved] = tgt[moved]
+
+        # --- 2c. Mermi hareketleri (ilk tur bekler, engelde yok olur) ---
+        if shot_envs.size:
+            shot_count = np.count_nonzero(shots_active, axis=1)
+            order = np.argsort(np.where(shots_active, self.shot_seq[shot_envs], np.iinfo(np.int64).max), axis=1,
+                               kind="stable")
+            for j in range(int(shot_count.max())):
+                rows = np.flatnonzero(shot_count > j)
+                ev = shot_envs[rows]
+                slot = order[rows, j]
+                first = self.shot_first[ev, slot]
+                self.shot_first[ev[first], slot[first]] = False
+                e, s = ev[~first], slot[~first]
+                if e.size == 0:
+                    continue
+                src = self.shot_cell[e, s]
+                moved, tgt = self._try_move(e, src, self.shot_dir[e, s], PROJECTILE)
+                self.shot_cell[e[moved], s[moved]] = tgt[moved]
+                blocked = np.ones(e.size, dtype=bool)
+                blocked[moved] = False
+                self.flat[src[blocked]] = EMPTY
+                self.shot_alive[e[blocked], s[blocked]] = False
+                self.shot_count[e[blocked]] -= 1
+
+        # --- Ödül / bitiş ---
+        self.events["stairs"][reached] += 1
+        weights = self.reward_weights
+        reward = np.full(E, weights["turn"], dtype=np.float64)
+        for name in EVENT_NAMES:
+            reward += weights[name] * self.events[name]
+        self.episode_return += reward
+
+        truncated = self.turn >= self.max_turns
+        done = ~self.player_alive | reached | truncated
+        info = {
+            "events": {name: counts.copy() for name, counts in self.events.items()},
+            "truncated": truncated & self.player_alive & ~reached,
+            "episode_turns": np.where(done, self.turn, 0),
+            "episode_coins": np.where(done, self.coins, 0),
+            "episode_return": np.where(done, self.episode_return, 0.0),
+        }
+        self.reset(np.flatnonzero(done))
+        return self.obs, reward, done, info
+
+
+def random_rollout(sim, steps, seed=None):
+    """Rastgele policy ile steps tur; (env-step/s, biten episode sayısı)"""
+    rng = np.random.default_rng(seed)
+    actions = rng.integers(0, ACTION_COUNT, size=(steps, sim.num_envs))
+    episodes = 0
+    start = time.perf_counter()
+    for t in range(steps):
+        _, _, done, _ = sim.step(actions[t])
+        episodes += int(np.count_nonzero(done))
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    return steps * sim.num_envs / elapsed, episodes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batched headless turn simulator (random-policy throughput)")
+    parser.add_argument("source", nargs="?", default=None,
+                        help="Level klasörü / INI / DATASET / .blp (boşsa grid_engine ile üretilir)")
+    parser.add_argument("--envs", type=int, default=4096, help="Aynı anda ilerletilen environment sayısı")
+    parser.add_argument("--steps", type=int, default=500, help="Tur sayısı")
+    parser.add_argument("--levels", type=int, default=64, help="source yoksa üretilecek level sayısı")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS)
+    args = parser.parse_args(argv)
+
+    if args.source:
+        levels = load_levels(args.source)
+    else:
+        params = dict(grid_engine.DEFAULT_PARAMS, enemy_density=0.5)
+        levels = [grid_engine.generate_level(dict(params, seed=args.seed + i)) for i in range(args.levels)]
+
+    sim = TurnSimulator(levels, args.envs, seed=args.seed, max_turns=args.max_turns)
+    sim.reset()
+    print(f"🎮 {len(levels) - len(sim.skipped_levels)} levels, {args.envs} envs, "
+          f"grid {sim.height - 2}x{sim.width - 2}, {sim.unit_capacity} unit slots, {sim.shot_capacity} projectile slots")
+    rate, episodes = random_rollout(sim, args.steps, args.seed)
+    print(f"✅ {args.steps * args.envs} env-steps: {rate:,.0f} steps/s, {episodes} episodes finished")
+
+
+if __name__ == "__main__":
+    main()